@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Entity Memory Benchmark v1.0
+
+엔티티 1개당 메모리 사용량을 비교합니다.
+- legacy: {"filepath": Path, "relative_path": str, "frontmatter": dict} (기존 스크립트 형식)
+- Entity: shared.vault.Entity (__slots__, intern, lazy frontmatter)
+
+실제 vault의 frontmatter를 템플릿으로 N개(기본 10k, 100k)의 엔티티를 만듭니다.
+각 엔티티의 frontmatter는 pickle 왕복으로 새 객체를 만들어 파일별 YAML 파싱 결과처럼
+문자열/리스트를 공유하지 않게 합니다. 측정은 tracemalloc 기준입니다.
+
+Usage:
+    python3 scripts/bench_entity_memory.py [vault_path] [--sizes 10000,100000]
+"""
+
+import gc
+import pickle
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import Entity, VaultScanner
+
+
+def load_templates(vault_root: Path) -> List[Tuple[str, bytes]]:
+    """(relative_path, pickle된 frontmatter) 목록"""
+    collection = VaultScanner(vault_root).scan()
+    return [
+        (vf.relative_path, pickle.dumps(vf.frontmatter))
+        for vf in collection.select(prefix=collection.config.include_paths, require_id=True)
+    ]
+
+
+def fresh_frontmatter(templates: List[Tuple[str, bytes]], i: int) -> Tuple[str, dict]:
+    """i번째 엔티티 (고유 entity_id / 경로, 새 객체)"""
+    relative, blob = templates[i % len(templates)]
+    fm = pickle.loads(blob)
+    fm["entity_id"] = f"{fm['entity_id']}-{i}"
+    return f"{relative[:-3]}-{i}.md", fm
+
+
+def build_legacy(vault_root: Path, templates, n: int) -> list:
+    result = []
+    for i in range(n):
+        relative, fm = fresh_frontmatter(templates, i)
+        result.append({"filepath": vault_root / relative, "relative_path": relative, "frontmatter": fm})
+    return result
+
+
+def build_entities(vault_root: Path, templates, n: int) -> list:
+    return [
+        Entity.from_frontmatter(fm, relative, vault_root)
+        for relative, fm in (fresh_frontmatter(templates, i) for i in range(n))
+    ]
+
+
+def measure(builder: Callable, vault_root: Path, templates, n: int) -> int:
+    """builder 결과가 유지하는 메모리 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    items = builder(vault_root, templates, n)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del items
+    return used
+
+
+def main(vault_path: str, sizes: List[int]) -> int:
+    """메인 함수"""
+    vault_root = Path(vault_path).resolve()
+
+    if not vault_root.exists():
+        print(f"Error: Vault path does not exist: {vault_root}")
+        return 1
+
+    templates = load_templates(vault_root)
+    print(f"Templates: {len(templates)} entities from {vault_root.name}")
+
+    print(f"\n=== Entity Memory Benchmark ===")
+    print(f"{'N':>8}  {'legacy dict':>16}  {'Entity':>16}  {'per entity':>22}  {'ratio':>6}")
+    for n in sizes:
+        legacy = measure(build_legacy, vault_root, templates, n)
+        compact = measure(build_entities, vault_root, templates, n)
+        print(
+            f"{n:>8}  {legacy / 1e6:>13.1f} MB  {compact / 1e6:>13.1f} MB  "
+            f"{legacy / n:>8.0f} B → {compact / n:>6.0f} B  {legacy / compact:>5.1f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sizes = [10_000, 100_000]
+    if "--sizes" in args:
+        idx = args.index("--sizes")
+        sizes = [int(s) for s in args[idx + 1].split(",")]
+        del args[idx:idx + 2]
+    vault_path = args[0] if args else "."
+    sys.exit(main(vault_path, sizes))
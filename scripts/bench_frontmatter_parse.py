@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Frontmatter Parse Benchmark v1.0
+
+실제 vault의 frontmatter 헤더로 yaml.SafeLoader(순수 Python)와
+shared.utils.yaml_parser.safe_load(libyaml CSafeLoader) 파싱 속도를 비교합니다.
+두 로더의 결과가 모든 파일에서 동일한지도 함께 검증합니다.
+
+Usage:
+    python3 scripts/bench_frontmatter_parse.py [vault_path] [--repeat N]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.utils.frontmatter_reader import read_frontmatter_header
+from shared.utils.yaml_parser import LIBYAML_AVAILABLE, YAMLError, pure_safe_load, safe_load
+from shared.vault import VaultScanner
+
+
+def load_headers(vault_root: Path) -> List[Tuple[str, str]]:
+    """include 경로의 (relative_path, 헤더 텍스트) 목록"""
+    scanner = VaultScanner(vault_root, use_cache=False)
+    headers = []
+    for filepath in scanner.iter_paths():
+        try:
+            header = read_frontmatter_header(filepath)
+        except Exception:
+            continue
+        if header is not None:
+            headers.append((str(filepath.relative_to(vault_root)), header.text))
+    return headers
+
+
+def parse_all(loader: Callable, headers: List[Tuple[str, str]]) -> list:
+    """모든 헤더 파싱 (오류는 예외 타입 이름으로 기록)"""
+    results = []
+    for _, text in headers:
+        try:
+            results.append(loader(text))
+        except YAMLError as e:
+            results.append(("error", type(e).__name__, str(e)))
+    return results
+
+
+def time_loader(loader: Callable, headers: List[Tuple[str, str]], repeat: int) -> float:
+    """repeat회 중 최소 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_all(loader, headers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(vault_path: str, repeat: int = 5) -> int:
+    """메인 함수"""
+    vault_root = Path(vault_path).resolve()
+
+    if not vault_root.exists():
+        print(f"Error: Vault path does not exist: {vault_root}")
+        return 1
+
+    print("Reading frontmatter headers...")
+    headers = load_headers(vault_root)
+    total_bytes = sum(len(text.encode("utf-8")) for _, text in headers)
+    print(f"Found {len(headers)} headers ({total_bytes / 1024:.0f} KB)")
+    print(f"libyaml available: {LIBYAML_AVAILABLE}")
+
+    # 결과 동일성 검증
+    print("\nVerifying identical results...")
+    pure_results = parse_all(pure_safe_load, headers)
+    fast_results = parse_all(safe_load, headers)
+    mismatches = [
+        headers[i][0] for i, (a, b) in enumerate(zip(pure_results, fast_results)) if a != b
+    ]
+    if mismatches:
+        print(f"❌ {len(mismatches)} files differ:")
+        for path in mismatches[:20]:
+            print(f"  - {path}")
+        return 1
+    print(f"✅ {len(headers)} files parsed identically")
+
+    print(f"\nBenchmarking (best of {repeat})...")
+    pure_time = time_loader(pure_safe_load, headers, repeat)
+    fast_time = time_loader(safe_load, headers, repeat)
+
+    print(f"\n=== Frontmatter Parse Benchmark ===")
+    print(f"yaml.SafeLoader (pure Python): {pure_time * 1000:8.1f} ms  ({pure_time / len(headers) * 1e6:.0f} µs/file)")
+    print(f"yaml_parser.safe_load:         {fast_time * 1000:8.1f} ms  ({fast_time / len(headers) * 1e6:.0f} µs/file)")
+    print(f"Speedup: {pure_time / fast_time:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeat = 5
+    if "--repeat" in args:
+        idx = args.index("--repeat")
+        repeat = int(args[idx + 1])
+        del args[idx:idx + 2]
+    vault_path = args[0] if args else "."
+    sys.exit(main(vault_path, repeat))
@@ -1,8 +1,30 @@
 #!/usr/bin/env python3
 """
-LOOP Vault Graph Index Builder v7.0
+LOOP Vault Graph Index Builder v7.3
 _Graph_Index.md, _build/graph.json을 자동 생성합니다.
 
+변경사항 (v7.3):
+- --incremental 옵션: 이전 graph.json + entities.snap 대비 변경된 엔티티의 노드/에지/인덱스만 패치
+  (graph.json만 해당, _Graph_Index.md와 entities.snap/graph.csr/hierarchy.json은 매번 전체 생성)
+- --verify 옵션: incremental 결과를 전체 재생성과 비교 (다르면 exit 1)
+- --minify / --shards / --precompress 출력 모드 (공백 제거, 타입별 shard + manifest, .gz/.br)
+- _build/graph.csr edge type별 forward/reverse CSR 인접 인덱스 (shared.vault.load_adjacency로 조회)
+- _build/hierarchy.json parent 계층 pre-order 구간 라벨, 순환/다중 부모/없는 부모 보고
+- 타임스탬프(updated, generated) 외 변경이 없으면 _Graph_Index.md, _build 산출물을 다시 쓰지 않음
+- graph.json edges를 shared.vault.relations registry로 엔티티당 1회 순회해 생성 (중복/null target 에지 제거)
+- graph.json을 chunk 단위로 비교/저장 (shared.utils.json_stream, 직렬화된 문서 전체를 메모리에 만들지 않음)
+- _build/graph.json.idx 노드/섹션 byte offset sidecar (shared.vault.GraphReader로 부분 조회)
+
+변경사항 (v7.2):
+- --jobs N 옵션: frontmatter 파싱을 N개 프로세스로 분산 (출력은 worker 수와 무관하게 동일)
+- --change-detect git 옵션: git index blob SHA 기반 캐시 재사용
+- 엔티티를 shared.vault.Entity (__slots__)로 처리 (frontmatter dict 복사 제거)
+- _build/entities.snap 바이너리 스냅샷 생성 (shared.vault.snapshot.load_snapshot으로 로드)
+
+변경사항 (v7.1):
+- shared.vault 스캐너로 엔티티 수집 (rglob + YAML 파싱 중복 제거)
+- frontmatter 캐시 (_build/.fm_cache.sqlite), --no-cache 옵션
+
 변경사항 (v7.0):
 - 폴더별 _INDEX.md 생성 로직 제거 (tsk-vault-gpt-11)
 - _INDEX.md는 /api/mcp/folder-contents API로 대체
@@ -20,11 +42,25 @@ import os
 import re
 import sys
 import json
+import heapq
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 from collections import defaultdict
+from operator import attrgetter
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import Entity, EntityCollection, ScanConfig, VaultScanner
+from shared.utils.artifact import GENERATED_JSON_STAMP, write_bytes_if_changed, write_stamped
+from shared.utils.json_stream import iter_json_bytes
+from shared.utils.precompress import BROTLI_AVAILABLE, remove_precompressed, write_precompressed
+from shared.vault.adjacency import ADJACENCY_FILENAME, AdjacencyError, write_adjacency
+from shared.vault.graph_reader import offsets_path_for, write_graph_offsets
+from shared.vault.relations import EdgePatchError, extract_edges, patch_edges, relation_fields
+from shared.vault.hierarchy import HIERARCHY_FILENAME, HierarchyIndex, build_hierarchy, write_hierarchy
+from shared.vault.snapshot import SNAPSHOT_FILENAME, SnapshotError, entity_signature, load_snapshot, write_snapshot
 
 # ============================================
 # Constants - loaded from 00_Meta/schema_constants.yaml at runtime
@@ -74,90 +110,72 @@ def _init_constants(vault_root: Path) -> None:
 # _INDEX.md generation is now handled by /api/mcp/folder-contents API (tsk-vault-gpt-11)
 
 
-def extract_frontmatter(content: str) -> Optional[Dict]:
-    """마크다운에서 YAML frontmatter 추출"""
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1))
-        except yaml.YAMLError:
-            return None
-    return None
-
-
-def collect_entities(vault_root: Path) -> Dict[str, Dict]:
-    """모든 엔티티 수집"""
-    entities = {}
-
-    for filepath in vault_root.rglob("*.md"):
-        relative = str(filepath.relative_to(vault_root))
+def collect_entities(vault_root: Path, collection: Optional[EntityCollection] = None) -> Dict[str, Entity]:
+    """모든 엔티티 수집
 
-        should_include = any(relative.startswith(inc) for inc in INCLUDE_PATHS)
-        if not should_include:
-            continue
+    collection이 주어지면 (vault_precommit.py 등) 재스캔 없이 그대로 사용합니다.
+    """
+    if collection is None:
+        collection = VaultScanner(vault_root, ScanConfig(include_paths=INCLUDE_PATHS)).scan()
 
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception:
-            continue
-
-        frontmatter = extract_frontmatter(content)
-        if frontmatter and "entity_id" in frontmatter:
-            entity_id = frontmatter["entity_id"]
-            entities[entity_id] = {
-                "filepath": filepath,
-                "relative_path": relative,
-                "frontmatter": frontmatter
-            }
+    # frontmatter 키를 읽는 관계가 등록돼 있으면 원본 dict 보관 (엔티티마다 파일을 다시 읽지 않음)
+    return collection.entity_map(prefix=INCLUDE_PATHS, keep_frontmatter=bool(relation_fields()))
 
-    return entities
 
-
-def derive_children(entities: Dict[str, Dict]) -> Dict[str, List[str]]:
+def derive_children(entities: Dict[str, Entity]) -> Dict[str, List[str]]:
     """parent_id에서 children_ids 파생"""
     children_map = defaultdict(list)
 
-    for entity_id, data in entities.items():
-        parent_id = data["frontmatter"].get("parent_id")
+    for entity_id, entity in entities.items():
+        parent_id = entity.parent_id
         if parent_id:
             children_map[parent_id].append(entity_id)
 
     return dict(children_map)
 
 
-def derive_incoming_relations(entities: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+def derive_incoming_relations(entities: Dict[str, Entity]) -> Dict[str, List[Dict]]:
     """outgoing_relations에서 incoming_relations 파생"""
     incoming_map = defaultdict(list)
 
-    for entity_id, data in entities.items():
-        relations = data["frontmatter"].get("outgoing_relations", [])
-        if isinstance(relations, list):
-            for rel in relations:
-                if isinstance(rel, dict):
-                    target_id = rel.get("target_id")
-                    if target_id:
-                        incoming_map[target_id].append({
-                            "type": rel.get("type"),
-                            "source_id": entity_id
-                        })
+    for entity_id, entity in entities.items():
+        relations = entity.outgoing_relations
+        if isinstance(relations, tuple):
+            for rel_type, target_id in relations:
+                if isinstance(target_id, str) and target_id:
+                    incoming_map[target_id].append({
+                        "type": rel_type,
+                        "source_id": entity_id
+                    })
 
     return dict(incoming_map)
 
 
-def generate_index(entities: Dict[str, Dict], children_map: Dict, incoming_map: Dict, vault_root: Path) -> str:
-    """그래프 인덱스 마크다운 생성"""
-    now = datetime.now().strftime("%Y-%m-%d")
+def generate_index(
+    entities: Dict[str, Entity],
+    children_map: Dict,
+    incoming_map: Dict,
+    vault_root: Path,
+    now: Optional[str] = None,
+) -> str:
+    """그래프 인덱스 마크다운 생성
+
+    Args:
+        now: created/updated 날짜 (기본: 오늘, 변경 여부 비교 시 이전 파일의 날짜)
+    """
+    if now is None:
+        now = datetime.now().strftime("%Y-%m-%d")
 
     # 엔티티 타입별 분류
     by_type = defaultdict(list)
-    for entity_id, data in entities.items():
-        entity_type = data["frontmatter"].get("entity_type", "Unknown")
-        by_type[entity_type].append((entity_id, data))
+    for entity_id, entity in entities.items():
+        entity_type = "Unknown" if entity.type is None else entity.type
+        by_type[entity_type].append((entity_id, entity))
 
     # 상태별 카운트
     status_count = defaultdict(int)
-    for entity_id, data in entities.items():
-        status = data["frontmatter"].get("status", "unknown")
+    for entity in entities.values():
+        status = "unknown" if entity.status is None else entity.status
         status_count[status] += 1
 
     lines = [
@@ -222,11 +240,10 @@ def generate_index(entities: Dict[str, Dict], children_map: Dict, incoming_map:
             "|----|------|--------|------|",
         ])
 
-        for entity_id, data in sorted(type_entities):
-            fm = data["frontmatter"]
-            name = fm.get("entity_name", "")
-            status = fm.get("status", "")
-            path = data["relative_path"]
+        for entity_id, entity in sorted(type_entities, key=lambda item: item[0]):
+            name = "" if entity.name is None else entity.name
+            status = "" if entity.status is None else entity.status
+            path = entity.relative_path
             lines.append(f"| `{entity_id}` | {name} | {status} | `{path}` |")
 
         lines.extend(["", ""])
@@ -243,11 +260,11 @@ def generate_index(entities: Dict[str, Dict], children_map: Dict, incoming_map:
 
     for parent_id, children in sorted(children_map.items()):
         if parent_id in entities:
-            parent_name = entities[parent_id]["frontmatter"].get("entity_name", parent_id)
+            parent_name = _name_or(entities[parent_id], parent_id)
             lines.append(f"- **{parent_id}** ({parent_name})")
             for child_id in sorted(children):
                 if child_id in entities:
-                    child_name = entities[child_id]["frontmatter"].get("entity_name", child_id)
+                    child_name = _name_or(entities[child_id], child_id)
                     lines.append(f"  - {child_id} ({child_name})")
 
     lines.extend([
@@ -260,16 +277,16 @@ def generate_index(entities: Dict[str, Dict], children_map: Dict, incoming_map:
 
     # Critical 엔티티 목록
     critical_entities = [
-        (eid, data) for eid, data in entities.items()
-        if data["frontmatter"].get("priority_flag") == "critical"
+        (eid, entity) for eid, entity in entities.items()
+        if entity.priority_flag == "critical"
     ]
 
     if critical_entities:
         lines.append("### Critical 엔티티")
         lines.append("")
-        for entity_id, data in critical_entities:
-            name = data["frontmatter"].get("entity_name", "")
-            status = data["frontmatter"].get("status", "")
+        for entity_id, entity in critical_entities:
+            name = "" if entity.name is None else entity.name
+            status = "" if entity.status is None else entity.status
             lines.append(f"- **{entity_id}**: {name} (status: {status})")
     else:
         lines.append("Critical 엔티티 없음")
@@ -285,7 +302,48 @@ def generate_index(entities: Dict[str, Dict], children_map: Dict, incoming_map:
     return "\n".join(lines)
 
 
-def generate_json_index(entities: Dict[str, Dict], children_map: Dict, incoming_map: Dict) -> Dict:
+def _name_or(entity: Entity, default: str) -> str:
+    """entity_name (없으면 default)"""
+    return default if entity.name is None else entity.name
+
+
+def _json_node(entity_id: str, entity: Entity) -> Dict:
+    """graph.json 노드"""
+    node = {
+        "id": entity_id,
+        "type": entity.type,
+        "name": entity.name,
+        "status": entity.status,
+        "path": entity.relative_path,
+    }
+
+    # 추가 메타데이터 (tuple은 JSON 배열로 출력)
+    if entity.conditions_3y:
+        node["conditions_3y"] = entity.conditions_3y
+    if entity.priority_flag:
+        node["priority_flag"] = entity.priority_flag
+    if entity.assignee:
+        node["assignee"] = entity.assignee
+    if entity.owner:
+        node["owner"] = entity.owner
+
+    return node
+
+
+def _type_key(entity: Entity) -> str:
+    return "Unknown" if entity.type is None else entity.type
+
+
+def _status_key(entity: Entity) -> str:
+    return "unknown" if entity.status is None else entity.status
+
+
+def _condition_keys(entity: Entity) -> tuple:
+    conditions = entity.conditions_3y
+    return conditions if isinstance(conditions, tuple) else ()
+
+
+def generate_json_index(entities: Dict[str, Entity], children_map: Dict, incoming_map: Dict) -> Dict:
     """LLM 최적화된 JSON 그래프 인덱스 생성"""
     now = datetime.now().isoformat()
 
@@ -300,102 +358,414 @@ def generate_json_index(entities: Dict[str, Dict], children_map: Dict, incoming_
     }
 
     # 노드 생성
-    for entity_id, data in entities.items():
-        fm = data["frontmatter"]
-        node = {
-            "id": entity_id,
-            "type": fm.get("entity_type"),
-            "name": fm.get("entity_name"),
-            "status": fm.get("status"),
-            "path": data["relative_path"],
-        }
-
-        # 추가 메타데이터
-        if fm.get("conditions_3y"):
-            node["conditions_3y"] = fm.get("conditions_3y")
-        if fm.get("priority_flag"):
-            node["priority_flag"] = fm.get("priority_flag")
-        if fm.get("assignee"):
-            node["assignee"] = fm.get("assignee")
-        if fm.get("owner"):
-            node["owner"] = fm.get("owner")
-
-        graph["nodes"].append(node)
+    for entity_id, entity in entities.items():
+        graph["nodes"].append(_json_node(entity_id, entity))
 
         # 타입별 인덱스
-        entity_type = fm.get("entity_type", "Unknown")
+        entity_type = _type_key(entity)
         if entity_type not in graph["by_type"]:
             graph["by_type"][entity_type] = []
         graph["by_type"][entity_type].append(entity_id)
 
         # 상태별 인덱스
-        status = fm.get("status", "unknown")
+        status = _status_key(entity)
         if status not in graph["by_status"]:
             graph["by_status"][status] = []
         graph["by_status"][status].append(entity_id)
 
         # conditions_3y 인덱스 구축
-        conditions = fm.get("conditions_3y", [])
-        if isinstance(conditions, list):
-            for cond in conditions:
-                if cond not in graph["conditions_3y_index"]:
-                    graph["conditions_3y_index"][cond] = []
-                graph["conditions_3y_index"][cond].append(entity_id)
-
-    # 에지 생성 (parent-child)
-    for parent_id, children in children_map.items():
-        for child_id in children:
-            graph["edges"].append({
-                "source": parent_id,
-                "target": child_id,
-                "type": "parent_of"
-            })
-
-    # 에지 생성 (outgoing_relations)
-    for entity_id, data in entities.items():
-        relations = data["frontmatter"].get("outgoing_relations", [])
-        if isinstance(relations, list):
-            for rel in relations:
-                if isinstance(rel, dict):
-                    graph["edges"].append({
-                        "source": entity_id,
-                        "target": rel.get("target_id"),
-                        "type": rel.get("type")
-                    })
+        for cond in _condition_keys(entity):
+            if cond not in graph["conditions_3y_index"]:
+                graph["conditions_3y_index"][cond] = []
+            graph["conditions_3y_index"][cond].append(entity_id)
 
-    # 에지 생성 (validates - Project → Hypothesis/MH)
-    for entity_id, data in entities.items():
-        validates = data["frontmatter"].get("validates", [])
-        if isinstance(validates, list):
-            for target_id in validates:
-                if target_id:  # null/빈값 무시
-                    graph["edges"].append({
-                        "source": entity_id,
-                        "target": target_id,
-                        "type": "validates"
-                    })
+    # 에지 생성 (relation registry, 엔티티당 1회 순회 + 중복 제거)
+    graph["edges"] = extract_edges(entities)
 
-    # 에지 생성 (validated_by - Hypothesis → Project, 역방향)
-    for entity_id, data in entities.items():
-        validated_by = data["frontmatter"].get("validated_by", [])
-        if isinstance(validated_by, list):
-            for source_id in validated_by:
-                if source_id:  # null/빈값 무시
-                    graph["edges"].append({
-                        "source": source_id,
-                        "target": entity_id,
-                        "type": "validates"
-                    })
+    return graph
+
+
+# ============================================
+# Incremental graph.json patch (--incremental)
+# ============================================
 
+class GraphPatchError(Exception):
+    """이전 graph.json/스냅샷으로 패치할 수 없음 (전체 재생성으로 fallback)"""
+
+
+def _json_key(value) -> str:
+    """json.dump이 dict key로 쓰는 문자열 (int/None/bool key 정규화)"""
+    if isinstance(value, str):
+        return value
+    return next(iter(json.loads(json.dumps({value: None}))))
+
+
+# graph.json에 영향을 주는 Entity 필드
+_graph_values = attrgetter(
+    "type", "name", "status", "relative_path", "parent_id", "owner", "priority_flag",
+    "assignee", "conditions_3y", "validates", "validated_by", "outgoing_relations",
+)
+
+
+def _graph_changed(previous: Entity, current: Entity) -> bool:
+    """스냅샷 엔티티 대비 graph.json 기여분 변경 여부
+
+    대부분 값이 이미 같은 문자열/tuple이므로 먼저 그대로 비교하고,
+    다를 때만 정규화(entity_signature)해서 다시 비교합니다.
+    """
+    if _graph_values(previous) == _graph_values(current):
+        return False
+    return entity_signature(previous) != entity_signature(current)
+
+
+def _patch_index(
+    index: Dict[str, List[str]],
+    removals: Dict[str, Set[str]],
+    additions: Dict[str, List[str]],
+    rank: Dict[str, int],
+) -> Dict[str, List[str]]:
+    """by_type/by_status/conditions_3y_index 패치
+
+    key 순서는 전체 빌드와 같이 첫 엔티티 순 (각 리스트는 엔티티 순서로 정렬되어 있음).
+    """
+    for key, ids in removals.items():
+        if key in index:
+            index[key] = [eid for eid in index[key] if eid not in ids]
+        else:
+            # 스냅샷 문자열과 JSON key가 다른 경우 (예: None → "null") 전체 리스트에서 제거
+            for other in index:
+                index[other] = [eid for eid in index[other] if eid not in ids]
+    for key, ids in additions.items():
+        index[key] = list(heapq.merge(index.get(key, []), ids, key=rank.__getitem__))
+    return dict(sorted(
+        ((key, ids) for key, ids in index.items() if ids),
+        key=lambda item: rank[item[1][0]],
+    ))
+
+
+def patch_json_index(
+    previous_graph: Dict,
+    previous_entities: Dict[str, Entity],
+    entities: Dict[str, Entity],
+) -> Dict:
+    """이전 graph.json을 변경된 엔티티의 기여분만 다시 계산해 패치
+
+    이전 빌드의 _build/entities.snap 대비 graph 필드가 바뀐 엔티티
+    (추가/삭제 포함)만 노드, by_type/by_status/conditions_3y_index에서 빼고 다시 넣습니다.
+    변경 없는 엔티티의 기여분은 이전 graph.json 객체를 그대로 재사용하고, 순서는 전체
+    빌드와 같은 엔티티 순서(rank)로 병합합니다. edges는 변경된 엔티티의 이전/현재 기여만
+    relation registry로 추출하고, 중복 제거는 에지별 기여 수로 판단합니다 (patch_edges).
+
+    스냅샷은 값을 문자열로 정규화하므로 타입만 바뀐 값(2025 → "2025")은 변경으로 보지 않습니다.
+    --verify로 전체 재생성과 비교할 수 있습니다.
+
+    Args:
+        previous_graph: 이전 graph.json (json.load 결과, 패치 중 변경됨)
+        previous_entities: 같은 빌드에서 쓴 스냅샷 엔티티 (load_snapshot().entities)
+        entities: 현재 엔티티
+
+    Returns:
+        패치된 graph (generated 갱신)
+
+    Raises:
+        GraphPatchError: 이전 graph.json과 스냅샷이 맞지 않거나 엔티티 순서가 바뀐 경우
+            (edges 부분 갱신 불가 포함)
+    """
+    nodes = previous_graph.get("nodes")
+    edges = previous_graph.get("edges")
+    if not isinstance(nodes, list) or not isinstance(edges, list):
+        raise GraphPatchError("previous graph.json has no nodes/edges")
+    if [node.get("id") for node in nodes] != list(previous_entities):
+        raise GraphPatchError("previous graph.json does not match entities.snap")
+
+    rank = {entity_id: i for i, entity_id in enumerate(entities)}
+    dirty = {
+        entity_id for entity_id, entity in entities.items()
+        if entity_id not in previous_entities
+        or _graph_changed(previous_entities[entity_id], entity)
+    }
+    removed = previous_entities.keys() - entities.keys()
+    dirty |= removed
+    changed = sorted(dirty - removed, key=rank.__getitem__)
+
+    # 노드 (변경 없는 노드가 현재 순서와 어긋나면 패치 불가: 중복 ID 위치 변경 등)
+    kept_nodes = [node for node in nodes if node["id"] not in dirty]
+    kept_ranks = [rank[node["id"]] for node in kept_nodes]
+    if any(a > b for a, b in zip(kept_ranks, kept_ranks[1:])):
+        raise GraphPatchError("entity order changed")
+    new_nodes = [_json_node(entity_id, entities[entity_id]) for entity_id in changed]
+    patched_nodes = list(heapq.merge(kept_nodes, new_nodes, key=lambda node: rank[node["id"]]))
+
+    # 에지 (변경된 엔티티의 기여만 registry로 추출, 기여 수 0이 된 에지 제거)
+    try:
+        patched_edges = patch_edges(edges, previous_entities, entities, dirty)
+    except EdgePatchError as e:
+        raise GraphPatchError(str(e)) from e
+
+    # 보조 인덱스
+    index_keys = (
+        ("by_type", lambda e: (_type_key(e),)),
+        ("by_status", lambda e: (_status_key(e),)),
+        ("conditions_3y_index", _condition_keys),
+    )
+    patched_indexes = {}
+    for name, keys_of in index_keys:
+        removals: Dict[str, Set[str]] = defaultdict(set)
+        for entity_id in dirty:
+            if entity_id in previous_entities:
+                for key in keys_of(previous_entities[entity_id]):
+                    removals[key].add(entity_id)
+        additions: Dict[str, List[str]] = defaultdict(list)
+        for entity_id in changed:
+            for key in keys_of(entities[entity_id]):
+                additions[_json_key(key)].append(entity_id)
+        patched_indexes[name] = _patch_index(previous_graph.get(name, {}), removals, additions, rank)
+
+    graph = {
+        "generated": datetime.now().isoformat(),
+        "total_entities": len(entities),
+        "nodes": patched_nodes,
+        "edges": patched_edges,
+        "conditions_3y_index": patched_indexes["conditions_3y_index"],
+        "by_type": patched_indexes["by_type"],
+        "by_status": patched_indexes["by_status"],
+    }
+    print(f"  Patched {len(changed)} changed/added, {len(removed)} removed "
+          f"(reused {len(kept_nodes)}/{len(entities)} nodes)")
     return graph
 
 
+def load_previous_graph(build_dir: Path):
+    """이전 빌드의 (graph.json, 스냅샷 엔티티)
+
+    Raises:
+        GraphPatchError: 파일 없음/손상 또는 두 파일의 generated 불일치
+    """
+    try:
+        with open(build_dir / "graph.json", "r", encoding="utf-8") as f:
+            previous_graph = json.load(f)
+        snapshot = load_snapshot(build_dir / SNAPSHOT_FILENAME)
+    except (OSError, ValueError, SnapshotError) as e:
+        raise GraphPatchError(str(e)) from e
+    if previous_graph.get("generated") != snapshot.generated:
+        raise GraphPatchError("graph.json and entities.snap are from different builds")
+    return previous_graph, snapshot.entities
+
+
+def _graph_body(graph: Dict) -> str:
+    """generated를 제외한 graph.json 직렬화 (--verify 비교용)"""
+    return json.dumps(
+        {key: value for key, value in graph.items() if key != "generated"},
+        indent=2, ensure_ascii=False,
+    )
+
+
+def report_hierarchy_anomalies(hierarchy: HierarchyIndex, limit: int = 10) -> None:
+    """계층 이상 출력 (빌드는 계속 진행)"""
+    anomalies = hierarchy.anomalies
+    if not hierarchy.anomaly_count:
+        return
+    print(
+        f"  Hierarchy anomalies: {len(anomalies['cycles'])} cycles, "
+        f"{len(anomalies['multi_parent'])} multi-parent, "
+        f"{len(anomalies['missing_parent'])} missing parent"
+    )
+    for cycle in anomalies["cycles"][:limit]:
+        print(f"    - cycle: {' → '.join(cycle)} → {cycle[0]}")
+    for item in anomalies["multi_parent"][:limit]:
+        print(f"    - multi-parent: {item['id']} (parent_id: {item['parent_id']}, project_id: {item['project_id']})")
+    for item in anomalies["missing_parent"][:limit]:
+        print(f"    - missing parent: {item['id']} → {item['parent_id']}")
+
+
+# ============================================
+# Output modes (--minify, --shards, --precompress)
+# ============================================
+
+SHARD_MANIFEST_NAME = "graph.manifest.json"
+# _Graph_Index.md frontmatter의 updated 날짜 (created/마지막 업데이트/Auto-generated와 같은 값)
+INDEX_STAMP = re.compile(rb"^updated: (\S+)$", re.M)
+
+
+def _dump_json(obj: Dict, minify: bool) -> bytes:
+    if minify:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _shard_filename(entity_type: str) -> str:
+    """graph.<Type>.json (파일명에 쓸 수 없는 문자는 _)"""
+    return f"graph.{re.sub(r'[^A-Za-z0-9_-]', '_', entity_type)}.json"
+
+
+def shard_json_index(graph: Dict) -> Dict[str, Dict]:
+    """graph.json → 엔티티 타입별 shard
+
+    각 shard는 해당 타입의 nodes, by_status, conditions_3y_index와
+    source 엔티티가 해당 타입인 edges를 가집니다 (source가 엔티티가 아니면 target 기준).
+    모든 shard를 합치면 원래 graph와 같은 노드/에지 집합입니다.
+
+    Returns:
+        by_type key → shard dict (ENTITY_ORDER 순, 그 외 타입은 뒤에)
+    """
+    type_of = {
+        entity_id: entity_type
+        for entity_type, ids in graph["by_type"].items()
+        for entity_id in ids
+    }
+    order = [t for t in ENTITY_ORDER if t in graph["by_type"]]
+    order += [t for t in graph["by_type"] if t not in order]
+
+    shards = {
+        entity_type: {
+            "generated": graph["generated"],
+            "type": entity_type,
+            "total_entities": len(graph["by_type"][entity_type]),
+            "nodes": [],
+            "edges": [],
+            "conditions_3y_index": {},
+            "by_status": {},
+        }
+        for entity_type in order
+    }
+
+    for node in graph["nodes"]:
+        shards[type_of[node["id"]]]["nodes"].append(node)
+
+    for edge in graph["edges"]:
+        owner_type = type_of.get(edge["source"]) or type_of.get(edge["target"]) or order[0]
+        shards[owner_type]["edges"].append(edge)
+
+    for index_name in ("conditions_3y_index", "by_status"):
+        for key, ids in graph[index_name].items():
+            for entity_id in ids:
+                shards[type_of[entity_id]][index_name].setdefault(key, []).append(entity_id)
+
+    return shards
+
+
+def _previous_shard_files(build_dir: Path) -> List[str]:
+    """이전 graph.manifest.json이 가리키는 shard 파일명 + manifest 자신
+
+    manifest에 없는 graph.*.json (수동 백업, 다른 도구의 출력)은 건드리지 않습니다.
+    build_dir 밖이나 shard 이름 규칙(_shard_filename)에 맞지 않는 항목은 무시합니다.
+    """
+    manifest_path = build_dir / SHARD_MANIFEST_NAME
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        entries = list(manifest["shards"].values())
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, KeyError, AttributeError, TypeError):
+        return [SHARD_MANIFEST_NAME]  # 손상된 manifest는 다시 씀 (shard는 알 수 없으므로 남김)
+    names = [SHARD_MANIFEST_NAME]
+    for entry in entries:
+        name = entry.get("file") if isinstance(entry, dict) else None
+        if not isinstance(name, str) or name == SHARD_MANIFEST_NAME:
+            continue
+        if re.fullmatch(r"graph\.[A-Za-z0-9_-]+\.json", name):
+            names.append(name)
+    return names
+
+
+def write_json_outputs(
+    json_graph: Dict,
+    build_dir: Path,
+    minify: bool = False,
+    shards: bool = False,
+    precompress: bool = False,
+) -> List[Tuple[Path, bool]]:
+    """graph.json (+ shard/manifest, .gz/.br) 저장
+
+    Args:
+        minify: graph.json을 공백 없이 저장 (기본은 indent=2)
+        shards: graph.<Type>.json + graph.manifest.json 저장 (항상 minify, False면 이전 manifest의 shard 삭제)
+        precompress: 저장한 JSON마다 .gz(/.br) sibling 생성, False면 graph.json의 이전 압축본 삭제
+
+    generated 외에 바뀐 내용이 없으면 기존 graph.json을 그대로 두고 json_graph["generated"]를
+    기존 값으로 되돌립니다 (shard/스냅샷/hierarchy.json도 같은 값을 쓰므로 함께 변경 없음).
+
+    Returns:
+        (JSON 파일 경로, 저장 여부) 목록
+    """
+    graph_path = build_dir / "graph.json"
+
+    def render(stamp: str) -> Iterator[bytes]:
+        # 문서 전체를 bytes로 만들지 않고 chunk 단위로 비교/저장
+        json_graph["generated"] = stamp
+        return iter_json_bytes(json_graph, minify)
+
+    graph_written, json_graph["generated"] = write_stamped(
+        graph_path, render, json_graph["generated"], GENERATED_JSON_STAMP
+    )
+    outputs = []
+
+    if shards:
+        manifest = {
+            "generated": json_graph["generated"],
+            "total_entities": json_graph["total_entities"],
+            "total_edges": len(json_graph["edges"]),
+            "shards": {},
+        }
+        for entity_type, shard in shard_json_index(json_graph).items():
+            filename = _shard_filename(entity_type)
+            data = _dump_json(shard, minify=True)
+            outputs.append((build_dir / filename, data))
+            manifest["shards"][entity_type] = {
+                "file": filename,
+                "nodes": len(shard["nodes"]),
+                "edges": len(shard["edges"]),
+                "bytes": len(data),
+            }
+        outputs.append((build_dir / SHARD_MANIFEST_NAME, _dump_json(manifest, minify=True)))
+
+    # 이전 manifest에 있던 shard 중 이번 빌드에서 쓰지 않은 것 삭제 (없어진 타입, --shards 없이 재빌드)
+    current = {graph_path.name} | {path.name for path, _ in outputs}
+    for name in _previous_shard_files(build_dir):
+        if name not in current:
+            stale = build_dir / name
+            stale.unlink(missing_ok=True)
+            remove_precompressed(stale)
+
+    results = [(graph_path, graph_written)]
+    results += [(path, write_bytes_if_changed(path, data)) for path, data in outputs]
+    for path, _ in results:
+        if precompress:
+            write_precompressed(path)
+        else:
+            remove_precompressed(path)
+
+    return results
+
+
 # Note: generate_folder_indexes() removed in v7.0
 # _INDEX.md generation is now handled by /api/mcp/folder-contents API (tsk-vault-gpt-11)
 
 
-def main(vault_path: str) -> int:
-    """메인 함수"""
+def main(
+    vault_path: str,
+    collection: Optional[EntityCollection] = None,
+    use_cache: bool = True,
+    jobs: int = 1,
+    change_detection: str = "mtime",
+    incremental: bool = False,
+    verify: bool = False,
+    minify: bool = False,
+    shards: bool = False,
+    precompress: bool = False,
+) -> int:
+    """메인 함수
+
+    Args:
+        incremental: 이전 graph.json + entities.snap에서 변경된 엔티티만 패치
+            (이전 빌드 결과가 없거나 맞지 않으면 전체 재생성). graph.json만 패치하며
+            _Graph_Index.md와 나머지 _build 산출물은 항상 전체 생성 (내용이 같으면 쓰지 않음)
+        verify: incremental 결과를 전체 재생성과 비교, 다르면 전체 재생성 결과를 쓰고 1 반환
+        minify / shards / precompress: graph.json 출력 모드 (write_json_outputs 참고)
+    """
     vault_root = Path(vault_path).resolve()
 
     if not vault_root.exists():
@@ -406,7 +776,17 @@ def main(vault_path: str) -> int:
     _init_constants(vault_root)
 
     print("Collecting entities...")
-    entities = collect_entities(vault_root)
+    if collection is None:
+        collection = VaultScanner(
+            vault_root,
+            ScanConfig(include_paths=INCLUDE_PATHS),
+            use_cache=use_cache,
+            jobs=jobs,
+            change_detection=change_detection,
+        ).scan()
+        if collection.cache_stats:
+            print(f"  Frontmatter cache: {collection.cache_stats}")
+    entities = collect_entities(vault_root, collection)
     print(f"Found {len(entities)} entities")
 
     print("Deriving children...")
@@ -416,23 +796,75 @@ def main(vault_path: str) -> int:
     incoming_map = derive_incoming_relations(entities)
 
     print("Generating markdown index...")
-    index_content = generate_index(entities, children_map, incoming_map, vault_root)
 
-    # 마크다운 인덱스 저장
+    # 마크다운 인덱스 저장 (날짜 외 변경이 없으면 그대로 둠, --incremental에서도 전체 생성)
     index_path = vault_root / "_Graph_Index.md"
-    index_path.write_text(index_content, encoding="utf-8")
-    print(f"  Saved: {index_path}")
-
-    # JSON 인덱스 생성 및 저장
-    print("Generating JSON index...")
-    json_graph = generate_json_index(entities, children_map, incoming_map)
+    written, _ = write_stamped(
+        index_path,
+        lambda now: generate_index(entities, children_map, incoming_map, vault_root, now).encode("utf-8"),
+        datetime.now().strftime("%Y-%m-%d"),
+        INDEX_STAMP,
+    )
+    print(f"  {'Saved' if written else 'Unchanged'}: {index_path}")
 
     build_dir = vault_root / "_build"
     build_dir.mkdir(exist_ok=True)
-    json_path = build_dir / "graph.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(json_graph, f, indent=2, ensure_ascii=False)
-    print(f"  Saved: {json_path}")
+
+    # JSON 인덱스 생성 및 저장
+    json_graph = None
+    exit_code = 0
+    if incremental or verify:
+        print("Patching JSON index...")
+        try:
+            previous_graph, previous_entities = load_previous_graph(build_dir)
+            json_graph = patch_json_index(previous_graph, previous_entities, entities)
+        except GraphPatchError as e:
+            print(f"  Incremental patch unavailable ({e}), falling back to full rebuild")
+    if json_graph is None or verify:
+        print("Generating JSON index...")
+        full_graph = generate_json_index(entities, children_map, incoming_map)
+        if json_graph is not None and _graph_body(json_graph) != _graph_body(full_graph):
+            differing = [key for key in full_graph if key != "generated" and json_graph.get(key) != full_graph[key]]
+            print(f"  Error: incremental graph differs from full rebuild in {differing}")
+            exit_code = 1
+        elif json_graph is not None:
+            print("  Verified: incremental graph matches full rebuild")
+        json_graph = full_graph
+
+    json_outputs = write_json_outputs(json_graph, build_dir, minify, shards, precompress)
+    for json_path, written in json_outputs:
+        print(f"  {'Saved' if written else 'Unchanged'}: {json_path} ({json_path.stat().st_size / 1024:.0f} KB)")
+    if precompress:
+        codecs = ".gz/.br" if BROTLI_AVAILABLE else ".gz (brotli not installed)"
+        print(f"  Precompressed: {len(json_outputs)} files ({codecs})")
+
+    # graph.json sidecar offset 인덱스 (GraphReader가 노드 하나만 seek해서 읽음)
+    graph_path = build_dir / "graph.json"
+    offsets_written = write_graph_offsets(graph_path)
+    print(f"  {'Saved' if offsets_written else 'Unchanged'}: {offsets_path_for(graph_path)}")
+
+    # 바이너리 스냅샷 (소비자 startup용, graph.json 파싱 불필요)
+    snapshot_path = build_dir / SNAPSHOT_FILENAME
+    try:
+        snapshot_written, snapshot_size = write_snapshot(snapshot_path, entities, generated=json_graph["generated"])
+        print(f"  {'Saved' if snapshot_written else 'Unchanged'}: {snapshot_path} ({snapshot_size / 1024:.0f} KB)")
+    except SnapshotError as e:
+        print(f"  Warning: snapshot skipped ({e})")
+
+    # CSR 인접 인덱스 (children/incoming 조회를 edges 전체 스캔 없이)
+    adjacency_path = build_dir / ADJACENCY_FILENAME
+    try:
+        adjacency_written, adjacency_size = write_adjacency(adjacency_path, json_graph)
+        print(f"  {'Saved' if adjacency_written else 'Unchanged'}: {adjacency_path} ({adjacency_size / 1024:.0f} KB)")
+    except AdjacencyError as e:
+        print(f"  Warning: adjacency index skipped ({e})")
+
+    # 계층 구간 라벨 (조상/하위 조회를 정수 비교로)
+    hierarchy = build_hierarchy(entities)
+    hierarchy_path = build_dir / HIERARCHY_FILENAME
+    hierarchy_written, hierarchy_size = write_hierarchy(hierarchy_path, hierarchy, generated=json_graph["generated"])
+    print(f"  {'Saved' if hierarchy_written else 'Unchanged'}: {hierarchy_path} ({hierarchy_size / 1024:.0f} KB)")
+    report_hierarchy_anomalies(hierarchy)
 
     # Note: Folder index generation removed in v7.0
     # Use /api/mcp/folder-contents API instead (tsk-vault-gpt-11)
@@ -440,9 +872,37 @@ def main(vault_path: str) -> int:
     print(f"\nTotal entities indexed: {len(entities)}")
     print(f"Conditions indexed: {len(json_graph['conditions_3y_index'])}")
 
-    return 0
+    return exit_code
 
 
 if __name__ == "__main__":
-    vault_path = sys.argv[1] if len(sys.argv) > 1 else "."
-    sys.exit(main(vault_path))
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args  # --no-cache: frontmatter 캐시 무시하고 전체 재파싱
+    jobs = 1
+    if "--jobs" in args:  # --jobs N: 병렬 파싱 worker 수 (0 = CPU 코어 수)
+        idx = args.index("--jobs")
+        jobs = int(args[idx + 1])
+        del args[idx:idx + 2]
+    change_detection = "mtime"
+    if "--change-detect" in args:  # --change-detect git: git index blob SHA로 변경 판단
+        idx = args.index("--change-detect")
+        change_detection = args[idx + 1]
+        del args[idx:idx + 2]
+    incremental = "--incremental" in args  # --incremental: 이전 graph.json에서 변경분만 패치 (_Graph_Index.md는 전체 생성)
+    verify = "--verify" in args  # --verify: incremental 결과를 전체 재생성과 비교
+    minify = "--minify" in args  # --minify: graph.json 공백 제거
+    shards = "--shards" in args  # --shards: graph.<Type>.json + graph.manifest.json
+    precompress = "--precompress" in args  # --precompress: .gz/.br sibling 생성 (nginx gzip_static)
+    positional = [a for a in args if not a.startswith("-")]
+    vault_path = positional[0] if positional else "."
+    sys.exit(main(
+        vault_path,
+        use_cache=use_cache,
+        jobs=jobs,
+        change_detection=change_detection,
+        incremental=incremental,
+        verify=verify,
+        minify=minify,
+        shards=shards,
+        precompress=precompress,
+    ))
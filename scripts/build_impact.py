@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-LOOP Vault Impact Score Builder v1.3
+LOOP Vault Impact Score Builder v1.5
 
 Project별 Expected/Realized Impact 점수를 계산합니다.
 출력: _build/impact.json
@@ -12,59 +12,86 @@ Project별 Expected/Realized Impact 점수를 계산합니다.
 v5.2 추가:
 - Project.realized_impact에서 window_id, time_range, metrics_snapshot 읽기
 - Track/Condition B는 Derived (저장 안 함, 하위 Project B를 window로 묶어 집계)
+- Track.realized_by_quarter / Condition.realized_by_half (v1.3.1: secondary 포함)
+
+변경사항 (v1.3.2):
+- 50_Projects 단일 스캔 (shared.vault, Project/Evidence 수집 공유)
+- generated 외 변경이 없으면 impact.json을 다시 쓰지 않음 (generated = 마지막 내용 변경 시각)
+- impact.json을 chunk 단위로 비교/저장 (shared.utils.json_stream)
+
+변경사항 (v1.4):
+- Condition/Track 롤업을 shared.impact.ImpactEngine으로 계산
+  (condition_contributes / track_contributes / parent_id → 희소 가중치 행렬, 점수 → 벡터,
+  롤업 = 행렬-벡터 곱, numpy가 있으면 사용하고 없으면 순수 Python, 출력은 기존과 동일)
+- window 헬퍼는 shared.impact.windows, 점수 공식/Tier 정책은 shared.impact.model로 이동
+  (what-if 시나리오 scripts/impact_scenarios.py와 공유)
+
+변경사항 (v1.5):
+- --incremental 옵션: 이전 impact.json + _build/impact.state.json 대비 입력(frontmatter/Evidence)이
+  바뀐 Project만 다시 계산하고, 그 Project가 건드리는 Condition/Track 롤업만 다시 집계
+  (shared.impact.incremental, 나머지 레코드/롤업은 이전 impact.json 재사용)
+- --verify 옵션: incremental 결과를 전체 재계산과 비교 (다르면 전체 결과를 쓰고 exit 1)
+- impact.state.json: 빌드마다 Project별 입력 signature와 설정 signature 저장
+- impact.json 내용이 바뀐 빌드마다 _build/impact_history.jsonl에 delta snapshot 추가
+  (shared.impact.history, 조회: scripts/impact_history.py)
 
 Usage:
     python3 scripts/build_impact.py .
+    python3 scripts/build_impact.py . --no-cache      # frontmatter 캐시 무시
+    python3 scripts/build_impact.py . --incremental   # 바뀐 Project/롤업만 다시 계산
+    python3 scripts/build_impact.py . --verify        # incremental 결과를 전체 재계산과 비교
 """
 
 import os
-import re
 import sys
 import json
+import hashlib
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from collections import defaultdict
 
-# === 기본 설정 (impact_model_config.yml 없을 경우) ===
-DEFAULT_MAGNITUDE_POINTS = {
-    "strategic": {"high": 10, "mid": 6, "low": 3},
-    "enabling": {"high": 5, "mid": 3, "low": 1.5},
-    "operational": {"high": 2, "mid": 1, "low": 0.5},
-}
-
-DEFAULT_STRENGTH_MULTIPLIERS = {
-    "strong": 1.0,
-    "medium": 0.7,
-    "weak": 0.4,
-}
-
-# Impact 모델 버전 (점수 변경 추적용)
-IMPACT_MODEL_VERSION = "IM-2025-01"
-
-# Tier별 계산 정책
-TIER_POLICY = {
-    "strategic": {
-        "calculate_expected": True,
-        "calculate_realized": True,
-        "include_in_rollup": True,
-    },
-    "enabling": {
-        "calculate_expected": True,
-        "calculate_realized": True,  # light realized (evidence 선택적)
-        "include_in_rollup": True,
-    },
-    "operational": {
-        "calculate_expected": False,  # Impact 계산 제외
-        "calculate_realized": False,
-        "include_in_rollup": False,
-    },
-}
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import Entity, EntityCollection, ScanConfig, VaultScanner
+from shared.impact.engine import ImpactEngine
+from shared.impact.history import HistoryError, ImpactHistory
+from shared.impact.incremental import RollupPatchError, patch_rollups
+from shared.impact.model import (  # noqa: F401 (기존 build_impact.* 이름 유지)
+    DEFAULT_MAGNITUDE_POINTS,
+    DEFAULT_STRENGTH_MULTIPLIERS,
+    IMPACT_MODEL_VERSION,
+    TIER_POLICY,
+    calculate_expected_score,
+    calculate_realized_score,
+)
+from shared.impact.windows import (  # noqa: F401 (기존 build_impact.* 이름 유지)
+    month_to_half,
+    month_to_quarter,
+    parse_window_id,
+    window_to_half_key,
+)
+from shared.utils.artifact import GENERATED_JSON_STAMP, write_bytes_if_changed, write_stamped
+from shared.utils.json_stream import iter_json_bytes
 
 # 스캔 경로
 INCLUDE_PATHS = ["50_Projects"]
 
+# impact.json script_version (v5.2: secondary track quarter rollup)
+SCRIPT_VERSION = "1.3.1"
+
+# --incremental 상태 파일 (impact.json과 같은 빌드에서 저장)
+STATE_FILENAME = "impact.state.json"
+STATE_VERSION = 1
+
+# build_project_impact가 읽는 Project frontmatter 필드
+PROJECT_INPUT_FIELDS = (
+    "entity_name", "tier", "impact_magnitude", "confidence", "realized_impact",
+    "condition_contributes", "contributes", "track_contributes", "parent_id",
+    "realized_status", "owner", "status",
+)
+
 
 def load_config(vault_root: Path) -> Dict:
     """impact_model_config.yml 로드"""
@@ -85,148 +112,64 @@ def load_config(vault_root: Path) -> Dict:
     }
 
 
-def extract_frontmatter(content: str) -> Optional[Dict]:
-    """마크다운에서 YAML frontmatter 추출"""
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1))
-        except yaml.YAMLError:
-            return None
-    return None
-
-
-def collect_projects(vault_root: Path) -> Dict[str, Dict]:
-    """모든 Project 엔티티 수집"""
-    projects = {}
+def scan_projects_dir(vault_root: Path, use_cache: bool = True) -> EntityCollection:
+    """50_Projects 단일 스캔 (Project/Evidence 수집이 공유)"""
+    return VaultScanner(vault_root, ScanConfig(include_paths=INCLUDE_PATHS), use_cache=use_cache).scan()
 
-    for filepath in vault_root.rglob("*.md"):
-        relative = str(filepath.relative_to(vault_root))
 
-        # 포함 경로 체크
-        should_include = any(relative.startswith(inc) for inc in INCLUDE_PATHS)
-        if not should_include:
-            continue
+def collect_projects(vault_root: Path, collection: Optional[EntityCollection] = None) -> Dict[str, Entity]:
+    """모든 Project 엔티티 수집 (Impact 필드가 많으므로 원본 frontmatter 보관)"""
+    if collection is None:
+        collection = scan_projects_dir(vault_root)
 
-        # 템플릿 제외
-        if "_TEMPLATES" in relative:
-            continue
+    projects = collection.entity_map(prefix=INCLUDE_PATHS, entity_type="Project", keep_frontmatter=True)
 
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception:
-            continue
-
-        frontmatter = extract_frontmatter(content)
-        if frontmatter and frontmatter.get("entity_type") == "Project":
-            entity_id = frontmatter.get("entity_id")
-            if entity_id:
-                projects[entity_id] = {
-                    "filepath": filepath,
-                    "relative_path": relative,
-                    "frontmatter": frontmatter,
-                }
-
-    return projects
+    # 템플릿 제외
+    return {
+        entity_id: project
+        for entity_id, project in projects.items()
+        if "_TEMPLATES" not in project.relative_path
+    }
 
 
-def collect_evidence(vault_root: Path) -> Dict[str, List[Dict]]:
+def collect_evidence(vault_root: Path, collection: Optional[EntityCollection] = None) -> Dict[str, List[Dict]]:
     """Project별 Evidence 수집"""
-    evidence_map = defaultdict(list)
-
-    for filepath in vault_root.rglob("*.md"):
-        relative = str(filepath.relative_to(vault_root))
+    if collection is None:
+        collection = scan_projects_dir(vault_root)
 
-        # 포함 경로 체크
-        should_include = any(relative.startswith(inc) for inc in INCLUDE_PATHS)
-        if not should_include:
-            continue
+    evidence_map = defaultdict(list)
 
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception:
-            continue
-
-        frontmatter = extract_frontmatter(content)
-        if frontmatter and frontmatter.get("entity_type") == "Evidence":
-            project_id = frontmatter.get("project")
-            if project_id:
-                evidence_map[project_id].append({
-                    "id": frontmatter.get("entity_id", ""),
-                    "summary": frontmatter.get("summary", ""),
-                    "normalized_delta": frontmatter.get("normalized_delta", 0),
-                    "evidence_strength": frontmatter.get("evidence_strength", "medium"),
-                    "attribution_share": frontmatter.get("attribution_share", 1.0),
-                    "created": frontmatter.get("created", ""),
-                })
+    for vf in collection.select(entity_type="Evidence", prefix=INCLUDE_PATHS):
+        frontmatter = vf.frontmatter
+        project_id = frontmatter.get("project")
+        if project_id:
+            evidence_map[project_id].append({
+                "id": frontmatter.get("entity_id", ""),
+                "summary": frontmatter.get("summary", ""),
+                "normalized_delta": frontmatter.get("normalized_delta", 0),
+                "evidence_strength": frontmatter.get("evidence_strength", "medium"),
+                "attribution_share": frontmatter.get("attribution_share", 1.0),
+                "created": frontmatter.get("created", ""),
+            })
 
     return dict(evidence_map)
 
 
-def calculate_expected_score(
-    tier: str,
-    magnitude: str,
-    confidence: float,
-    magnitude_points: Dict,
-) -> float:
-    """Expected Score (A) 계산
-
-    ExpectedScore = magnitude_points[tier][magnitude] × confidence
-    """
-    # tier 기본값
-    if tier not in magnitude_points:
-        tier = "enabling"
-
-    tier_points = magnitude_points.get(tier, {})
-
-    # magnitude 기본값
-    if magnitude not in tier_points:
-        magnitude = "mid"
-
-    points = tier_points.get(magnitude, 3)
-    score = points * confidence
-
-    return round(score, 2)
-
-
-def calculate_realized_score(
-    evidence_list: List[Dict],
-    strength_multipliers: Dict,
-) -> tuple[float, int]:
-    """Realized Score (B) 계산
-
-    RealizedScore = Σ(normalized_delta × strength_mult × attribution_share)
-    """
-    if not evidence_list:
-        return 0.0, 0
-
-    total_score = 0.0
-
-    for ev in evidence_list:
-        delta = ev.get("normalized_delta", 0)
-        strength = ev.get("evidence_strength", "medium")
-        attribution = ev.get("attribution_share", 1.0)
-
-        strength_mult = strength_multipliers.get(strength, 0.7)
-        score = delta * strength_mult * attribution
-        total_score += score
-
-    return round(total_score, 2), len(evidence_list)
-
-
 def build_project_impact(
     project_id: str,
-    project_data: Dict,
+    project_data: Entity,
     evidence_list: List[Dict],
     config: Dict,
 ) -> Dict:
     """단일 Project의 Impact 레코드 생성"""
-    fm = project_data["frontmatter"]
+    fm = project_data.frontmatter
 
     # 필드 추출
     tier = fm.get("tier", "enabling")
     magnitude = fm.get("impact_magnitude", "mid")
     confidence = fm.get("confidence", 0.7)
+    if confidence is None:
+        confidence = 0.7  # 미입력(null) 프로젝트는 기본값
 
     # v5.2: realized_impact에서 window 필드 읽기
     realized_impact = fm.get("realized_impact", {})
@@ -274,7 +217,7 @@ def build_project_impact(
     record = {
         "id": project_id,
         "name": fm.get("entity_name", ""),
-        "path": project_data["relative_path"],
+        "path": project_data.relative_path,
 
         # Impact 입력값
         "tier": tier,
@@ -314,178 +257,160 @@ def build_project_impact(
 
 def calculate_condition_rollup(
     project_records: List[Dict],
+    engine: Optional[ImpactEngine] = None,
 ) -> Dict[str, Dict]:
     """Condition별 롤업 계산 (Tier 정책 적용)
 
     v5.1: contributes → condition_contributes
+    v5.2: realized_by_half (반기 window 집계, weight 반영)
+    v1.4: ImpactEngine 희소 가중치 행렬 × 점수 벡터 (engine을 넘기면 행렬 재사용)
     """
-    rollup = defaultdict(lambda: {
-        "expected_sum": 0.0,
-        "realized_sum": 0.0,
-        "project_count": 0,
-        "projects": [],
-        "excluded_projects": [],  # operational tier 등 제외된 프로젝트
-        "tier_distribution": {"strategic": 0, "enabling": 0, "operational": 0},
-    })
-
-    for project in project_records:
-        # v5.1: condition_contributes 사용
-        condition_contributes = project.get("condition_contributes", [])
-        tier = project.get("tier", "enabling")
-        policy = TIER_POLICY.get(tier, TIER_POLICY["enabling"])
-
-        for c in condition_contributes:
-            if not isinstance(c, dict):
-                continue
-
-            cond_id = c.get("to", "")
-            weight = c.get("weight", 0)
-
-            if not cond_id:
-                continue
-
-            # Tier 분포 (모든 프로젝트 카운트)
-            if tier in rollup[cond_id]["tier_distribution"]:
-                rollup[cond_id]["tier_distribution"][tier] += 1
-
-            # Rollup 포함 여부 체크
-            if not policy["include_in_rollup"]:
-                rollup[cond_id]["excluded_projects"].append({
-                    "id": project["id"],
-                    "name": project["name"],
-                    "tier": tier,
-                    "reason": "operational tier excluded from rollup",
-                })
-                continue
-
-            # 가중 점수 합산 (strategic, enabling만)
-            rollup[cond_id]["expected_sum"] += project["expected_score"] * weight
-            rollup[cond_id]["realized_sum"] += project["realized_score"] * weight
-            rollup[cond_id]["project_count"] += 1
-            rollup[cond_id]["projects"].append({
-                "id": project["id"],
-                "name": project["name"],
-                "tier": tier,
-                "weight": weight,
-                "expected": project["expected_score"],
-                "realized": project["realized_score"],
-            })
-
-    # 반올림
-    for cond_id in rollup:
-        rollup[cond_id]["expected_sum"] = round(rollup[cond_id]["expected_sum"], 2)
-        rollup[cond_id]["realized_sum"] = round(rollup[cond_id]["realized_sum"], 2)
-
-    return dict(rollup)
+    if engine is None:
+        engine = ImpactEngine(project_records, TIER_POLICY)
+    return engine.condition_rollup()
 
 
 def calculate_track_rollup(
     project_records: List[Dict],
+    engine: Optional[ImpactEngine] = None,
 ) -> Dict[str, Dict]:
     """Track별 롤업 계산 (v5.1 신규)
 
     Primary Track: parent_id (암묵적 weight 1.0)
     Secondary Track: track_contributes 필드
+    v5.2: realized_by_quarter (분기 window 집계, secondary는 weight 반영)
+    v1.4: ImpactEngine 희소 가중치 행렬 × 점수 벡터 (engine을 넘기면 행렬 재사용)
     """
-    rollup = defaultdict(lambda: {
-        "expected_sum": 0.0,
-        "realized_sum": 0.0,
-        "primary_projects": [],    # 이 Track이 Primary인 프로젝트
-        "secondary_projects": [],  # 이 Track에 Secondary 기여하는 프로젝트
-        "tier_distribution": {"strategic": 0, "enabling": 0, "operational": 0},
+    if engine is None:
+        engine = ImpactEngine(project_records, TIER_POLICY)
+    return engine.track_rollup()
+
+
+# ============================================
+# Incremental impact.json patch (--incremental)
+# ============================================
+
+class ImpactPatchError(Exception):
+    """이전 impact.json/상태 파일로 패치할 수 없음 (전체 재계산으로 fallback)"""
+
+
+def _signature(value: Any) -> str:
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=repr)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def config_signature(config: Dict) -> str:
+    """점수에 영향을 주는 설정/버전의 signature (다르면 전체 재계산)"""
+    return _signature({
+        "model_version": IMPACT_MODEL_VERSION,
+        "script_version": SCRIPT_VERSION,
+        "tier_policy": TIER_POLICY,
+        "magnitude_points": config.get("magnitude_points", DEFAULT_MAGNITUDE_POINTS),
+        "strength_multipliers": config.get("strength_multipliers", DEFAULT_STRENGTH_MULTIPLIERS),
     })
 
-    for project in project_records:
-        primary_track = project.get("primary_track", "")
-        track_contributes = project.get("track_contributes", [])
-        tier = project.get("tier", "enabling")
-        policy = TIER_POLICY.get(tier, TIER_POLICY["enabling"])
-
-        # Primary Track 처리 (암묵적 weight 1.0)
-        if primary_track:
-            if tier in rollup[primary_track]["tier_distribution"]:
-                rollup[primary_track]["tier_distribution"][tier] += 1
-
-            if policy["include_in_rollup"]:
-                # Primary Track은 weight 1.0으로 전체 점수 기여
-                rollup[primary_track]["expected_sum"] += project["expected_score"]
-                rollup[primary_track]["realized_sum"] += project["realized_score"]
-                rollup[primary_track]["primary_projects"].append({
-                    "id": project["id"],
-                    "name": project["name"],
-                    "tier": tier,
-                    "weight": 1.0,  # 암묵적
-                    "expected": project["expected_score"],
-                    "realized": project["realized_score"],
-                })
-
-        # Secondary Track 처리
-        for tc in track_contributes:
-            if not isinstance(tc, dict):
-                continue
-
-            track_id = tc.get("to", "")
-            weight = tc.get("weight", 0)
-
-            if not track_id:
-                continue
-
-            if policy["include_in_rollup"]:
-                rollup[track_id]["expected_sum"] += project["expected_score"] * weight
-                rollup[track_id]["realized_sum"] += project["realized_score"] * weight
-                rollup[track_id]["secondary_projects"].append({
-                    "id": project["id"],
-                    "name": project["name"],
-                    "tier": tier,
-                    "weight": weight,
-                    "expected": project["expected_score"],
-                    "realized": project["realized_score"],
-                })
-
-    # 반올림
-    for track_id in rollup:
-        rollup[track_id]["expected_sum"] = round(rollup[track_id]["expected_sum"], 2)
-        rollup[track_id]["realized_sum"] = round(rollup[track_id]["realized_sum"], 2)
-
-    return dict(rollup)
-
-
-def main(vault_path: str) -> int:
-    """메인 함수"""
-    vault_root = Path(vault_path).resolve()
 
-    if not vault_root.exists():
-        print(f"Error: Vault path does not exist: {vault_root}")
-        return 1
+def project_signature(project: Entity, evidence_list: List[Dict]) -> List[str]:
+    """[frontmatter 입력 signature, Evidence signature] (둘 다 같으면 레코드 재사용)"""
+    fm = project.frontmatter
+    inputs = {key: fm[key] for key in PROJECT_INPUT_FIELDS if key in fm}
+    return [_signature([project.relative_path, inputs]), _signature(evidence_list)]
 
-    print("Loading config...")
-    config = load_config(vault_root)
 
-    print("Collecting projects...")
-    projects = collect_projects(vault_root)
-    print(f"Found {len(projects)} projects")
+def build_state(generated: str, config: Dict, projects: Dict[str, Entity], evidence_map: Dict[str, List[Dict]]) -> Dict:
+    """impact.state.json 내용 (impact.json의 generated와 짝)"""
+    return {
+        "version": STATE_VERSION,
+        "generated": generated,
+        "config": config_signature(config),
+        "projects": {
+            project_id: project_signature(project, evidence_map.get(project_id, []))
+            for project_id, project in projects.items()
+        },
+    }
 
-    print("Collecting evidence...")
-    evidence_map = collect_evidence(vault_root)
-    print(f"Found evidence for {len(evidence_map)} projects")
 
-    print("Calculating impact scores...")
-    project_records = []
+def load_previous_impact(build_dir: Path) -> Tuple[Dict, Dict]:
+    """이전 빌드의 (impact.json, impact.state.json)
+
+    Raises:
+        ImpactPatchError: 파일 없음/손상, 상태 버전 불일치 또는 두 파일의 generated 불일치
+    """
+    try:
+        with open(build_dir / "impact.json", "r", encoding="utf-8") as f:
+            previous_impact = json.load(f)
+        with open(build_dir / STATE_FILENAME, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ImpactPatchError(str(e)) from e
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        raise ImpactPatchError(f"unsupported {STATE_FILENAME} version")
+    if previous_impact.get("generated") != state.get("generated"):
+        raise ImpactPatchError(f"impact.json and {STATE_FILENAME} are from different builds")
+    return previous_impact, state
+
+
+def patch_impact(
+    previous_impact: Dict,
+    state: Dict,
+    projects: Dict[str, Entity],
+    evidence_map: Dict[str, List[Dict]],
+    config: Dict,
+) -> Tuple[List[Dict], Dict[str, Dict], Dict[str, Dict], Set[str], Dict[str, int]]:
+    """입력이 바뀐 Project만 다시 계산한 (records, conditions, tracks, dirty ids, 다시 집계한 롤업 수)
 
+    Project 레코드 순서와 롤업 key 순서, 합산 순서는 전체 재계산과 같습니다.
+    --verify로 전체 재계산과 비교할 수 있습니다.
+
+    Raises:
+        ImpactPatchError: 설정/모델 버전 변경 또는 이전 impact.json과 상태 파일 불일치
+    """
+    if state.get("config") != config_signature(config):
+        raise ImpactPatchError("impact model config or version changed")
+    previous_records = {record["id"]: record for record in previous_impact.get("projects", [])}
+    signatures = state.get("projects", {})
+    if previous_records.keys() != signatures.keys():
+        raise ImpactPatchError(f"impact.json does not match {STATE_FILENAME}")
+
+    records = []
+    dirty: Set[str] = set(previous_records) - set(projects)
     for project_id, project_data in projects.items():
         evidence_list = evidence_map.get(project_id, [])
-        record = build_project_impact(project_id, project_data, evidence_list, config)
-        project_records.append(record)
+        previous = previous_records.get(project_id)
+        if previous is not None and signatures[project_id] == project_signature(project_data, evidence_list):
+            records.append(previous)
+        else:
+            dirty.add(project_id)
+            records.append(build_project_impact(project_id, project_data, evidence_list, config))
+
+    # 전체 재계산과 같은 정렬 (entity 순서 기준 stable sort)
+    records.sort(key=lambda x: x["expected_score"], reverse=True)
+
+    try:
+        conditions, tracks, touched = patch_rollups(
+            records, dirty, previous_records,
+            previous_impact.get("conditions", {}), previous_impact.get("tracks", {}), TIER_POLICY,
+        )
+    except RollupPatchError as e:
+        raise ImpactPatchError(str(e)) from e
+    return records, conditions, tracks, dirty, touched
 
-    # 정렬 (expected_score 내림차순)
-    project_records.sort(key=lambda x: x["expected_score"], reverse=True)
 
-    print("Calculating condition rollup...")
-    condition_rollup = calculate_condition_rollup(project_records)
+def _impact_body(impact_data: Dict) -> str:
+    """generated를 제외한 impact.json 직렬화 (--verify 비교용)"""
+    return json.dumps(
+        {key: value for key, value in impact_data.items() if key != "generated"},
+        indent=2, ensure_ascii=False,
+    )
 
-    print("Calculating track rollup...")
-    track_rollup = calculate_track_rollup(project_records)
 
+def build_impact_data(
+    project_records: List[Dict],
+    condition_rollup: Dict[str, Dict],
+    track_rollup: Dict[str, Dict],
+    config: Dict,
+) -> Dict:
+    """impact.json 내용 (generated는 현재 시각, 저장 시 write_stamped가 결정)"""
     # 통계
     total_expected = sum(p["expected_score"] for p in project_records)
     total_realized = sum(p["realized_score"] for p in project_records)
@@ -497,11 +422,10 @@ def main(vault_path: str) -> int:
     # v5.2: window 통계
     with_window = len([p for p in project_records if p.get("window_id")])
 
-    # 최종 결과
-    impact_data = {
+    return {
         "model_version": IMPACT_MODEL_VERSION,  # Impact 모델 버전 (점수 변경 추적용)
         "generated": datetime.now().isoformat(),
-        "script_version": "1.3.0",  # v5.2: window fields + SSOT principle
+        "script_version": SCRIPT_VERSION,
 
         # 전체 통계
         "summary": {
@@ -530,113 +454,13 @@ def main(vault_path: str) -> int:
         },
     }
 
-    # 저장
-    build_dir = vault_root / "_build"
-    build_dir.mkdir(exist_ok=True)
-
-    impact_path = build_dir / "impact.json"
-    with open(impact_path, "w", encoding="utf-8") as f:
-        json.dump(impact_data, f, indent=2, ensure_ascii=False)
-    print(f"Saved: {impact_path}")
-
-    # 결과 출력
-    print(f"\n=== Impact Summary ===")
-    print(f"Total Projects: {len(project_records)}")
-    print(f"Projects with Impact: {with_impact}")
-    print(f"Total Expected Score: {total_expected:.2f}")
-    print(f"Total Realized Score: {total_realized:.2f}")
-    print(f"Conditions with rollup: {len(condition_rollup)}")
-    print(f"Tracks with rollup: {len(track_rollup)}")
-    print(f"Projects with window: {with_window}")
-
-    if project_records:
-        print(f"\n=== Top 5 Projects by Expected Score ===")
-        for p in project_records[:5]:
-            print(f"  {p['id']}: {p['name'][:30]} - Expected: {p['expected_score']}")
-
-    return 0
-
-
-if __name__ == "__main__":
-    vault_path = sys.argv[1] if len(sys.argv) > 1 else "."
-    sys.exit(main(vault_path))
-                        rollup[primary_track]["realized_by_quarter"][quarter_key]["sum"] += project["realized_score"]
-                        rollup[primary_track]["realized_by_quarter"][quarter_key]["projects"].append(project["id"])
-
-        # Secondary Track 처리
-        for tc in track_contributes:
-            if not isinstance(tc, dict):
-                continue
-
-            track_id = tc.get("to", "")
-            weight = tc.get("weight", 0)
-
-            if not track_id:
-                continue
-
-            if policy["include_in_rollup"]:
-                rollup[track_id]["expected_sum"] += project["expected_score"] * weight
-                rollup[track_id]["realized_sum"] += project["realized_score"] * weight
-                rollup[track_id]["secondary_projects"].append({
-                    "id": project["id"],
-                    "name": project["name"],
-                    "tier": tier,
-                    "weight": weight,
-                    "expected": project["expected_score"],
-                    "realized": project["realized_score"],
-                    "window_id": window_id,  # v5.2 추가
-                })
-
-                # v5.2: Secondary Track도 분기별 집계 (weight 반영)
-                if parsed_window:
-                    quarter_key = None
-                    if parsed_window["format"] == "month":
-                        quarter = month_to_quarter(parsed_window["month"])
-                        quarter_key = f"{parsed_window['year']}-Q{quarter}"
-                    elif parsed_window["format"] == "quarter":
-                        quarter_key = f"{parsed_window['year']}-Q{parsed_window['quarter']}"
-
-                    if quarter_key:
-                        if quarter_key not in rollup[track_id]["realized_by_quarter"]:
-                            rollup[track_id]["realized_by_quarter"][quarter_key] = {
-                                "sum": 0.0,
-                                "projects": [],
-                            }
-                        rollup[track_id]["realized_by_quarter"][quarter_key]["sum"] += project["realized_score"] * weight
-                        rollup[track_id]["realized_by_quarter"][quarter_key]["projects"].append(project["id"])
-
-    # 반올림
-    for track_id in rollup:
-        rollup[track_id]["expected_sum"] = round(rollup[track_id]["expected_sum"], 2)
-        rollup[track_id]["realized_sum"] = round(rollup[track_id]["realized_sum"], 2)
-        # v5.2: 분기별 합계도 반올림
-        for quarter_key in rollup[track_id]["realized_by_quarter"]:
-            rollup[track_id]["realized_by_quarter"][quarter_key]["sum"] = round(
-                rollup[track_id]["realized_by_quarter"][quarter_key]["sum"], 2
-            )
-
-    return dict(rollup)
-
-
-def main(vault_path: str) -> int:
-    """메인 함수"""
-    vault_root = Path(vault_path).resolve()
-
-    if not vault_root.exists():
-        print(f"Error: Vault path does not exist: {vault_root}")
-        return 1
-
-    print("Loading config...")
-    config = load_config(vault_root)
-
-    print("Collecting projects...")
-    projects = collect_projects(vault_root)
-    print(f"Found {len(projects)} projects")
-
-    print("Collecting evidence...")
-    evidence_map = collect_evidence(vault_root)
-    print(f"Found evidence for {len(evidence_map)} projects")
 
+def build_full(
+    projects: Dict[str, Entity],
+    evidence_map: Dict[str, List[Dict]],
+    config: Dict,
+) -> Tuple[List[Dict], Dict[str, Dict], Dict[str, Dict]]:
+    """전체 재계산 (records, conditions, tracks)"""
     print("Calculating impact scores...")
     project_records = []
 
@@ -648,83 +472,136 @@ def main(vault_path: str) -> int:
     # 정렬 (expected_score 내림차순)
     project_records.sort(key=lambda x: x["expected_score"], reverse=True)
 
+    # Condition/Track 가중치 행렬은 한 번만 구성
+    engine = ImpactEngine(project_records, TIER_POLICY)
+
     print("Calculating condition rollup...")
-    condition_rollup = calculate_condition_rollup(project_records)
+    condition_rollup = calculate_condition_rollup(project_records, engine)
 
     print("Calculating track rollup...")
-    track_rollup = calculate_track_rollup(project_records)
+    track_rollup = calculate_track_rollup(project_records, engine)
 
-    # 통계
-    total_expected = sum(p["expected_score"] for p in project_records)
-    total_realized = sum(p["realized_score"] for p in project_records)
-    with_impact = len([p for p in project_records if p.get("condition_contributes")])
+    return project_records, condition_rollup, track_rollup
 
-    # operational 제외 통계
-    excluded_count = len([p for p in project_records if p.get("impact_excluded")])
 
-    # v5.2: window 통계
-    with_window = len([p for p in project_records if p.get("window_id")])
+def main(
+    vault_path: str,
+    use_cache: bool = True,
+    collection: Optional[EntityCollection] = None,
+    incremental: bool = False,
+    verify: bool = False,
+) -> int:
+    """메인 함수
 
-    # 최종 결과
-    impact_data = {
-        "model_version": IMPACT_MODEL_VERSION,  # Impact 모델 버전 (점수 변경 추적용)
-        "generated": datetime.now().isoformat(),
-        "script_version": "1.3.1",  # v5.2: secondary track quarter rollup
+    Args:
+        incremental: 이전 impact.json + impact.state.json에서 입력이 바뀐 Project와 그 롤업만 다시 계산
+            (이전 빌드 결과가 없거나 맞지 않거나 설정이 바뀌면 전체 재계산)
+        verify: incremental 결과를 전체 재계산과 비교, 다르면 전체 재계산 결과를 쓰고 1 반환
+    """
+    vault_root = Path(vault_path).resolve()
 
-        # 전체 통계
-        "summary": {
-            "total_projects": len(project_records),
-            "projects_with_impact": with_impact,
-            "projects_excluded": excluded_count,  # operational tier 등 제외된 수
-            "projects_with_window": with_window,  # v5.2: window_id가 있는 프로젝트 수
-            "total_expected": round(total_expected, 2),
-            "total_realized": round(total_realized, 2),
-            "total_evidence": sum(p["evidence_count"] for p in project_records),
-        },
+    if not vault_root.exists():
+        print(f"Error: Vault path does not exist: {vault_root}")
+        return 1
 
-        # Project별 Impact
-        "projects": project_records,
+    print("Loading config...")
+    config = load_config(vault_root)
 
-        # Condition별 롤업
-        "conditions": condition_rollup,
+    # 50_Projects 단일 스캔 (Project/Evidence 수집 공유)
+    if collection is None:
+        collection = scan_projects_dir(vault_root, use_cache)
+        if collection.cache_stats:
+            print(f"Frontmatter cache: {collection.cache_stats}")
 
-        # Track별 롤업 (v5.1 신규)
-        "tracks": track_rollup,
+    print("Collecting projects...")
+    projects = collect_projects(vault_root, collection)
+    print(f"Found {len(projects)} projects")
 
-        # 사용된 설정
-        "config": {
-            "magnitude_points": config.get("magnitude_points", DEFAULT_MAGNITUDE_POINTS),
-            "strength_multipliers": config.get("strength_multipliers", DEFAULT_STRENGTH_MULTIPLIERS),
-        },
-    }
+    print("Collecting evidence...")
+    evidence_map = collect_evidence(vault_root, collection)
+    print(f"Found evidence for {len(evidence_map)} projects")
 
-    # 저장
     build_dir = vault_root / "_build"
     build_dir.mkdir(exist_ok=True)
 
+    impact_data = None
+    exit_code = 0
+    if incremental or verify:
+        print("Patching impact scores...")
+        try:
+            previous_impact, state = load_previous_impact(build_dir)
+            project_records, condition_rollup, track_rollup, dirty, touched = patch_impact(
+                previous_impact, state, projects, evidence_map, config,
+            )
+            impact_data = build_impact_data(project_records, condition_rollup, track_rollup, config)
+            print(
+                f"  Recalculated {len(dirty)} projects, "
+                f"{touched['conditions']} condition / {touched['tracks']} track rollups"
+            )
+        except ImpactPatchError as e:
+            print(f"  Incremental patch unavailable ({e}), falling back to full rebuild")
+    if impact_data is None or verify:
+        full_data = build_impact_data(*build_full(projects, evidence_map, config), config)
+        if impact_data is not None and _impact_body(impact_data) != _impact_body(full_data):
+            differing = [key for key in full_data if key != "generated" and impact_data.get(key) != full_data[key]]
+            print(f"  Error: incremental impact differs from full rebuild in {differing}")
+            exit_code = 1
+        elif impact_data is not None:
+            print("  Verified: incremental impact matches full rebuild")
+        impact_data = full_data
+
+    project_records = impact_data["projects"]
+    condition_rollup = impact_data["conditions"]
+    track_rollup = impact_data["tracks"]
+    summary = impact_data["summary"]
+
+    # 저장
+    def render(stamp: str):
+        impact_data["generated"] = stamp
+        return iter_json_bytes(impact_data)
+
     impact_path = build_dir / "impact.json"
-    with open(impact_path, "w", encoding="utf-8") as f:
-        json.dump(impact_data, f, indent=2, ensure_ascii=False)
-    print(f"Saved: {impact_path}")
+    written, generated = write_stamped(impact_path, render, impact_data["generated"], GENERATED_JSON_STAMP)
+    print(f"{'Saved' if written else 'Unchanged'}: {impact_path}")
+
+    # 다음 --incremental 빌드용 상태 (impact.json의 generated와 짝)
+    state_path = build_dir / STATE_FILENAME
+    state_bytes = json.dumps(
+        build_state(generated, config, projects, evidence_map), ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+    print(f"{'Saved' if write_bytes_if_changed(state_path, state_bytes) else 'Unchanged'}: {state_path}")
+
+    # 시계열 히스토리 (generated가 같은 snapshot은 다시 추가하지 않음)
+    try:
+        history = ImpactHistory(build_dir)
+        appended = history.append(impact_data)
+        print(f"{'Appended' if appended else 'Unchanged'}: {history.log_path} ({len(history.snapshots)} snapshots)")
+    except (OSError, HistoryError) as e:
+        print(f"Warning: impact history skipped ({e})")
 
     # 결과 출력
     print(f"\n=== Impact Summary ===")
-    print(f"Total Projects: {len(project_records)}")
-    print(f"Projects with Impact: {with_impact}")
-    print(f"Total Expected Score: {total_expected:.2f}")
-    print(f"Total Realized Score: {total_realized:.2f}")
+    print(f"Total Projects: {summary['total_projects']}")
+    print(f"Projects with Impact: {summary['projects_with_impact']}")
+    print(f"Total Expected Score: {summary['total_expected']:.2f}")
+    print(f"Total Realized Score: {summary['total_realized']:.2f}")
     print(f"Conditions with rollup: {len(condition_rollup)}")
     print(f"Tracks with rollup: {len(track_rollup)}")
-    print(f"Projects with window: {with_window}")
+    print(f"Projects with window: {summary['projects_with_window']}")
 
     if project_records:
         print(f"\n=== Top 5 Projects by Expected Score ===")
         for p in project_records[:5]:
             print(f"  {p['id']}: {p['name'][:30]} - Expected: {p['expected_score']}")
 
-    return 0
+    return exit_code
 
 
 if __name__ == "__main__":
-    vault_path = sys.argv[1] if len(sys.argv) > 1 else "."
-    sys.exit(main(vault_path))
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args  # --no-cache: frontmatter 캐시 무시하고 전체 재파싱
+    incremental = "--incremental" in args  # --incremental: 이전 impact.json에서 바뀐 Project/롤업만 다시 계산
+    verify = "--verify" in args  # --verify: incremental 결과를 전체 재계산과 비교
+    positional = [a for a in args if not a.startswith("-")]
+    vault_path = positional[0] if positional else "."
+    sys.exit(main(vault_path, use_cache=use_cache, incremental=incremental, verify=verify))
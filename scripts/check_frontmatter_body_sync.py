@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-LOOP Vault Frontmatter-Body Sync Validator v1.0
+LOOP Vault Frontmatter-Body Sync Validator v1.1
 
 본문의 메타라인이 frontmatter와 일치하는지 검증합니다.
 이 스크립트는 SSOT(Single Source of Truth) 원칙을 강제합니다.
@@ -20,6 +20,11 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.utils.yaml_parser import safe_load
+from shared.vault import EntityCollection, ScanConfig, VaultScanner
+
 # 본문 메타라인 패턴 (정규식)
 BODY_META_PATTERNS = {
     'Project': re.compile(r'>\s*Project ID:\s*`([^`]+)`\s*\|\s*(?:Track|Program):\s*`([^`]+)`\s*\|\s*Status:\s*(\w+)'),
@@ -37,7 +42,7 @@ def extract_frontmatter(content: str) -> Optional[Dict]:
     match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
     if match:
         try:
-            return yaml.safe_load(match.group(1))
+            return safe_load(match.group(1))
         except yaml.YAMLError:
             return None
     return None
@@ -50,8 +55,6 @@ def check_file(file_path: Path) -> List[str]:
     Returns:
         오류 메시지 목록 (비어있으면 통과)
     """
-    errors = []
-
     try:
         content = file_path.read_text(encoding='utf-8')
     except Exception as e:
@@ -62,6 +65,18 @@ def check_file(file_path: Path) -> List[str]:
     if not fm:
         return []  # frontmatter 없으면 스킵
 
+    return check_sync(fm, content)
+
+
+def check_sync(fm: Dict, content: str) -> List[str]:
+    """
+    파싱된 frontmatter와 본문 메타라인 비교.
+
+    Returns:
+        오류 메시지 목록 (비어있으면 통과)
+    """
+    errors = []
+
     entity_type = fm.get('entity_type')
     if entity_type not in BODY_META_PATTERNS:
         return []  # 검사 대상 엔티티가 아님
@@ -144,7 +159,12 @@ def validate_single_file(filepath: Path) -> int:
     return 0
 
 
-def main(vault_path: str, single_file: Optional[str] = None) -> int:
+def main(
+    vault_path: str,
+    single_file: Optional[str] = None,
+    collection: Optional[EntityCollection] = None,
+    use_cache: bool = True,
+) -> int:
     """메인 검증 함수"""
     vault_root = Path(vault_path).resolve()
 
@@ -163,15 +183,31 @@ def main(vault_path: str, single_file: Optional[str] = None) -> int:
     errors_found: List[Tuple[Path, List[str]]] = []
     files_checked = 0
 
-    for filepath in vault_root.rglob("*.md"):
-        if not should_validate(filepath, vault_root):
-            continue
+    if collection is None:
+        config = ScanConfig(INCLUDE_PATHS, EXCLUDE_PATHS, EXCLUDE_FILES)
+        collection = VaultScanner(vault_root, config, use_cache=use_cache).scan()
 
+    for vf in collection.select(prefix=INCLUDE_PATHS, exclude_prefix=EXCLUDE_PATHS, exclude_files=EXCLUDE_FILES):
         files_checked += 1
-        errors = check_file(filepath)
 
+        if vf.read_error:
+            errors_found.append((vf.filepath, [f"Read error: {vf.read_error}"]))
+            continue
+
+        fm = vf.frontmatter
+        if not fm or fm.get('entity_type') not in BODY_META_PATTERNS:
+            continue
+
+        # 본문은 검사 대상(Project/Task)만 읽음
+        try:
+            body = vf.read_body()
+        except Exception as e:
+            errors_found.append((vf.filepath, [f"Read error: {e}"]))
+            continue
+
+        errors = check_sync(fm, body)
         if errors:
-            errors_found.append((filepath, errors))
+            errors_found.append((vf.filepath, errors))
 
     # 결과 출력
     print(f"\n=== Frontmatter-Body Sync Report ===")
@@ -202,6 +238,7 @@ Usage:
 
 Options:
     --file <path>     Validate a single file only
+    --no-cache        Ignore the frontmatter cache (_build/.fm_cache.sqlite)
     --help            Show this help message
 
 Examples:
@@ -221,12 +258,16 @@ if __name__ == "__main__":
     # Parse arguments
     vault_path = "."
     single_file = None
+    use_cache = True
 
     i = 0
     while i < len(args):
         if args[i] == "--file" and i + 1 < len(args):
             single_file = args[i + 1]
             i += 2
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
         elif not args[i].startswith("-"):
             vault_path = args[i]
             i += 1
@@ -235,4 +276,4 @@ if __name__ == "__main__":
             print_usage()
             sys.exit(1)
 
-    sys.exit(main(vault_path, single_file))
+    sys.exit(main(vault_path, single_file, use_cache=use_cache))
@@ -1,20 +1,33 @@
 #!/usr/bin/env python3
 """
-LOOP Vault Orphan Checker v4.0
+LOOP Vault Orphan Checker v4.3
 고아 엔티티(끊어진 링크)를 검사합니다.
 
+변경사항 (v4.3):
+- 관계 필드(parent_id, project_id, hypothesis_id, outgoing_relations, validates, validated_by)를
+  shared.vault.relations registry로 검사 (build_graph_index.py와 공유)
+
+변경사항 (v4.2):
+- 엔티티를 shared.vault.Entity (__slots__)로 처리
+
+변경사항 (v4.1):
+- shared.vault 스캐너로 엔티티 수집
+- frontmatter 캐시 사용, --no-cache 옵션
+
 변경사항 (v4.0):
 - conditions_3y 참조 검사 추가
 - 블로킹 모드: 오류 발견 시 커밋 차단 (return 1)
 """
 
-import os
 import re
 import sys
-import yaml
 from pathlib import Path
-from typing import Dict, List, Set, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import Entity, EntityCollection, ScanConfig, VaultScanner
+from shared.vault.relations import dangling_references, relation_fields, relation_pairs
 
 # === 설정 ===
 INCLUDE_PATHS = [
@@ -26,139 +39,65 @@ INCLUDE_PATHS = [
 ]
 
 
-def extract_frontmatter(content: str) -> Optional[Dict]:
-    """마크다운에서 YAML frontmatter 추출"""
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1))
-        except yaml.YAMLError:
-            return None
-    return None
-
-
-def collect_entities(vault_root: Path) -> Dict[str, Dict]:
-    """모든 엔티티 수집"""
-    entities = {}
-
-    for filepath in vault_root.rglob("*.md"):
-        relative = str(filepath.relative_to(vault_root))
-
-        # 포함 경로 체크
-        should_include = any(relative.startswith(inc) for inc in INCLUDE_PATHS)
-        if not should_include:
-            continue
-
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception:
-            continue
-
-        frontmatter = extract_frontmatter(content)
-        if frontmatter and "entity_id" in frontmatter:
-            entity_id = frontmatter["entity_id"]
-            entities[entity_id] = {
-                "filepath": filepath,
-                "frontmatter": frontmatter
-            }
-
-    return entities
-
-
-def check_orphans(entities: Dict[str, Dict]) -> List[str]:
-    """고아 엔티티 검사"""
-    warnings = []
-    all_ids = set(entities.keys())
-
-    for entity_id, data in entities.items():
-        fm = data["frontmatter"]
-        filepath = data["filepath"]
-
-        # parent_id 검사
-        parent_id = fm.get("parent_id")
-        if parent_id and parent_id not in all_ids:
-            warnings.append(f"{entity_id}: parent_id '{parent_id}' does not exist")
-
-        # project_id 검사 (Task)
-        project_id = fm.get("project_id")
-        if project_id and project_id not in all_ids:
-            warnings.append(f"{entity_id}: project_id '{project_id}' does not exist")
-
-        # hypothesis_id 검사 (Experiment)
-        hypothesis_id = fm.get("hypothesis_id")
-        if hypothesis_id and hypothesis_id not in all_ids:
-            warnings.append(f"{entity_id}: hypothesis_id '{hypothesis_id}' does not exist")
-
-        # validates 검사
-        validates = fm.get("validates", [])
-        if isinstance(validates, list):
-            for v in validates:
-                if isinstance(v, str) and v not in all_ids:
-                    warnings.append(f"{entity_id}: validates target '{v}' does not exist")
-
-        # outgoing_relations 검사
-        relations = fm.get("outgoing_relations", [])
-        if isinstance(relations, list):
-            for rel in relations:
-                if isinstance(rel, dict):
-                    target = rel.get("target_id")
-                    if target and target not in all_ids:
-                        # action: 같은 특수 타겟은 스킵
-                        if not target.startswith("action:"):
-                            warnings.append(f"{entity_id}: relation target '{target}' does not exist")
+def collect_entities(vault_root: Path, collection: Optional[EntityCollection] = None) -> Dict[str, Entity]:
+    """모든 엔티티 수집 (collection이 주어지면 재스캔하지 않음)"""
+    if collection is None:
+        collection = VaultScanner(vault_root, ScanConfig(include_paths=INCLUDE_PATHS)).scan()
+
+    # frontmatter 키를 읽는 관계가 등록돼 있으면 원본 dict 보관 (엔티티마다 파일을 다시 읽지 않음)
+    return collection.entity_map(prefix=INCLUDE_PATHS, keep_frontmatter=bool(relation_fields()))
+
+
+def check_orphans(entities: Dict[str, Entity]) -> List[str]:
+    """고아 엔티티 검사 (관계 필드는 shared.vault.relations registry 기준)"""
+    warnings = [
+        f"{entity_id}: {relation.label} '{referenced_id}' does not exist"
+        for entity_id, relation, referenced_id in dangling_references(entities)
+    ]
+
+    for entity_id, entity in entities.items():
+        # relation 리스트의 문자열이 아닌 id (registry는 에지로 쓰지 않고 무시)
+        relations = entity.outgoing_relations
+        targets = tuple(target for _, target in relations) if isinstance(relations, tuple) else ()
+        for field, values in (
+            ("validates", entity.validates),
+            ("validated_by", entity.validated_by),
+            ("outgoing_relations target_id", targets),
+        ):
+            if isinstance(values, tuple):
+                for value in values:
+                    if value and not isinstance(value, str):
+                        warnings.append(f"{entity_id}: {field} contains non-string ID {value!r}")
 
         # conditions_3y 검사 (cond-* ID가 존재하는지)
-        conditions_3y = fm.get("conditions_3y", [])
-        if isinstance(conditions_3y, list):
+        conditions_3y = entity.conditions_3y
+        if isinstance(conditions_3y, tuple):
             for cond_id in conditions_3y:
-                if isinstance(cond_id, str) and cond_id not in all_ids:
+                if isinstance(cond_id, str) and cond_id not in entities:
                     # cond-a-e 중 아직 문서가 없는 것도 있으므로 유효한 패턴인지 체크
-                    import re
                     if not re.match(r'^cond-[a-e]$', cond_id):
                         warnings.append(f"{entity_id}: conditions_3y contains invalid ID '{cond_id}'")
 
     return warnings
 
 
-def check_symmetric_links(entities: Dict[str, Dict]) -> List[str]:
+def check_symmetric_links(entities: Dict[str, Entity]) -> List[str]:
     """validates/validated_by 대칭성 검사"""
     warnings = []
-
-    # validates 관계 수집
-    validates_map = defaultdict(set)  # entity -> set of hypotheses it validates
-    validated_by_map = defaultdict(set)  # hypothesis -> set of entities validating it
-
-    for entity_id, data in entities.items():
-        fm = data["frontmatter"]
-
-        # validates 수집
-        validates = fm.get("validates", [])
-        if isinstance(validates, list):
-            for v in validates:
-                if isinstance(v, str):
-                    validates_map[entity_id].add(v)
-
-        # validated_by 수집
-        validated_by = fm.get("validated_by", [])
-        if isinstance(validated_by, list):
-            for v in validated_by:
-                if isinstance(v, str):
-                    validated_by_map[entity_id].add(v)
+    pairs = relation_pairs(entities, ("validates", "validated_by"))
 
     # 대칭성 검사: A.validates contains B -> B.validated_by should contain A
-    for entity_id, targets in validates_map.items():
-        for target in targets:
-            if target in entities:
-                if entity_id not in validated_by_map.get(target, set()):
-                    warnings.append(
-                        f"Asymmetric link: {entity_id} validates {target}, "
-                        f"but {target}.validated_by doesn't include {entity_id}"
-                    )
+    for entity_id, target in sorted(pairs["validates"] - pairs["validated_by"], key=str):
+        if target in entities:
+            warnings.append(
+                f"Asymmetric link: {entity_id} validates {target}, "
+                f"but {target}.validated_by doesn't include {entity_id}"
+            )
 
     return warnings
 
 
-def main(vault_path: str) -> int:
+def main(vault_path: str, collection: Optional[EntityCollection] = None, use_cache: bool = True) -> int:
     """메인 함수"""
     vault_root = Path(vault_path).resolve()
 
@@ -167,7 +106,11 @@ def main(vault_path: str) -> int:
         return 1
 
     print("Collecting entities...")
-    entities = collect_entities(vault_root)
+    if collection is None:
+        collection = VaultScanner(vault_root, ScanConfig(include_paths=INCLUDE_PATHS), use_cache=use_cache).scan()
+        if collection.cache_stats:
+            print(f"  Frontmatter cache: {collection.cache_stats}")
+    entities = collect_entities(vault_root, collection)
     print(f"Found {len(entities)} entities")
 
     print("\nChecking orphans...")
@@ -196,5 +139,8 @@ def main(vault_path: str) -> int:
 
 
 if __name__ == "__main__":
-    vault_path = sys.argv[1] if len(sys.argv) > 1 else "."
-    sys.exit(main(vault_path))
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args  # --no-cache: frontmatter 캐시 무시하고 전체 재파싱
+    positional = [a for a in args if not a.startswith("-")]
+    vault_path = positional[0] if positional else "."
+    sys.exit(main(vault_path, use_cache=use_cache))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Graph Diff v1.0
+
+두 graph.json 스냅샷의 변경분 (노드 추가/삭제/변경, status 전이, 에지 추가/삭제)을 출력합니다.
+Discord digest, n8n 알림은 --json 출력의 변경분만 사용하면 됩니다.
+
+- 비교 로직: shared.vault.graph_diff.diff_graphs (노드 content hash, O(노드 + 에지))
+- --rev REV: 이전 graph를 git REV의 _build/graph.json으로 (nas-git-sync.sh가 커밋한 마지막 빌드 대비)
+
+Usage:
+    python3 scripts/graph_diff.py OLD.json NEW.json
+    python3 scripts/graph_diff.py --rev HEAD [--vault .]        # 마지막 커밋 대비 현재 _build/graph.json
+    python3 scripts/graph_diff.py --rev HEAD~1 --json > delta.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault.graph_diff import GraphDiff, diff_graphs
+
+GRAPH_PATH = "_build/graph.json"
+DEFAULT_LIMIT = 20
+
+
+def load_graph(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_graph_at_rev(vault_root: Path, rev: str) -> Dict[str, Any]:
+    """git REV 시점의 _build/graph.json
+
+    Raises:
+        RuntimeError: git 실행 실패 또는 REV에 파일 없음
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(vault_root), "show", f"{rev}:{GRAPH_PATH}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(f"git show {rev}:{GRAPH_PATH} failed: {e}") from e
+    return json.loads(result.stdout.decode("utf-8"))
+
+
+def print_report(diff: GraphDiff, limit: int) -> None:
+    print(f"=== Graph Diff ({diff.old_generated} → {diff.new_generated}) ===")
+    for key, count in diff.summary().items():
+        print(f"{key}: {count}")
+
+    sections = [
+        ("Added nodes", [f"{n['id']} ({n.get('type')}) {n.get('name') or ''}" for n in diff.added_nodes]),
+        ("Removed nodes", [f"{n['id']} ({n.get('type')}) {n.get('name') or ''}" for n in diff.removed_nodes]),
+        ("Status transitions", [f"{t['id']} ({t['type']}): {t['from']} → {t['to']}" for t in diff.status_transitions]),
+        ("Changed nodes", [f"{c['id']}: {', '.join(c['changes'])}" for c in diff.changed_nodes]),
+        ("Added edges", [f"{e['source']} -{e['type']}-> {e['target']}" for e in diff.added_edges]),
+        ("Removed edges", [f"{e['source']} -{e['type']}-> {e['target']}" for e in diff.removed_edges]),
+    ]
+    for title, lines in sections:
+        if not lines:
+            continue
+        print(f"\n--- {title} ---")
+        for line in lines[:limit]:
+            print(f"  - {line}")
+        if len(lines) > limit:
+            print(f"  ... and {len(lines) - limit} more")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two graph.json snapshots")
+    parser.add_argument("graphs", nargs="*", help="OLD.json NEW.json (with --rev: [NEW.json])")
+    parser.add_argument("--rev", help="Use _build/graph.json at this git revision as the previous graph")
+    parser.add_argument("--vault", default=".", help="Vault root for --rev and the default current graph")
+    parser.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Items listed per section (text output)")
+    args = parser.parse_args(argv)
+
+    vault_root = Path(args.vault).resolve()
+    if args.rev:
+        if len(args.graphs) > 1:
+            parser.error("with --rev pass at most one graph path (the current graph)")
+        old_path = None
+        new_path = Path(args.graphs[0]) if args.graphs else vault_root / GRAPH_PATH
+    else:
+        if len(args.graphs) != 2:
+            parser.error("pass OLD.json NEW.json, or use --rev")
+        old_path, new_path = (Path(p) for p in args.graphs)
+
+    try:
+        old = load_graph_at_rev(vault_root, args.rev) if old_path is None else load_graph(old_path)
+        new = load_graph(new_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    diff = diff_graphs(old, new)
+    if args.json:
+        json.dump(diff.to_dict(), sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        print_report(diff, args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
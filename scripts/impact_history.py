@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+LOOP Impact History v1.0
+
+build_impact.py가 빌드마다 쌓는 _build/impact_history.jsonl에서
+Condition/Track/Project 점수의 시계열을 조회합니다 (인덱스만 읽음, git 히스토리 재생 불필요).
+
+- series 이름: summary/<field>, condition/<id>/<field>, track/<id>/<field>, project/<id>/<field>
+  (condition: expected_sum, realized_sum, project_count / track: expected_sum, realized_sum /
+  project: expected_score, realized_score, evidence_count)
+- --by day|week|month: 구간별 값 (구간 끝 기준 마지막 빌드의 값), 없으면 값이 바뀐 빌드만 출력
+- --model-version / --script-version: 해당 버전으로 만든 snapshot만 사용
+
+Usage:
+    python3 scripts/impact_history.py . condition/cond-b/realized_sum --by week --since 2026-01
+    python3 scripts/impact_history.py . summary/total_expected --since 2026-03 --until 2026-06
+    python3 scripts/impact_history.py . --list-series condition/
+    python3 scripts/impact_history.py . --snapshots
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.impact.history import PERIODS, HistoryError, ImpactHistory
+
+
+def format_value(value) -> str:
+    return "-" if value is None else f"{value:g}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Query the impact.json history recorded by build_impact.py")
+    parser.add_argument("vault", help="Vault root")
+    parser.add_argument("series", nargs="?", help="Series name, e.g. condition/cond-b/realized_sum")
+    parser.add_argument("--by", choices=PERIODS, help="Resample to one value per period")
+    parser.add_argument("--since", help="Start (YYYY, YYYY-MM, YYYY-MM-DD or ISO datetime)")
+    parser.add_argument("--until", help="End, inclusive (same formats as --since)")
+    parser.add_argument("--model-version", help="Only use snapshots built with this model_version")
+    parser.add_argument("--script-version", help="Only use snapshots built with this script_version")
+    parser.add_argument("--list-series", metavar="PREFIX", nargs="?", const="", help="List recorded series names")
+    parser.add_argument("--snapshots", action="store_true", help="List recorded snapshots")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args(argv)
+
+    build_dir = Path(args.vault).resolve() / "_build"
+    try:
+        history = ImpactHistory(build_dir)
+    except HistoryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not history.snapshots:
+        print(f"No history recorded yet: {history.log_path} (run build_impact.py)", file=sys.stderr)
+        return 1
+
+    if args.snapshots:
+        rows = [
+            {"generated": s.generated, "model_version": s.model_version, "script_version": s.script_version}
+            for s in history.snapshots
+        ]
+        if args.json:
+            json.dump(rows, sys.stdout, indent=2, ensure_ascii=False)
+            print()
+        else:
+            for row in rows:
+                print(f"{row['generated']}  {row['model_version']}  {row['script_version']}")
+        return 0
+
+    if args.list_series is not None:
+        for name in history.series_names(args.list_series):
+            print(name)
+        return 0
+
+    if not args.series:
+        parser.error("series name required (see --list-series)")
+
+    versions = {"model_version": args.model_version, "script_version": args.script_version}
+    try:
+        if args.by:
+            rows = [
+                {"period": label, "value": value}
+                for label, value in history.resample(args.series, args.by, args.since, args.until, **versions)
+            ]
+        else:
+            rows = [
+                {"generated": snapshot.generated, "value": value}
+                for snapshot, value in history.changes(args.series, args.since, args.until, **versions)
+            ]
+    except HistoryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        json.dump({"series": args.series, "rows": rows}, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+
+    print(f"=== {args.series} ({len(rows)} rows) ===")
+    for row in rows:
+        print(f"  {row.get('period') or row['generated']}  {format_value(row['value'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+LOOP Impact What-if Scenarios v1.0
+
+impact_model_config.yml의 magnitude_points / strength_multipliers를 바꾼 시나리오 N개를
+vault 1회 스캔으로 일괄 계산하고, baseline(현재 설정) 대비 Project/Condition/Track 순위 변화를 출력합니다.
+(기존: 설정 파일 수정 → build_impact.py 재실행, 시나리오마다 vault 재스캔)
+
+- impact.json은 쓰지 않음 (읽기 전용 비교)
+- 계산: shared.impact.scenarios.ScenarioBatch (점수표 조회 + 가중치 행렬 × 시나리오별 점수 벡터)
+- 기본은 순위가 바뀐 항목만 출력 (--all: 전체)
+
+Usage:
+    python3 scripts/impact_scenarios.py . scenarios.yml
+    python3 scripts/impact_scenarios.py . scenarios.yml --metric realized --kind condition --kind track
+    python3 scripts/impact_scenarios.py . scenarios.yml --json > whatif.json
+
+scenarios.yml:
+    scenarios:
+      - name: strategic-high-12
+        magnitude_points: {strategic: {high: 12}}
+      - name: weak-0.3
+        strength_multipliers: {weak: 0.3}
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.impact.scenarios import (
+    BASELINE_NAME,
+    RANK_KINDS,
+    Scenario,
+    ScenarioBatch,
+    ScenarioResult,
+    compare_ranks,
+    load_scenarios,
+)
+
+import build_impact
+
+DEFAULT_LIMIT = 30
+
+
+def format_change(change: int) -> str:
+    if change > 0:
+        return f"▲{change}"
+    if change < 0:
+        return f"▼{-change}"
+    return "="
+
+
+def print_table(kind: str, rows: List[Dict[str, Any]], names: List[str], show_all: bool, limit: int) -> None:
+    if not show_all:
+        rows = [row for row in rows if any(s["rank_change"] for s in row["scenarios"].values())]
+    print(f"\n--- {kind.capitalize()} rank changes ({len(rows)}) ---")
+    if not rows:
+        print("  (no rank changes)")
+        return
+
+    header = ["id", BASELINE_NAME] + names
+    lines = [header]
+    for row in rows[:limit]:
+        base = row["baseline"]
+        cells = [row["id"], f"#{base['rank']} ({base['score']:g})"]
+        for name in names:
+            s = row["scenarios"][name]
+            cells.append(f"#{s['rank']} {format_change(s['rank_change'])} ({s['score']:g})")
+        lines.append(cells)
+    widths = [max(len(line[col]) for line in lines) for col in range(len(header))]
+    for line in lines:
+        print(("  " + "  ".join(cell.ljust(width) for cell, width in zip(line, widths))).rstrip())
+    if len(rows) > limit:
+        print(f"  ... and {len(rows) - limit} more")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate impact_model_config.yml what-if scenarios in one pass")
+    parser.add_argument("vault", help="Vault root")
+    parser.add_argument("scenarios", help="Scenario YAML (overrides for magnitude_points / strength_multipliers)")
+    parser.add_argument("--metric", choices=("expected", "realized"), default="expected", help="Score used for ranking")
+    parser.add_argument("--kind", action="append", choices=RANK_KINDS, help="Tables to print (default: all)")
+    parser.add_argument("--all", action="store_true", help="Include rows whose rank did not change")
+    parser.add_argument("--json", action="store_true", help="Print totals and rank tables as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Rows per table (text output)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the frontmatter cache")
+    args = parser.parse_args(argv)
+
+    vault_root = Path(args.vault).resolve()
+    config = build_impact.load_config(vault_root)
+    try:
+        scenarios = load_scenarios(args.scenarios, config)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    # vault 1회 스캔, baseline 설정으로 레코드 구성 (시나리오는 점수만 다시 계산)
+    collection = build_impact.scan_projects_dir(vault_root, use_cache=not args.no_cache)
+    projects = build_impact.collect_projects(vault_root, collection)
+    evidence_map = build_impact.collect_evidence(vault_root, collection)
+    records = [
+        build_impact.build_project_impact(project_id, project, evidence_map.get(project_id, []), config)
+        for project_id, project in projects.items()
+    ]
+    records.sort(key=lambda x: x["expected_score"], reverse=True)
+
+    batch = ScenarioBatch(records, evidence_map, build_impact.TIER_POLICY)
+    results: List[ScenarioResult] = batch.evaluate([Scenario.from_config(BASELINE_NAME, config)] + scenarios)
+    kinds = args.kind or list(RANK_KINDS)
+    tables = {kind: compare_ranks(results, records, kind, args.metric) for kind in kinds}
+
+    if args.json:
+        json.dump({
+            "metric": args.metric,
+            "scenarios": [
+                {
+                    "name": result.name,
+                    "magnitude_points": result.scenario.magnitude_points,
+                    "strength_multipliers": result.scenario.strength_multipliers,
+                    **result.totals(),
+                }
+                for result in results
+            ],
+            "ranks": tables,
+        }, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+
+    print(f"=== What-if Scenarios ({len(records)} projects, metric: {args.metric}) ===")
+    for result in results:
+        totals = result.totals()
+        print(f"  {result.name}: expected {totals['total_expected']:g}, realized {totals['total_realized']:g}")
+    names = [result.name for result in results[1:]]
+    for kind in kinds:
+        print_table(kind, tables[kind], names, args.all, args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+LOOP Impact Window Sums v1.0
+
+_build/impact.json의 Project 레코드로 Condition/Track별 realized 합을 임의 기간으로 조회합니다.
+(vault 재스캔 없음, shared.impact.window_sums.WindowSums prefix sum 조회)
+
+- 기간: YYYY-MM, YYYY-QN, YYYY-HN, YYYY, "A..B" (A의 시작부터 B의 끝까지)
+- 분기/반기 window의 점수는 기간에 window 전체가 포함될 때만 합산
+- --window를 생략하면 Condition은 반기(Condition 평가 window), Track은 분기(Track 평가 window) 전체
+
+Usage:
+    python3 scripts/impact_windows.py .                                  # Condition 반기별
+    python3 scripts/impact_windows.py . --kind track                     # Track 분기별
+    python3 scripts/impact_windows.py . --window 2026-H1 --window 2025-11..2026-04
+    python3 scripts/impact_windows.py . --kind track --window 2026 --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.impact.engine import ImpactEngine
+from shared.impact.model import TIER_POLICY
+from shared.impact.window_sums import WINDOW_KINDS, WindowSums
+from shared.impact.windows import month_label
+
+# --window 생략 시 기본 기간 (LOOP_PHILOSOPHY: Track 분기, Condition 반기)
+DEFAULT_PERIOD = {"condition": ("H", 6), "track": ("Q", 3)}
+
+
+def default_windows(sums: WindowSums, kind: str) -> List[str]:
+    """데이터가 있는 연도 범위의 반기/분기 목록"""
+    if not sums.months:
+        return []
+    prefix, months = DEFAULT_PERIOD[kind]
+    return [
+        f"{month // 12}-{prefix}{month % 12 // months + 1}"
+        for month in range(sums.first_month, sums.last_month + 1, months)
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sum realized impact per condition/track over arbitrary windows")
+    parser.add_argument("vault", help="Vault root (reads _build/impact.json)")
+    parser.add_argument("--kind", choices=WINDOW_KINDS, default="condition", help="Rollup bucket type")
+    parser.add_argument("--window", action="append", help="YYYY-MM, YYYY-QN, YYYY-HN, YYYY or A..B (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Print sums as JSON")
+    args = parser.parse_args(argv)
+
+    impact_path = Path(args.vault).resolve() / "_build" / "impact.json"
+    try:
+        with open(impact_path, "r", encoding="utf-8") as f:
+            records = json.load(f)["projects"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: cannot read {impact_path} ({e}); run build_impact.py first", file=sys.stderr)
+        return 2
+
+    sums = WindowSums.from_engine(ImpactEngine(records, TIER_POLICY), args.kind)
+    windows = args.window or default_windows(sums, args.kind)
+    try:
+        table = {window: sums.window_sums(window) for window in windows}
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        json.dump({
+            "kind": args.kind,
+            "windows": {window: {key: round(value, 2) for key, value in row.items()} for window, row in table.items()},
+        }, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+
+    span = f"{month_label(sums.first_month)}..{month_label(sums.last_month)}" if sums.months else "no windows"
+    print(f"=== Realized impact by window ({args.kind}, {len(records)} projects, data {span}) ===")
+    if not windows:
+        print("  (no project has a window_id)")
+        return 0
+    lines = [[args.kind] + windows]
+    for key in sums.keys:
+        lines.append([key] + [f"{round(table[window][key], 2):g}" for window in windows])
+    widths = [max(len(line[col]) for line in lines) for col in range(len(lines[0]))]
+    for line in lines:
+        print(("  " + "  ".join(cell.ljust(width) for cell, width in zip(line, widths))).rstrip())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ Usage:
   python3 migrate_to_hash_id.py <vault_path> --dry-run     # Preview changes
   python3 migrate_to_hash_id.py <vault_path> --apply       # Apply migration
   python3 migrate_to_hash_id.py <vault_path> --rollback    # Rollback changes
+  python3 migrate_to_hash_id.py <vault_path> --validate [--jobs N]  # Validation only
 
 Features:
   - Deterministic hash generation (entity_name + created_date)
@@ -36,13 +37,18 @@ from typing import Dict, List, Optional, Set, Tuple
 
 import yaml
 
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import ScanConfig, VaultScanner
+
 
 class HashIdMigrator:
     """Migrates entity IDs from legacy sequential to Hash+Epoch format."""
 
-    def __init__(self, vault_path: Path, exec_vault_path: Optional[Path] = None):
+    def __init__(self, vault_path: Path, exec_vault_path: Optional[Path] = None, jobs: int = 1):
         self.vault_path = Path(vault_path)
         self.exec_vault_path = Path(exec_vault_path) if exec_vault_path else None
+        self.jobs = jobs
 
         # Mapping storage
         self.mapping_file = self.vault_path / "_build" / "id_mapping.json"
@@ -547,9 +553,12 @@ class HashIdMigrator:
         self.stats["exec_entities_updated"] = count
         print(f"✅ Exec vault entities updated: {count}")
 
-    def validate_migration(self) -> Dict:
+    def validate_migration(self, jobs: int = 1) -> Dict:
         """Phase C: Validate migration completeness.
 
+        50_Projects is scanned once with the shared vault scanner; with
+        jobs > 1 frontmatter parsing is spread over worker processes.
+
         Returns validation report dict.
         """
         print("\n[Phase C] Validating Migration...")
@@ -562,18 +571,29 @@ class HashIdMigrator:
             "success": True
         }
 
+        collection = VaultScanner(
+            self.vault_path, ScanConfig(include_paths=["50_Projects"]), jobs=jobs
+        ).scan()
+
         # 1. Check for remaining legacy IDs
-        projects_dir = self.vault_path / "50_Projects"
-        for md_file in projects_dir.rglob("*.md"):
+        valid_files = []
+        for vf in collection:
+            md_file = self.vault_path / vf.relative_path
+            error = vf.read_error or vf.parse_error
+            if error:
+                print(f"  ⚠️  Error validating {md_file}: {error}")
+                continue
+            valid_files.append(vf)
+
             try:
-                frontmatter, body = self.extract_frontmatter(md_file)
-                entity_id = frontmatter.get("entity_id", "")
+                entity_id = (vf.frontmatter or {}).get("entity_id", "")
 
                 if self.is_legacy_id(entity_id):
                     report["legacy_ids_found"].append(str(md_file))
                     report["success"] = False
 
                 # Check body for legacy IDs (excluding code blocks)
+                body = vf.read_body()
                 code_blocks, _ = self.extract_code_blocks(body)
                 pattern = r'\b(prj-\d{3}|tsk-\d{3}-\d{2})\b'
 
@@ -588,28 +608,22 @@ class HashIdMigrator:
                 print(f"  ⚠️  Error validating {md_file}: {e}")
 
         # 2. Check for orphaned tasks (project_id not found)
-        for task_file in projects_dir.rglob("Tasks/*.md"):
-            try:
-                frontmatter, _ = self.extract_frontmatter(task_file)
-                project_id = frontmatter.get("project_id")
-
-                if not project_id:
-                    continue
-
-                # Find parent project
-                project_found = False
-                for project_file in projects_dir.rglob("project.md"):
-                    pfm, _ = self.extract_frontmatter(project_file)
-                    if pfm.get("entity_id") == project_id:
-                        project_found = True
-                        break
+        project_ids = {
+            vf.frontmatter.get("entity_id")
+            for vf in valid_files
+            if vf.filepath.name == "project.md" and vf.frontmatter
+        }
+        for vf in valid_files:
+            if vf.filepath.parent.name != "Tasks" or not vf.frontmatter:
+                continue
+            project_id = vf.frontmatter.get("project_id")
 
-                if not project_found:
-                    report["orphaned_tasks"].append(str(task_file))
-                    report["success"] = False
+            if not project_id:
+                continue
 
-            except Exception as e:
-                print(f"  ⚠️  Error checking orphan {task_file}: {e}")
+            if project_id not in project_ids:
+                report["orphaned_tasks"].append(str(self.vault_path / vf.relative_path))
+                report["success"] = False
 
         # Print report
         if report["legacy_ids_found"]:
@@ -677,7 +691,7 @@ class HashIdMigrator:
             json.dump(mapping_data, f, indent=2, ensure_ascii=False)
 
         # Step 4: Phase C - Validation
-        report = self.validate_migration()
+        report = self.validate_migration(jobs=self.jobs)
 
         # Step 5: Print summary
         print("\n" + "=" * 60)
@@ -841,13 +855,25 @@ def main():
         action="store_true",
         help="Rollback migration using mapping file"
     )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Only run Phase C validation on the current vault"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for frontmatter parsing (0 = CPU count)"
+    )
 
     args = parser.parse_args()
 
     # Initialize migrator
     migrator = HashIdMigrator(
         vault_path=args.vault_path,
-        exec_vault_path=args.exec_vault
+        exec_vault_path=args.exec_vault,
+        jobs=args.jobs
     )
 
     # Execute based on mode
@@ -879,9 +905,14 @@ def main():
         # Rollback migration
         migrator.rollback_migration()
 
+    elif args.validate:
+        report = migrator.validate_migration(jobs=args.jobs)
+        if not report["success"]:
+            sys.exit(1)
+
     else:
         parser.print_help()
-        print("\n❌ Error: Specify --dry-run, --apply, or --rollback")
+        print("\n❌ Error: Specify --dry-run, --apply, --rollback, or --validate")
         sys.exit(1)
 
 
@@ -66,4 +66,11 @@ else
     exit 1
 fi
 
+# 4. Merkle tree 갱신 (로컬과 어긋남 비교용 _build/merkle.json, 실패해도 동기화는 완료)
+if python3 "$CODE_DIR/scripts/vault_merkle.py" "$VAULT_DIR" >> "$LOG_FILE" 2>&1; then
+    log "Merkle tree 갱신 완료"
+else
+    log "WARNING: Merkle tree 갱신 실패"
+fi
+
 log "=== Git Sync 완료 ==="
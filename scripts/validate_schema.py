@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 """
-LOOP Vault Schema Validator v7.3
+LOOP Vault Schema Validator v7.5
 모든 마크다운 파일의 frontmatter를 검증합니다.
 
+변경사항 (v7.5):
+- --jobs N 옵션: frontmatter 파싱을 N개 프로세스로 분산 (출력은 worker 수와 무관하게 동일)
+- --change-detect git 옵션: git index blob SHA 기반 캐시 재사용
+
+변경사항 (v7.4):
+- shared.vault 스캐너 사용 (freshness 체크와 검증이 한 번의 스캔을 공유)
+- frontmatter 캐시 (_build/.fm_cache.sqlite), --no-cache 옵션
+
 변경사항 (v7.3):
 - SSOT v1.3 가드레일 검증 추가
 - 가드1: Project.parent_id는 trk-*만 허용 (ERROR)
@@ -51,6 +59,11 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.utils.yaml_parser import safe_load
+from shared.vault import EntityCollection, ScanConfig, VaultFile, VaultScanner
+
 # ============================================
 # Load constants from YAML (Single Source of Truth)
 # ============================================
@@ -164,12 +177,19 @@ def extract_frontmatter(content: str) -> Optional[Dict]:
     match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
     if match:
         try:
-            return yaml.safe_load(match.group(1))
+            return safe_load(match.group(1))
         except yaml.YAMLError as e:
             return {"_parse_error": str(e)}
     return None
 
 
+def scanned_frontmatter(vf: VaultFile) -> Optional[Dict]:
+    """스캔 결과를 extract_frontmatter()와 같은 형식으로 변환"""
+    if vf.parse_error is not None:
+        return {"_parse_error": vf.parse_error}
+    return vf.frontmatter
+
+
 def validate_id_format(entity_id: str) -> Tuple[bool, str]:
     """ID 형식 검증 (하이픈 형식: ns-001, prj-001, tsk-001-01)"""
     if not entity_id or "-" not in entity_id:
@@ -474,7 +494,7 @@ SCHEMA_REGISTRY_PATH = "00_Meta/schema_registry.md"
 FRESHNESS_DAYS = 7
 
 
-def check_schema_freshness(vault_root: Path) -> Tuple[bool, List[str]]:
+def check_schema_freshness(vault_root: Path, collection: EntityCollection) -> Tuple[bool, List[str]]:
     """
     스키마 최신성 체크.
 
@@ -504,19 +524,19 @@ def check_schema_freshness(vault_root: Path) -> Tuple[bool, List[str]]:
     new_fields_found: Dict[str, Set[str]] = {}
     recent_files_count = 0
 
-    for filepath in vault_root.rglob("*.md"):
-        if not should_validate(filepath, vault_root):
+    for vf in collection.select(prefix=INCLUDE_PATHS, exclude_prefix=EXCLUDE_PATHS, exclude_files=EXCLUDE_FILES):
+        if vf.read_error:
             continue
-
-        file_mtime = filepath.stat().st_mtime
-        if file_mtime < cutoff_time:
+        try:
+            if vf.get_mtime() < cutoff_time:
+                continue
+        except OSError:
             continue
 
         recent_files_count += 1
 
         try:
-            content = filepath.read_text(encoding="utf-8")
-            frontmatter = extract_frontmatter(content)
+            frontmatter = scanned_frontmatter(vf)
             if not frontmatter:
                 continue
 
@@ -800,7 +820,15 @@ def _load_known_fields_from_yaml() -> None:
         }
 
 
-def main(vault_path: str, check_freshness: bool = True, single_file: Optional[str] = None) -> int:
+def main(
+    vault_path: str,
+    check_freshness: bool = True,
+    single_file: Optional[str] = None,
+    collection: Optional[EntityCollection] = None,
+    use_cache: bool = True,
+    jobs: int = 1,
+    change_detection: str = "mtime",
+) -> int:
     """메인 검증 함수"""
     global _SCHEMA_CONSTANTS, VALID_CONDITION_IDS, VALID_STATUSES, VALID_TASK_TYPES, VALID_TARGET_PROJECTS, VALID_PROGRAM_TYPES, VALID_ASSIGNEES
 
@@ -833,10 +861,19 @@ def main(vault_path: str, check_freshness: bool = True, single_file: Optional[st
             file_path = vault_root / file_path
         return validate_single_file(file_path, vault_root)
 
+    # 단일 패스 스캔 (freshness 체크와 검증이 같은 결과를 공유)
+    if collection is None:
+        config = ScanConfig(INCLUDE_PATHS, EXCLUDE_PATHS, EXCLUDE_FILES)
+        collection = VaultScanner(
+            vault_root, config, use_cache=use_cache, jobs=jobs, change_detection=change_detection
+        ).scan()
+        if collection.cache_stats:
+            print(f"Frontmatter cache: {collection.cache_stats}")
+
     # 스키마 최신성 체크
     if check_freshness:
         print("\n=== Schema Freshness Check ===")
-        is_fresh, messages = check_schema_freshness(vault_root)
+        is_fresh, messages = check_schema_freshness(vault_root, collection)
         for msg in messages:
             print(msg)
 
@@ -846,26 +883,21 @@ def main(vault_path: str, check_freshness: bool = True, single_file: Optional[st
     errors_found = []
     files_checked = 0
 
-    for filepath in vault_root.rglob("*.md"):
-        if not should_validate(filepath, vault_root):
-            continue
-
+    for vf in collection.select(prefix=INCLUDE_PATHS, exclude_prefix=EXCLUDE_PATHS, exclude_files=EXCLUDE_FILES):
         files_checked += 1
 
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception as e:
-            errors_found.append((filepath, [f"Read error: {e}"]))
+        if vf.read_error:
+            errors_found.append((vf.filepath, [f"Read error: {vf.read_error}"]))
             continue
 
-        frontmatter = extract_frontmatter(content)
+        frontmatter = scanned_frontmatter(vf)
         if frontmatter is None:
             # frontmatter 없는 파일은 스킵
             continue
 
-        errors = validate_file(filepath, frontmatter)
+        errors = validate_file(vf.filepath, frontmatter)
         if errors:
-            errors_found.append((filepath, errors))
+            errors_found.append((vf.filepath, errors))
 
     # 결과 출력
     print(f"\n=== Schema Validation Report ===")
@@ -898,6 +930,10 @@ Usage:
 Options:
     --file <path>     Validate a single file only
     --no-freshness    Skip schema freshness check
+    --no-cache        Ignore the frontmatter cache (_build/.fm_cache.sqlite)
+    --jobs <N>        Parse frontmatter with N worker processes (0 = CPU count)
+    --change-detect <mtime|git>
+                      Cache change detection backend (default: mtime)
     --help            Show this help message
 
 Examples:
@@ -919,6 +955,9 @@ if __name__ == "__main__":
     vault_path = "."
     single_file = None
     check_freshness = True
+    use_cache = True
+    jobs = 1
+    change_detection = "mtime"
 
     i = 0
     while i < len(args):
@@ -928,6 +967,15 @@ if __name__ == "__main__":
         elif args[i] == "--no-freshness":
             check_freshness = False
             i += 1
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 2
+        elif args[i] == "--change-detect" and i + 1 < len(args):
+            change_detection = args[i + 1]
+            i += 2
         elif not args[i].startswith("-"):
             vault_path = args[i]
             i += 1
@@ -936,4 +984,5 @@ if __name__ == "__main__":
             print_usage()
             sys.exit(1)
 
-    sys.exit(main(vault_path, check_freshness, single_file))
+    sys.exit(main(vault_path, check_freshness, single_file, use_cache=use_cache, jobs=jobs,
+                  change_detection=change_detection))
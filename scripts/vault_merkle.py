@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Merkle v1.0
+
+include 경로의 디렉토리별 Merkle hash tree를 _build/merkle.json에 갱신하고,
+다른 머신(NAS ↔ 로컬 SSD)의 merkle.json과 비교해 내용이 어긋난 파일을 찾습니다.
+(기존: 동기화 어긋남을 파일 목록/git status로 직접 비교)
+
+- leaf hash는 frontmatter 캐시에 (path, mtime_ns, size) 키로 저장, 변경된 파일만 다시 읽음
+- 비교는 root hash부터 hash가 다른 디렉토리로만 내려감 (shared.vault.merkle.diff_merkle)
+- --node DIR: 디렉토리 하나의 child hash만 출력 (ssh로 원격 tree를 한 단계씩 조회할 때)
+- 종료 코드: --compare에서 어긋난 파일이 있으면 1
+
+Usage:
+    python3 scripts/vault_merkle.py [vault_path] [--no-cache]
+    python3 scripts/vault_merkle.py . --compare /tmp/nas-merkle.json [--json]
+    ssh nas "cat /volume1/LOOP_CORE/vault/LOOP/_build/merkle.json" > /tmp/nas-merkle.json
+    ssh nas "python3 /volume1/LOOP_CLevel/dev/loop-code/scripts/vault_merkle.py /volume1/LOOP_CORE/vault/LOOP --node 50_Projects"
+
+NAS의 merkle.json은 nas-git-sync.sh가 동기화 후 갱신합니다.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault.cache import open_cache
+from shared.vault.merkle import (
+    MERKLE_FILENAME,
+    MerkleDiff,
+    MerkleError,
+    build_merkle,
+    diff_merkle,
+    load_merkle,
+    write_merkle,
+)
+
+DEFAULT_LIMIT = 50
+
+
+def print_report(diff: MerkleDiff, limit: int) -> None:
+    print(f"=== Merkle Compare ({diff.comparisons} comparisons, {diff.dirs_visited} dirs visited) ===")
+    if diff.is_empty:
+        print("✅ Trees match")
+        return
+    sections = [
+        ("Changed", diff.changed),
+        ("Local only", diff.local_only),
+        ("Remote only", diff.remote_only),
+    ]
+    for title, paths in sections:
+        if not paths:
+            continue
+        print(f"\n--- {title} ({len(paths)}) ---")
+        for path in paths[:limit]:
+            print(f"  - {path}")
+        if len(paths) > limit:
+            print(f"  ... and {len(paths) - limit} more")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Update and compare the vault Merkle tree")
+    parser.add_argument("vault", nargs="?", default=".", help="Vault root (default: .)")
+    parser.add_argument("--compare", metavar="MERKLE_JSON", help="Compare against another machine's merkle.json")
+    parser.add_argument("--node", metavar="DIR", help="Print one directory's child hashes as JSON (\"\" = root)")
+    parser.add_argument("--no-cache", action="store_true", help="Rehash every file (ignore the frontmatter cache)")
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Paths listed per section (text output)")
+    args = parser.parse_args(argv)
+
+    vault_root = Path(args.vault).resolve()
+    cache = None if args.no_cache else open_cache(vault_root)
+    try:
+        tree, stats = build_merkle(vault_root, cache=cache)
+    finally:
+        if cache:
+            cache.close()
+
+    build_dir = vault_root / "_build"
+    build_dir.mkdir(exist_ok=True)
+    merkle_path = build_dir / MERKLE_FILENAME
+    written = write_merkle(tree, merkle_path)
+
+    if args.node is not None:
+        directory = args.node.strip("/")
+        json.dump({"dir": directory, "children": tree.children(directory)}, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+
+    log = sys.stderr if args.json else sys.stdout
+    print(f"{'Saved' if written else 'Unchanged'}: {merkle_path} (root {tree.root[:12]}, {stats})", file=log)
+
+    if not args.compare:
+        return 0
+
+    try:
+        remote = load_merkle(args.compare)
+    except (OSError, MerkleError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    diff = diff_merkle(tree, remote)
+    if args.json:
+        json.dump(diff.to_dict(), sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        print_report(diff, args.limit)
+    return 0 if diff.is_empty else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Pre-commit Runner v1.0
+
+validate_schema → check_orphans → build_graph_index를 한 프로세스에서 실행합니다.
+Vault는 shared.vault 스캐너로 한 번만 순회/파싱하고 세 스크립트가 결과를 공유합니다.
+(기존 hook은 스크립트마다 rglob + YAML 파싱을 반복)
+
+Usage:
+    python3 scripts/vault_precommit.py [vault_path] [--no-cache] [--jobs N] [--change-detect mtime|git]
+
+Pre-commit hook 예시:
+    python3 scripts/vault_precommit.py . || exit 1
+    git add _Graph_Index.md
+"""
+
+import sys
+from pathlib import Path
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import VaultScanner
+
+import validate_schema
+import check_orphans
+import build_graph_index
+
+
+def main(vault_path: str, use_cache: bool = True, jobs: int = 1, change_detection: str = "mtime") -> int:
+    """메인 함수"""
+    vault_root = Path(vault_path).resolve()
+
+    if not vault_root.exists():
+        print(f"Error: Vault path does not exist: {vault_root}")
+        return 1
+
+    # 단일 스캔 (include 전체, exclude는 각 스크립트가 select 시 적용)
+    print("Scanning vault...")
+    collection = VaultScanner(
+        vault_root, use_cache=use_cache, jobs=jobs, change_detection=change_detection
+    ).scan()
+    print(f"Scanned {len(collection)} files")
+    if collection.cache_stats:
+        print(f"Frontmatter cache: {collection.cache_stats}")
+
+    print("\n[1/3] Validating schema...")
+    if validate_schema.main(str(vault_root), collection=collection) != 0:
+        print("Schema validation failed. Commit aborted.")
+        return 1
+
+    # 기존 hook과 동일하게 orphan 경고는 커밋을 막지 않음
+    print("\n[2/3] Checking orphans...")
+    check_orphans.main(str(vault_root), collection=collection)
+
+    print("\n[3/3] Building graph index...")
+    if build_graph_index.main(str(vault_root), collection=collection) != 0:
+        print("Graph index build failed. Commit aborted.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args  # --no-cache: frontmatter 캐시 무시하고 전체 재파싱
+    jobs = 1
+    if "--jobs" in args:  # --jobs N: 병렬 파싱 worker 수 (0 = CPU 코어 수)
+        idx = args.index("--jobs")
+        jobs = int(args[idx + 1])
+        del args[idx:idx + 2]
+    change_detection = "mtime"
+    if "--change-detect" in args:  # --change-detect git: git index blob SHA로 변경 판단
+        idx = args.index("--change-detect")
+        change_detection = args[idx + 1]
+        del args[idx:idx + 2]
+    positional = [a for a in args if not a.startswith("-")]
+    vault_path = positional[0] if positional else "."
+    sys.exit(main(vault_path, use_cache=use_cache, jobs=jobs, change_detection=change_detection))
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+LOOP Vault Watch Daemon v1.0
+
+include 경로를 감시하며 파싱된 엔티티를 메모리에 유지하고,
+파일 생성/수정/삭제/이동이 생기면 바뀐 파일만 다시 파싱하여
+_Graph_Index.md, _build/graph.json, _build/impact.json을 수 초 내에 갱신합니다.
+(기존: cron/pre-commit에서 전체 재빌드, 최대 15분 지연)
+
+- Linux는 inotify (ctypes, 추가 의존성 없음), 그 외/실패 시 polling으로 fallback
+- debounce: 마지막 이벤트 후 --debounce초 동안 조용하면 1회 재빌드
+  (n8n이 파일을 연속으로 쓰는 경우에도 재빌드 1회, 단 --max-delay초는 넘기지 않음)
+- impact.json은 50_Projects 변경이 있을 때만 재빌드
+- inotify 큐 overflow, 디렉토리 생성/삭제/이동 시 전체 목록 재동기화 (stat 비교)
+
+Usage:
+    python3 scripts/vault_watchd.py [vault_path] [--debounce SEC] [--max-delay SEC]
+                                    [--poll] [--interval SEC] [--no-impact] [--verbose]
+                                    [--no-cache] [--jobs N] [--change-detect mtime|git]
+"""
+
+import argparse
+import contextlib
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+# shared 모듈 import (scripts/ 상위 = repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.vault import (
+    EntityCollection,
+    ScanConfig,
+    VaultFile,
+    VaultScanner,
+    is_markdown_target,
+    load_scan_config,
+    walk_dirs,
+    walk_markdown,
+)
+
+import build_graph_index
+import build_impact
+
+DEFAULT_DEBOUNCE = 2.0
+DEFAULT_MAX_DELAY = 10.0
+DEFAULT_POLL_INTERVAL = 2.0
+
+IMPACT_PREFIX = "50_Projects"
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+@dataclass
+class WatchEvents:
+    """watcher 1회 poll 결과"""
+    paths: Set[str] = field(default_factory=set)  # 변경된 .md 상대 경로
+    resync: bool = False  # 전체 목록 재동기화 필요
+
+    def __bool__(self) -> bool:
+        return bool(self.paths) or self.resync
+
+
+# ============================================
+# Watchers
+# ============================================
+
+class InotifyWatcher:
+    """Linux inotify 기반 watcher (include 디렉토리마다 watch)"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+        | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    )
+    DIR_CHANGE_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, vault_root: Path, config: ScanConfig):
+        self.vault_root = vault_root
+        self.config = config
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = {}  # wd → 디렉토리 상대 경로
+        self.refresh()
+
+    def refresh(self) -> None:
+        """include 디렉토리 watch 재등록 (새 디렉토리 추가, 사라진 디렉토리 정리)"""
+        current = set(walk_dirs(self.vault_root, self.config.include_paths, self.config.exclude_paths))
+        for wd, relative in list(self.watches.items()):
+            if relative not in current:
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+        for relative in current:
+            path = self.vault_root / relative if relative else self.vault_root
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), self.WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = relative
+
+    def poll(self, timeout: float) -> WatchEvents:
+        events = WatchEvents()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return events
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            self._parse(data, events)
+        return events
+
+    def _parse(self, data: bytes, events: WatchEvents) -> None:
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                events.resync = True
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                events.resync = True
+                continue
+            if mask & self.IN_ISDIR:
+                if mask & self.DIR_CHANGE_MASK:
+                    events.resync = True
+                continue
+            relative = f"{directory}/{name}" if directory else name
+            if is_markdown_target(relative, self.config.include_paths, self.config.exclude_paths):
+                events.paths.add(relative)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """stat 비교 기반 fallback watcher"""
+
+    def __init__(self, vault_root: Path, config: ScanConfig, interval: float = DEFAULT_POLL_INTERVAL):
+        self.vault_root = vault_root
+        self.config = config
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for filepath in walk_markdown(self.vault_root, self.config.include_paths, self.config.exclude_paths):
+            try:
+                st = filepath.stat()
+            except OSError:
+                continue
+            snapshot[str(filepath.relative_to(self.vault_root))] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def refresh(self) -> None:
+        self.snapshot = self._snapshot()
+
+    def poll(self, timeout: float) -> WatchEvents:
+        time.sleep(max(timeout, self.interval))
+        current = self._snapshot()
+        events = WatchEvents()
+        for relative in current.keys() | self.snapshot.keys():
+            if current.get(relative) != self.snapshot.get(relative):
+                events.paths.add(relative)
+        self.snapshot = current
+        return events
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(vault_root: Path, config: ScanConfig, force_poll: bool, interval: float):
+    """inotify watcher, 사용 불가하면 polling watcher"""
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(vault_root, config)
+        except (OSError, AttributeError) as e:
+            log(f"inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(vault_root, config, interval)
+
+
+# ============================================
+# Resident entity state
+# ============================================
+
+class ResidentVault:
+    """메모리에 유지되는 스캔 결과 (relative_path → VaultFile)"""
+
+    def __init__(self, scanner: VaultScanner):
+        self.scanner = scanner
+        self.vault_root = scanner.vault_root
+        self.config = scanner.config
+        self.files: Dict[str, VaultFile] = {}
+        self.signatures: Dict[str, Tuple[int, int]] = {}
+
+    def load(self) -> EntityCollection:
+        collection = self.scanner.scan()
+        self.files = {vf.relative_path: vf for vf in collection}
+        self.signatures = {rel: self._signature(rel) for rel in self.files}
+        return collection
+
+    def _signature(self, relative: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = (self.vault_root / relative).stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def apply(self, relatives: Set[str]) -> Set[str]:
+        """변경된 경로만 다시 파싱 (사라진 파일은 제거), 실제로 바뀐 경로 반환"""
+        changed = set()
+        for relative in relatives:
+            signature = self._signature(relative)
+            if signature is None:
+                if self.files.pop(relative, None) is not None:
+                    self.signatures.pop(relative, None)
+                    changed.add(relative)
+                continue
+            if relative in self.files and self.signatures.get(relative) == signature:
+                continue  # touch 없이 이벤트만 중복된 경우
+            self.files[relative] = self.scanner.scan_file(self.vault_root / relative)
+            self.signatures[relative] = signature
+            changed.add(relative)
+        return changed
+
+    def resync(self) -> Set[str]:
+        """전체 목록 재동기화 (새/삭제/stat이 달라진 파일만 다시 파싱)"""
+        listed = {
+            str(p.relative_to(self.vault_root))
+            for p in walk_markdown(self.vault_root, self.config.include_paths, self.config.exclude_paths)
+        }
+        candidates = (listed ^ self.files.keys()) | {
+            rel for rel in listed & self.files.keys() if self._signature(rel) != self.signatures.get(rel)
+        }
+        return self.apply(candidates)
+
+    def collection(self) -> EntityCollection:
+        return EntityCollection(self.vault_root, self.files.values(), self.config)
+
+
+# ============================================
+# Daemon
+# ============================================
+
+class VaultWatchDaemon:
+    """감시 + debounce + 증분 재빌드 루프"""
+
+    def __init__(
+        self,
+        vault_root: Path,
+        debounce: float = DEFAULT_DEBOUNCE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        force_poll: bool = False,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        build_impact_json: bool = True,
+        verbose: bool = False,
+        scanner: Optional[VaultScanner] = None,
+    ):
+        self.vault_root = vault_root
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.force_poll = force_poll
+        self.interval = interval
+        self.build_impact_json = build_impact_json
+        self.verbose = verbose
+        self.scanner = scanner or VaultScanner(vault_root)
+        self.resident = ResidentVault(self.scanner)
+        self.running = True
+
+    def stop(self, *_args) -> None:
+        self.running = False
+
+    def _run_quiet(self, func, *args, **kwargs) -> int:
+        """빌드 스크립트 출력은 --verbose일 때만 표시"""
+        if self.verbose:
+            return func(*args, **kwargs)
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            result = func(*args, **kwargs)
+        if result != 0:
+            print(buffer.getvalue(), end="")
+        return result
+
+    def rebuild(self, impact: bool = True) -> None:
+        """메모리의 엔티티로 산출물 재생성"""
+        start = time.perf_counter()
+        collection = self.resident.collection()
+        self._run_quiet(build_graph_index.main, str(self.vault_root), collection=collection)
+        if impact and self.build_impact_json:
+            self._run_quiet(build_impact.main, str(self.vault_root), collection=collection)
+        elapsed = (time.perf_counter() - start) * 1000
+        log(f"Rebuilt artifacts ({len(collection)} files, impact={'yes' if impact and self.build_impact_json else 'no'}) in {elapsed:.0f} ms")
+
+    def run(self) -> int:
+        log(f"Scanning {self.vault_root} ...")
+        start = time.perf_counter()
+        collection = self.resident.load()
+        log(f"Loaded {len(collection)} files in {(time.perf_counter() - start) * 1000:.0f} ms")
+        if collection.cache_stats:
+            log(f"Frontmatter cache: {collection.cache_stats}")
+        self.rebuild()
+
+        watcher = create_watcher(self.vault_root, self.resident.config, self.force_poll, self.interval)
+        log(f"Watching with {type(watcher).__name__} (debounce {self.debounce}s, max delay {self.max_delay}s)")
+
+        pending: Set[str] = set()
+        resync = False
+        first_event = last_event = 0.0
+        try:
+            while self.running:
+                try:
+                    events = watcher.poll(timeout=min(0.5, self.debounce))
+                except InterruptedError:
+                    continue
+                now = time.monotonic()
+                if events:
+                    if not pending and not resync:
+                        first_event = now
+                    last_event = now
+                    pending |= events.paths
+                    resync = resync or events.resync
+
+                if not pending and not resync:
+                    continue
+                if now - last_event < self.debounce and now - first_event < self.max_delay:
+                    continue
+
+                if resync:
+                    watcher.refresh()
+                    changed = self.resident.resync() | self.resident.apply(pending)
+                else:
+                    changed = self.resident.apply(pending)
+                pending, resync = set(), False
+
+                if not changed:
+                    continue
+                log(f"{len(changed)} file(s) changed: {', '.join(sorted(changed)[:3])}{' ...' if len(changed) > 3 else ''}")
+                self.rebuild(impact=any(rel.startswith(IMPACT_PREFIX) for rel in changed))
+        finally:
+            watcher.close()
+        log("Stopped")
+        return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Watch the vault and rebuild derived artifacts incrementally")
+    parser.add_argument("vault_path", nargs="?", default=".")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                        help="Quiet period (seconds) before rebuilding")
+    parser.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY,
+                        help="Rebuild at the latest this many seconds after the first event")
+    parser.add_argument("--poll", action="store_true", help="Use the polling watcher instead of inotify")
+    parser.add_argument("--interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="Polling interval (seconds) for the polling watcher")
+    parser.add_argument("--no-impact", action="store_true", help="Do not rebuild _build/impact.json")
+    parser.add_argument("--verbose", action="store_true", help="Show build script output")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the frontmatter cache for the initial scan")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the initial scan")
+    parser.add_argument("--change-detect", default="mtime", help="Cache change detection backend (mtime|git)")
+    args = parser.parse_args(argv)
+
+    vault_root = Path(args.vault_path).resolve()
+    if not vault_root.exists():
+        print(f"Error: Vault path does not exist: {vault_root}")
+        return 1
+
+    scanner = VaultScanner(
+        vault_root,
+        load_scan_config(vault_root),
+        use_cache=not args.no_cache,
+        jobs=args.jobs,
+        change_detection=args.change_detect,
+    )
+    daemon = VaultWatchDaemon(
+        vault_root,
+        debounce=args.debounce,
+        max_delay=args.max_delay,
+        force_poll=args.poll,
+        interval=args.interval,
+        build_impact_json=not args.no_impact,
+        verbose=args.verbose,
+        scanner=scanner,
+    )
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    return daemon.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
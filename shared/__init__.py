@@ -4,6 +4,8 @@ LOOP Shared Module
 보안 무관 공통 코드를 관리합니다.
 - auth/: 인증 미들웨어, OAuth 검증, 스코프 체크
 - utils/: vault 유틸리티, YAML 파서
+- vault/: vault 단일 패스 스캐너, 엔티티 컬렉션
+- impact/: Impact 점수 롤업 엔진 (build_impact.py)
 - models/: 공통 Pydantic 모델
 
 exec/api에서 사용 시:
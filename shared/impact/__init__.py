@@ -0,0 +1,73 @@
+"""
+Impact Module
+
+build_impact.py의 Impact 점수 롤업 계산.
+- engine.py: ImpactEngine (Condition/Track 희소 가중치 행렬 × 점수 벡터, numpy 선택)
+- history.py: impact.json 시계열 히스토리 (append-only delta 로그 + 인덱스, scripts/impact_history.py)
+- incremental.py: 바뀐 Project가 건드리는 롤업 bucket만 다시 계산 (build_impact.py --incremental)
+- model.py: Expected/Realized 점수 공식, Tier 정책, 기본 설정
+- scenarios.py: what-if 시나리오 일괄 계산, 순위 변화 비교 (scripts/impact_scenarios.py)
+- window_sums.py: Condition/Track별 월 index prefix sum, 임의 기간 realized 합 O(1) 조회 (scripts/impact_windows.py)
+- windows.py: window_id 파싱, 분기/반기 key 변환, 월 index 범위
+"""
+
+from .engine import NUMPY_AVAILABLE, ImpactEngine, WeightMatrix
+from .history import HistoryError, HistorySnapshot, ImpactHistory, impact_series, series_key
+from .incremental import BucketIndex, RollupPatchError, patch_rollups, project_buckets
+from .model import (
+    DEFAULT_MAGNITUDE_POINTS,
+    DEFAULT_STRENGTH_MULTIPLIERS,
+    IMPACT_MODEL_VERSION,
+    TIER_POLICY,
+    calculate_expected_score,
+    calculate_realized_score,
+)
+from .scenarios import Scenario, ScenarioBatch, ScenarioResult, compare_ranks, load_scenarios
+from .window_sums import WindowSums
+from .windows import (
+    month_to_half,
+    month_index,
+    month_label,
+    month_to_quarter,
+    parse_window_id,
+    parse_window_range,
+    window_span,
+    window_to_half_key,
+    window_to_quarter_key,
+)
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "ImpactEngine",
+    "WeightMatrix",
+    "HistoryError",
+    "HistorySnapshot",
+    "ImpactHistory",
+    "impact_series",
+    "series_key",
+    "BucketIndex",
+    "RollupPatchError",
+    "patch_rollups",
+    "project_buckets",
+    "DEFAULT_MAGNITUDE_POINTS",
+    "DEFAULT_STRENGTH_MULTIPLIERS",
+    "IMPACT_MODEL_VERSION",
+    "TIER_POLICY",
+    "calculate_expected_score",
+    "calculate_realized_score",
+    "Scenario",
+    "ScenarioBatch",
+    "ScenarioResult",
+    "compare_ranks",
+    "load_scenarios",
+    "WindowSums",
+    "month_index",
+    "month_label",
+    "month_to_half",
+    "month_to_quarter",
+    "parse_window_id",
+    "parse_window_range",
+    "window_span",
+    "window_to_half_key",
+    "window_to_quarter_key",
+]
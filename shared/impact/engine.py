@@ -0,0 +1,343 @@
+"""
+Impact Rollup Engine
+
+Project 레코드의 condition_contributes / track_contributes / parent_id(primary track)를
+bucket × project 희소 가중치 행렬(COO)로 한 번 만들어 두고, Condition/Track 롤업을
+expected/realized 점수 벡터와의 행렬-벡터 곱으로 계산합니다.
+
+- 행렬 구조(어느 bucket에 어떤 project가 얼마의 weight로 들어가는지)는 점수와 무관하므로
+  점수만 바뀌는 재계산(what-if, 증분 빌드)은 곱셈만 다시 수행
+- realized_by_half / realized_by_quarter도 (bucket, 기간) 행을 가진 같은 형태의 행렬
+- project별 window (포맷, 첫 월 index)는 engine.windows에 보관 (임의 기간 합: window_sums.WindowSums)
+- numpy가 있으면 np.bincount (원소 순서대로 누적하므로 순수 Python 루프와 같은 합),
+  없으면 순수 Python 루프 (NUMPY_AVAILABLE)
+- 출력 dict 형식/순서는 기존 build_impact.calculate_condition_rollup / calculate_track_rollup과 동일
+
+Usage:
+    from shared.impact.engine import ImpactEngine
+
+    engine = ImpactEngine(project_records, TIER_POLICY)
+    conditions = engine.condition_rollup()
+    tracks = engine.track_rollup()
+
+    # 점수만 바꿔서 다시 계산 (구조 재사용)
+    sums = engine.condition_sums(expected=new_expected, realized=new_realized)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .windows import parse_window_id, window_span, window_to_half_key, window_to_quarter_key
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+TIERS = ("strategic", "enabling", "operational")
+
+
+@dataclass
+class WeightMatrix:
+    """bucket × project 희소 가중치 (COO, 원소 순서 = 기존 루프의 누적 순서)"""
+    keys: List[Any] = field(default_factory=list)
+    index: Dict[Any, int] = field(default_factory=dict)
+    rows: List[int] = field(default_factory=list)
+    cols: List[int] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+
+    def row(self, key: Any) -> int:
+        """bucket 행 번호 (처음 보면 등록)"""
+        idx = self.index.get(key)
+        if idx is None:
+            idx = self.index[key] = len(self.keys)
+            self.keys.append(key)
+        return idx
+
+    def add(self, key: Any, col: int, weight: float) -> None:
+        self.rows.append(self.row(key))
+        self.cols.append(col)
+        self.weights.append(float(weight))
+
+    def freeze(self) -> None:
+        """numpy 배열로 변환 (numpy가 없으면 그대로)"""
+        if NUMPY_AVAILABLE:
+            self.rows = np.asarray(self.rows, dtype=np.intp)
+            self.cols = np.asarray(self.cols, dtype=np.intp)
+            self.weights = np.asarray(self.weights, dtype=np.float64)
+
+    def matvec(self, vector: Sequence[float]) -> List[float]:
+        """bucket별 Σ weight × vector[project] (bucket 행 순서)"""
+        n = len(self.keys)
+        if NUMPY_AVAILABLE:
+            if not len(self.weights):
+                return [0.0] * n
+            values = self.weights * np.asarray(vector, dtype=np.float64)[self.cols]
+            return np.bincount(self.rows, weights=values, minlength=n).tolist()
+        sums = [0.0] * n
+        for row, col, weight in zip(self.rows, self.cols, self.weights):
+            sums[row] += vector[col] * weight
+        return sums
+
+    def matmat(self, vectors: Sequence[Sequence[float]]) -> List[List[float]]:
+        """여러 점수 벡터에 대한 matvec (numpy면 gather/곱셈을 한 번에 수행)"""
+        n = len(self.keys)
+        if NUMPY_AVAILABLE and len(vectors) and len(self.weights):
+            values = np.asarray(vectors, dtype=np.float64)[:, self.cols] * self.weights
+            return [np.bincount(self.rows, weights=row, minlength=n).tolist() for row in values]
+        return [self.matvec(vector) for vector in vectors]
+
+
+def _new_condition() -> Dict[str, Any]:
+    return {
+        "tier_distribution": dict.fromkeys(TIERS, 0),
+        "projects": [],            # (project index, weight)
+        "excluded_projects": [],
+        "realized_by_half": {},    # half key → [project id]
+    }
+
+
+def _new_track() -> Dict[str, Any]:
+    return {
+        "tier_distribution": dict.fromkeys(TIERS, 0),
+        "primary_projects": [],    # (project index, weight)
+        "secondary_projects": [],
+        "realized_by_quarter": {},  # quarter key → [project id]
+    }
+
+
+class ImpactEngine:
+    """Condition/Track 롤업 엔진
+
+    Args:
+        project_records: build_project_impact() 레코드 목록 (순서 = 누적 순서)
+        tier_policy: tier → {"include_in_rollup": bool, ...} (build_impact.TIER_POLICY)
+    """
+
+    def __init__(self, project_records: List[Dict], tier_policy: Dict[str, Dict]):
+        self.records = project_records
+        self.project_index = {record["id"]: i for i, record in enumerate(project_records)}
+
+        self.conditions: Dict[str, Dict[str, Any]] = {}
+        self.tracks: Dict[str, Dict[str, Any]] = {}
+        self.condition_matrix = WeightMatrix()
+        self.condition_half_matrix = WeightMatrix()
+        self.track_matrix = WeightMatrix()
+        self.track_quarter_matrix = WeightMatrix()
+        self.windows: List[Optional[Tuple[str, int]]] = []  # project별 (window 포맷, 첫 월 index)
+
+        for i, project in enumerate(project_records):
+            tier = project.get("tier", "enabling")
+            policy = tier_policy.get(tier, tier_policy["enabling"])
+            parsed_window = parse_window_id(project.get("window_id"))
+            self.windows.append(window_span(parsed_window))
+            self._add_conditions(i, project, tier, policy, window_to_half_key(parsed_window))
+            self._add_tracks(i, project, tier, policy, window_to_quarter_key(parsed_window))
+
+        for matrix in self.matrices():
+            matrix.freeze()
+
+    def matrices(self) -> Tuple[WeightMatrix, ...]:
+        return (self.condition_matrix, self.condition_half_matrix, self.track_matrix, self.track_quarter_matrix)
+
+    def _add_conditions(self, i: int, project: Dict, tier: str, policy: Dict, half_key: Optional[str]) -> None:
+        for c in project.get("condition_contributes", []):
+            if not isinstance(c, dict):
+                continue
+            cond_id = c.get("to", "")
+            weight = c.get("weight", 0)
+            if not cond_id:
+                continue
+
+            bucket = self.conditions.get(cond_id)
+            if bucket is None:
+                bucket = self.conditions[cond_id] = _new_condition()
+            if tier in bucket["tier_distribution"]:
+                bucket["tier_distribution"][tier] += 1
+
+            if not policy["include_in_rollup"]:
+                bucket["excluded_projects"].append({
+                    "id": project["id"],
+                    "name": project["name"],
+                    "tier": tier,
+                    "reason": "operational tier excluded from rollup",
+                })
+                continue
+
+            self.condition_matrix.add(cond_id, i, weight)
+            bucket["projects"].append((i, weight))
+            if half_key:
+                self.condition_half_matrix.add((cond_id, half_key), i, weight)
+                bucket["realized_by_half"].setdefault(half_key, []).append(project["id"])
+
+    def _add_tracks(self, i: int, project: Dict, tier: str, policy: Dict, quarter_key: Optional[str]) -> None:
+        primary_track = project.get("primary_track", "")
+        if primary_track:
+            bucket = self.tracks.get(primary_track)
+            if bucket is None:
+                bucket = self.tracks[primary_track] = _new_track()
+            if tier in bucket["tier_distribution"]:
+                bucket["tier_distribution"][tier] += 1
+            if policy["include_in_rollup"]:
+                # Primary Track은 암묵적 weight 1.0
+                self._add_track(bucket, "primary_projects", primary_track, i, project["id"], 1.0, quarter_key)
+
+        for tc in project.get("track_contributes", []):
+            if not isinstance(tc, dict):
+                continue
+            track_id = tc.get("to", "")
+            weight = tc.get("weight", 0)
+            if not track_id or not policy["include_in_rollup"]:
+                continue
+            bucket = self.tracks.get(track_id)
+            if bucket is None:
+                bucket = self.tracks[track_id] = _new_track()
+            self._add_track(bucket, "secondary_projects", track_id, i, project["id"], weight, quarter_key)
+
+    def _add_track(
+        self,
+        bucket: Dict[str, Any],
+        role: str,
+        track_id: str,
+        i: int,
+        project_id: str,
+        weight: float,
+        quarter_key: Optional[str],
+    ) -> None:
+        self.track_matrix.add(track_id, i, weight)
+        bucket[role].append((i, weight))
+        if quarter_key:
+            self.track_quarter_matrix.add((track_id, quarter_key), i, weight)
+            bucket["realized_by_quarter"].setdefault(quarter_key, []).append(project_id)
+
+    # === 점수 벡터 ===
+
+    def score_vectors(
+        self,
+        expected: Optional[Sequence[float]] = None,
+        realized: Optional[Sequence[float]] = None,
+    ) -> Tuple[Sequence[float], Sequence[float]]:
+        """기본값은 레코드의 expected_score / realized_score (레코드 순서)"""
+        if expected is None:
+            expected = [record["expected_score"] for record in self.records]
+        if realized is None:
+            realized = [record["realized_score"] for record in self.records]
+        return expected, realized
+
+    def condition_sums(
+        self,
+        expected: Optional[Sequence[float]] = None,
+        realized: Optional[Sequence[float]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Condition별 {"expected_sum", "realized_sum", "realized_by_half": {half: sum}} (반올림 전)"""
+        expected, realized = self.score_vectors(expected, realized)
+        return self._sums(
+            self.conditions, self.condition_matrix, self.condition_half_matrix,
+            expected, realized, "realized_by_half",
+        )
+
+    def track_sums(
+        self,
+        expected: Optional[Sequence[float]] = None,
+        realized: Optional[Sequence[float]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Track별 {"expected_sum", "realized_sum", "realized_by_quarter": {quarter: sum}} (반올림 전)"""
+        expected, realized = self.score_vectors(expected, realized)
+        return self._sums(
+            self.tracks, self.track_matrix, self.track_quarter_matrix,
+            expected, realized, "realized_by_quarter",
+        )
+
+    @staticmethod
+    def _sums(
+        buckets: Dict[str, Dict[str, Any]],
+        matrix: WeightMatrix,
+        period_matrix: WeightMatrix,
+        expected: Sequence[float],
+        realized: Sequence[float],
+        period_field: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        expected_sums = matrix.matvec(expected)
+        realized_sums = matrix.matvec(realized)
+        period_sums = period_matrix.matvec(realized)
+
+        result = {}
+        for bucket_id in buckets:
+            row = matrix.index.get(bucket_id)
+            result[bucket_id] = {
+                "expected_sum": 0.0 if row is None else expected_sums[row],
+                "realized_sum": 0.0 if row is None else realized_sums[row],
+                period_field: {},
+            }
+        for (bucket_id, period), total in zip(period_matrix.keys, period_sums):
+            result[bucket_id][period_field][period] = total
+        return result
+
+    # === JSON 출력 (impact.json conditions / tracks) ===
+
+    def _project_entry(self, i: int, weight: float, expected: Sequence[float], realized: Sequence[float]) -> Dict:
+        project = self.records[i]
+        return {
+            "id": project["id"],
+            "name": project["name"],
+            "tier": project.get("tier", "enabling"),
+            "weight": weight,
+            "expected": expected[i],
+            "realized": realized[i],
+            "window_id": project.get("window_id"),
+        }
+
+    def condition_rollup(
+        self,
+        expected: Optional[Sequence[float]] = None,
+        realized: Optional[Sequence[float]] = None,
+    ) -> Dict[str, Dict]:
+        """impact.json "conditions" (calculate_condition_rollup과 같은 형식)"""
+        expected, realized = self.score_vectors(expected, realized)
+        sums = self.condition_sums(expected, realized)
+        rollup = {}
+        for cond_id, bucket in self.conditions.items():
+            total = sums[cond_id]
+            rollup[cond_id] = {
+                "expected_sum": round(total["expected_sum"], 2),
+                "realized_sum": round(total["realized_sum"], 2),
+                "project_count": len(bucket["projects"]),
+                "projects": [self._project_entry(i, w, expected, realized) for i, w in bucket["projects"]],
+                "excluded_projects": list(bucket["excluded_projects"]),
+                "tier_distribution": dict(bucket["tier_distribution"]),
+                "realized_by_half": {
+                    half: {"sum": round(total["realized_by_half"][half], 2), "projects": list(ids)}
+                    for half, ids in bucket["realized_by_half"].items()
+                },
+            }
+        return rollup
+
+    def track_rollup(
+        self,
+        expected: Optional[Sequence[float]] = None,
+        realized: Optional[Sequence[float]] = None,
+    ) -> Dict[str, Dict]:
+        """impact.json "tracks" (calculate_track_rollup과 같은 형식)"""
+        expected, realized = self.score_vectors(expected, realized)
+        sums = self.track_sums(expected, realized)
+        rollup = {}
+        for track_id, bucket in self.tracks.items():
+            total = sums[track_id]
+            rollup[track_id] = {
+                "expected_sum": round(total["expected_sum"], 2),
+                "realized_sum": round(total["realized_sum"], 2),
+                "primary_projects": [
+                    self._project_entry(i, w, expected, realized) for i, w in bucket["primary_projects"]
+                ],
+                "secondary_projects": [
+                    self._project_entry(i, w, expected, realized) for i, w in bucket["secondary_projects"]
+                ],
+                "tier_distribution": dict(bucket["tier_distribution"]),
+                "realized_by_quarter": {
+                    quarter: {"sum": round(total["realized_by_quarter"][quarter], 2), "projects": list(ids)}
+                    for quarter, ids in bucket["realized_by_quarter"].items()
+                },
+            }
+        return rollup
@@ -0,0 +1,397 @@
+"""
+Impact History
+
+impact.json은 빌드마다 덮어쓰므로, 내용이 바뀐 빌드마다 Condition/Track/Project 점수를
+append-only 로그에 한 줄씩 쌓고 시계열로 조회합니다 (git 히스토리 재생 불필요).
+
+- _build/impact_history.jsonl: snapshot 1줄 = generated, model_version, script_version +
+  직전 snapshot 대비 바뀐 series 값만 (delta). series 이름은 처음 나올 때 한 번만 기록하고 이후 번호로 참조
+- _build/impact_history.idx.json: series별 변경 지점 (snapshot 번호, 값) + snapshot 목록 (시각/버전/로그 offset).
+  조회는 인덱스만 사용 (snapshot 디코딩 없음), 로그가 인덱스보다 길면 뒷부분만 읽어 인덱스 확장
+- 로그와 인덱스 모두 머신별 빌드 상태 (git 추적 제외): series 번호와 delta는 같은 로그의 앞줄에 의존하므로
+  다른 머신의 로그와 합치면 안 됨
+- 조회는 snapshot을 generated 순으로 정렬해서 사용 (시계가 되돌아간 빌드가 있어도 구간 계산이 맞도록)
+- series 이름: "summary/total_expected", "condition/cond-b/realized_sum", "track/trk-1/expected_sum",
+  "project/prj-001/realized_score" (값은 해당 시점 impact.json의 값, 사라진 항목은 None)
+
+Usage:
+    from shared.impact.history import ImpactHistory
+
+    history = ImpactHistory(vault_root / "_build")
+    history.append(impact_data)                     # build_impact.py (impact.json이 바뀐 경우)
+    history.resample("condition/cond-b/realized_sum", period="week", since="2026-01")
+
+CLI: scripts/impact_history.py
+"""
+
+import json
+import os
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..utils.artifact import write_bytes_if_changed
+
+HISTORY_FILENAME = "impact_history.jsonl"
+HISTORY_INDEX_FILENAME = "impact_history.idx.json"
+HISTORY_INDEX_VERSION = 1
+
+PERIODS = ("day", "week", "month")
+
+# impact.json에서 기록하는 값 (kind → 필드)
+SERIES_FIELDS = {
+    "summary": ("total_projects", "projects_with_impact", "projects_excluded", "projects_with_window",
+                "total_expected", "total_realized", "total_evidence"),
+    "condition": ("expected_sum", "realized_sum", "project_count"),
+    "track": ("expected_sum", "realized_sum"),
+    "project": ("expected_score", "realized_score", "evidence_count"),
+}
+
+
+class HistoryError(Exception):
+    """히스토리 로그 손상 또는 잘못된 조회"""
+
+
+@dataclass
+class HistorySnapshot:
+    """로그의 snapshot 하나 (빌드 1회)"""
+    generated: str
+    model_version: str
+    script_version: str
+    offset: int  # impact_history.jsonl 안의 byte offset
+
+    @property
+    def time(self) -> datetime:
+        return datetime.fromisoformat(self.generated)
+
+
+def series_key(kind: str, metric: str, entity_id: Optional[str] = None) -> str:
+    """series 이름 ("summary/total_expected", "condition/cond-b/realized_sum")"""
+    if kind == "summary":
+        return f"summary/{metric}"
+    return f"{kind}/{entity_id}/{metric}"
+
+
+def impact_series(impact_data: Dict[str, Any]) -> Dict[str, Union[int, float]]:
+    """impact.json 내용 → {series 이름: 값}"""
+    values: Dict[str, Union[int, float]] = {}
+    summary = impact_data.get("summary", {})
+    for metric in SERIES_FIELDS["summary"]:
+        if metric in summary:
+            values[series_key("summary", metric)] = summary[metric]
+    buckets = (
+        ("condition", impact_data.get("conditions", {}).items()),
+        ("track", impact_data.get("tracks", {}).items()),
+        ("project", ((record["id"], record) for record in impact_data.get("projects", []))),
+    )
+    for kind, items in buckets:
+        for entity_id, entry in items:
+            for metric in SERIES_FIELDS[kind]:
+                if metric in entry:
+                    values[series_key(kind, metric, entity_id)] = entry[metric]
+    return values
+
+
+def parse_bound(text: str, end: bool = False) -> datetime:
+    """조회 범위 경계 ("2026", "2026-01", "2026-01-15", ISO datetime)
+
+    end=True면 해당 연/월/일의 끝 (다음 구간 시작 직전)까지 포함하도록 다음 구간 시작을 반환합니다.
+    """
+    parts = text.split("-")
+    try:
+        if len(parts) == 1:
+            start = datetime(int(parts[0]), 1, 1)
+            return start.replace(year=start.year + 1) if end else start
+        if len(parts) == 2:
+            start = datetime(int(parts[0]), int(parts[1]), 1)
+            return _next_period_start(start, "month") if end else start
+        moment = datetime.fromisoformat(text)
+    except ValueError as e:
+        raise HistoryError(f"invalid date: {text}") from e
+    if end and len(text) <= 10:
+        return moment + timedelta(days=1)
+    return moment
+
+
+def period_start(moment: datetime, period: str) -> datetime:
+    day = datetime(moment.year, moment.month, moment.day)
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    raise HistoryError(f"unknown period: {period} (expected one of {', '.join(PERIODS)})")
+
+
+def _next_period_start(start: datetime, period: str) -> datetime:
+    if period == "day":
+        return start + timedelta(days=1)
+    if period == "week":
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def period_label(start: datetime, period: str) -> str:
+    if period == "week":
+        year, week, _ = date(start.year, start.month, start.day).isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == "month":
+        return start.strftime("%Y-%m")
+    return start.strftime("%Y-%m-%d")
+
+
+class ImpactHistory:
+    """impact_history.jsonl + 인덱스
+
+    인덱스가 없거나 로그보다 짧으면 로그의 나머지 부분을 읽어 확장합니다 (로그가 기준).
+    """
+
+    def __init__(self, build_dir: Union[str, Path]):
+        build_dir = Path(build_dir)
+        self.log_path = build_dir / HISTORY_FILENAME
+        self.index_path = build_dir / HISTORY_INDEX_FILENAME
+
+        self.keys: List[str] = []
+        self.key_ids: Dict[str, int] = {}
+        self.snapshots: List[HistorySnapshot] = []
+        # series별 변경 지점 (snapshot 번호 목록, 값 목록; 값 None = 해당 snapshot에서 사라짐)
+        self.change_snapshots: List[List[int]] = []
+        self.change_values: List[List[Any]] = []
+        self.log_size = 0
+
+        self._load_index()
+        if self._replay():
+            self._save_index()
+
+    # --- 인덱스 ---
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            log_size = self.log_path.stat().st_size
+        except (OSError, ValueError):
+            return
+        if index.get("version") != HISTORY_INDEX_VERSION or index.get("log_size", 0) > log_size:
+            return  # 버전 불일치 또는 로그가 잘림 → 로그 처음부터 재구성
+        snapshots = [HistorySnapshot(*snapshot) for snapshot in index["snapshots"]]
+        if snapshots and not self._log_matches(snapshots[-1]):
+            return  # 로그가 바뀜 (다른 로그로 교체 등) → 로그 처음부터 재구성
+        self.keys = index["keys"]
+        self.key_ids = {key: key_id for key_id, key in enumerate(self.keys)}
+        self.snapshots = snapshots
+        self.change_snapshots = [series[0] for series in index["series"]]
+        self.change_values = [series[1] for series in index["series"]]
+        self.log_size = index["log_size"]
+
+    def _log_matches(self, snapshot: HistorySnapshot) -> bool:
+        """인덱스의 마지막 snapshot이 로그의 같은 offset에 있는지"""
+        for offset, line in self._iter_log(snapshot.offset):
+            try:
+                return json.loads(line).get("generated") == snapshot.generated
+            except ValueError:
+                return False
+        return False
+
+    def _save_index(self) -> None:
+        index = {
+            "version": HISTORY_INDEX_VERSION,
+            "log_size": self.log_size,
+            "keys": self.keys,
+            "snapshots": [
+                [s.generated, s.model_version, s.script_version, s.offset] for s in self.snapshots
+            ],
+            "series": [list(series) for series in zip(self.change_snapshots, self.change_values)],
+        }
+        data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        write_bytes_if_changed(self.index_path, data)
+
+    def _iter_log(self, offset: int) -> Iterator[Tuple[int, bytes]]:
+        """offset 이후의 완전한 줄 (끝에 줄바꿈이 없는 마지막 줄 = 중단된 append, 무시)"""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        return
+                    yield offset, line
+                    offset += len(line)
+        except FileNotFoundError:
+            return
+
+    def _replay(self) -> bool:
+        """인덱스 이후의 로그 줄을 인덱스에 반영 (반영한 줄이 있으면 True)
+
+        Raises:
+            HistoryError: 손상된 로그 줄
+        """
+        replayed = False
+        for offset, line in self._iter_log(self.log_size):
+            try:
+                entry = json.loads(line)
+                self._apply(entry, offset)
+            except (ValueError, KeyError, TypeError, IndexError) as e:
+                raise HistoryError(f"{self.log_path}: corrupt entry at byte {offset}: {e}") from e
+            self.log_size = offset + len(line)
+            replayed = True
+        return replayed
+
+    def _apply(self, entry: Dict[str, Any], offset: int) -> None:
+        snapshot_no = len(self.snapshots)
+        self.snapshots.append(HistorySnapshot(
+            entry["generated"], entry["model_version"], entry["script_version"], offset,
+        ))
+        for key in entry.get("keys", []):
+            self.key_ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.change_snapshots.append([])
+            self.change_values.append([])
+        for key_id, value in entry.get("set", []):
+            self.change_snapshots[key_id].append(snapshot_no)
+            self.change_values[key_id].append(value)
+        for key_id in entry.get("unset", []):
+            self.change_snapshots[key_id].append(snapshot_no)
+            self.change_values[key_id].append(None)
+
+    # --- 기록 ---
+
+    def latest_values(self) -> Dict[str, Any]:
+        """마지막 snapshot의 {series 이름: 값} (사라진 series 제외)"""
+        return {
+            key: values[-1]
+            for key, values in zip(self.keys, self.change_values)
+            if values and values[-1] is not None
+        }
+
+    def append(self, impact_data: Dict[str, Any]) -> bool:
+        """impact.json 내용을 snapshot으로 추가 (직전 snapshot과 generated가 같으면 건너뜀)
+
+        Returns:
+            추가했으면 True
+        """
+        generated = impact_data.get("generated", "")
+        if self.snapshots and self.snapshots[-1].generated == generated:
+            return False
+
+        current = impact_series(impact_data)
+        previous = self.latest_values()
+        new_keys = [key for key in current if key not in self.key_ids]
+        base_id = len(self.keys)
+        key_ids = {key: base_id + i for i, key in enumerate(new_keys)}
+        key_ids.update(self.key_ids)
+
+        entry = {
+            "generated": generated,
+            "model_version": impact_data.get("model_version", ""),
+            "script_version": impact_data.get("script_version", ""),
+        }
+        if new_keys:
+            entry["keys"] = new_keys
+        changed = [[key_ids[key], value] for key, value in current.items() if previous.get(key) != value]
+        if changed:
+            entry["set"] = changed
+        removed = [self.key_ids[key] for key in previous if key not in current]
+        if removed:
+            entry["unset"] = removed
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+        # 중단된 append의 잘린 줄이 남아 있으면 잘라내고 이어 씀
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            if f.tell() != self.log_size:
+                f.truncate(self.log_size)
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(entry, self.log_size)
+        self.log_size += len(line)
+        self._save_index()
+        return True
+
+    # --- 조회 ---
+
+    def series_names(self, prefix: str = "") -> List[str]:
+        return sorted(key for key in self.keys if key.startswith(prefix))
+
+    def _key_id(self, key: str) -> int:
+        if key not in self.key_ids:
+            raise HistoryError(f"unknown series: {key}")
+        return self.key_ids[key]
+
+    def value_at(self, key: str, snapshot_no: int) -> Optional[Any]:
+        """snapshot 시점의 값 (없으면 None)"""
+        key_id = self._key_id(key)
+        pos = bisect_right(self.change_snapshots[key_id], snapshot_no)
+        return self.change_values[key_id][pos - 1] if pos else None
+
+    def _selected(self, model_version: Optional[str], script_version: Optional[str]) -> List[int]:
+        """버전 조건에 맞는 snapshot 번호 (generated 순, 같은 시각이면 로그 순)"""
+        selected = [
+            i for i, s in enumerate(self.snapshots)
+            if (model_version is None or s.model_version == model_version)
+            and (script_version is None or s.script_version == script_version)
+        ]
+        selected.sort(key=lambda i: self.snapshots[i].time)
+        return selected
+
+    def changes(
+        self,
+        key: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        model_version: Optional[str] = None,
+        script_version: Optional[str] = None,
+    ) -> List[Tuple[HistorySnapshot, Optional[Any]]]:
+        """범위 안에서 값이 바뀐 snapshot과 새 값 (since 직전 값이 있으면 since 이후 첫 snapshot에 포함)"""
+        key_id = self._key_id(key)
+        start = parse_bound(since) if since else None
+        stop = parse_bound(until, end=True) if until else None
+        result = []
+        last = None
+        for snapshot_no in self._selected(model_version, script_version):
+            snapshot = self.snapshots[snapshot_no]
+            moment = snapshot.time
+            if (start and moment < start) or (stop and moment >= stop):
+                continue
+            pos = bisect_right(self.change_snapshots[key_id], snapshot_no)
+            value = self.change_values[key_id][pos - 1] if pos else None
+            if not result or value != last:
+                result.append((snapshot, value))
+                last = value
+        return result
+
+    def resample(
+        self,
+        key: str,
+        period: str = "week",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        model_version: Optional[str] = None,
+        script_version: Optional[str] = None,
+    ) -> List[Tuple[str, Optional[Any]]]:
+        """구간(day/week/month)별 값 (구간이 끝날 때 기준 마지막 snapshot의 값, 빌드가 없던 구간은 이전 값 유지)
+
+        Returns:
+            [(구간 라벨, 값)] ("2026-W03", "2026-01", "2026-01-15"; 아직 값이 없던 구간은 None)
+        """
+        self._key_id(key)
+        selected = self._selected(model_version, script_version)
+        if not selected:
+            return []
+        times = [self.snapshots[i].time for i in selected]
+        start = period_start(parse_bound(since) if since else times[0], period)
+        stop = parse_bound(until, end=True) if until else times[-1] + timedelta(microseconds=1)
+
+        rows = []
+        while start < stop:
+            next_start = _next_period_start(start, period)
+            pos = bisect_right(times, min(next_start, stop) - timedelta(microseconds=1))
+            value = self.value_at(key, selected[pos - 1]) if pos else None
+            rows.append((period_label(start, period), value))
+            start = next_start
+        return rows
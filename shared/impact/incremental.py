@@ -0,0 +1,135 @@
+"""
+Incremental Impact Rollups
+
+바뀐 Project가 건드리는 Condition/Track bucket만 다시 계산하고 나머지 bucket은
+이전 impact.json의 값을 그대로 재사용합니다 (build_impact.py --incremental).
+
+의존 관계: evidence → project (evidence.project, build_impact.collect_evidence)
+           project → condition/track bucket (project_buckets, 기간 key는 bucket 안에서 계산)
+
+- bucket key 순서/멤버 순서는 전체 빌드와 같이 정렬된 project 레코드 순서의 첫 접근 순
+- 다시 계산하는 bucket은 그 bucket을 건드리는 project 레코드만으로 ImpactEngine을 구성
+  (합산 순서가 전체 빌드와 같으므로 expected_sum/realized_sum/realized_by_quarter 값도 같음)
+- 바뀌지 않은 project만 건드리는 bucket은 멤버/점수/상대 순서가 그대로이므로 재사용
+
+Usage:
+    from shared.impact.incremental import patch_rollups
+
+    conditions, tracks, touched = patch_rollups(
+        records, dirty_ids, previous_records, previous_conditions, previous_tracks, TIER_POLICY,
+    )
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .engine import ImpactEngine
+
+
+class RollupPatchError(Exception):
+    """이전 롤업과 레코드가 맞지 않아 패치할 수 없음"""
+
+
+def project_buckets(record: Dict, tier_policy: Dict[str, Dict]) -> Tuple[List[str], List[str]]:
+    """레코드가 건드리는 (condition id 목록, track id 목록) (ImpactEngine과 같은 규칙, 접근 순)
+
+    operational tier도 condition과 primary track의 tier_distribution에는 포함되므로 건드리는 것으로 봅니다.
+    """
+    tier = record.get("tier", "enabling")
+    policy = tier_policy.get(tier, tier_policy["enabling"])
+
+    conditions = [
+        c.get("to") for c in record.get("condition_contributes", [])
+        if isinstance(c, dict) and c.get("to")
+    ]
+    tracks = []
+    if record.get("primary_track"):
+        tracks.append(record["primary_track"])
+    if policy["include_in_rollup"]:
+        tracks.extend(
+            tc.get("to") for tc in record.get("track_contributes", [])
+            if isinstance(tc, dict) and tc.get("to")
+        )
+    return conditions, tracks
+
+
+@dataclass
+class BucketIndex:
+    """bucket → 건드리는 project id (레코드 순서, key 순서 = 전체 빌드의 bucket 순서)"""
+    conditions: Dict[str, List[str]] = field(default_factory=dict)
+    tracks: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict], tier_policy: Dict[str, Dict]) -> "BucketIndex":
+        index = cls()
+        for record in records:
+            conditions, tracks = project_buckets(record, tier_policy)
+            for buckets, target in ((conditions, index.conditions), (tracks, index.tracks)):
+                for bucket_id in buckets:
+                    members = target.setdefault(bucket_id, [])
+                    if not members or members[-1] != record["id"]:
+                        members.append(record["id"])
+        return index
+
+
+def patch_rollups(
+    records: List[Dict],
+    dirty_ids: Set[str],
+    previous_records: Dict[str, Dict],
+    previous_conditions: Dict[str, Dict],
+    previous_tracks: Dict[str, Dict],
+    tier_policy: Dict[str, Dict],
+) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, int]]:
+    """바뀐 project가 건드리는 bucket만 다시 계산한 conditions / tracks
+
+    Args:
+        records: 현재 project 레코드 (전체 빌드와 같은 정렬 순서)
+        dirty_ids: 추가/변경/삭제된 project id
+        previous_records: 이전 impact.json의 id → 레코드
+        previous_conditions / previous_tracks: 이전 impact.json의 conditions / tracks
+        tier_policy: build_impact.TIER_POLICY
+
+    Returns:
+        (conditions, tracks, {"conditions": 다시 계산한 수, "tracks": 다시 계산한 수})
+
+    Raises:
+        RollupPatchError: 재사용할 bucket이 이전 롤업에 없음 (이전 결과와 레코드 불일치)
+    """
+    current = {record["id"]: record for record in records}
+    touched_conditions: Set[str] = set()
+    touched_tracks: Set[str] = set()
+    for project_id in dirty_ids:
+        for record in (previous_records.get(project_id), current.get(project_id)):
+            if record is not None:
+                conditions, tracks = project_buckets(record, tier_policy)
+                touched_conditions.update(conditions)
+                touched_tracks.update(tracks)
+
+    index = BucketIndex.from_records(records, tier_policy)
+
+    # 다시 계산할 bucket의 멤버만으로 엔진 구성 (레코드 순서 유지)
+    members: Set[str] = set()
+    for bucket_id in touched_conditions:
+        members.update(index.conditions.get(bucket_id, ()))
+    for bucket_id in touched_tracks:
+        members.update(index.tracks.get(bucket_id, ()))
+    engine = ImpactEngine([record for record in records if record["id"] in members], tier_policy)
+    patched_conditions = engine.condition_rollup() if touched_conditions else {}
+    patched_tracks = engine.track_rollup() if touched_tracks else {}
+
+    def merge(order: Dict[str, List[str]], touched: Set[str], patched: Dict, previous: Dict, kind: str) -> Dict:
+        merged = {}
+        for bucket_id in order:
+            source: Optional[Dict] = patched if bucket_id in touched else previous
+            if bucket_id not in source:
+                raise RollupPatchError(f"{kind} '{bucket_id}' missing from previous impact.json")
+            merged[bucket_id] = source[bucket_id]
+        return merged
+
+    conditions = merge(index.conditions, touched_conditions, patched_conditions, previous_conditions, "condition")
+    tracks = merge(index.tracks, touched_tracks, patched_tracks, previous_tracks, "track")
+    touched = {
+        "conditions": len(touched_conditions & conditions.keys()),
+        "tracks": len(touched_tracks & tracks.keys()),
+    }
+    return conditions, tracks, touched
@@ -0,0 +1,102 @@
+"""
+Impact Score Model
+
+Expected/Realized 점수 공식과 Tier 정책 (build_impact.py, what-if 시나리오 공유).
+
+- ExpectedScore = magnitude_points[tier][magnitude] × confidence
+- RealizedScore = Σ(normalized_delta × strength_mult × attribution_share)
+"""
+
+from typing import Dict, List
+
+# === 기본 설정 (impact_model_config.yml 없을 경우) ===
+DEFAULT_MAGNITUDE_POINTS = {
+    "strategic": {"high": 10, "mid": 6, "low": 3},
+    "enabling": {"high": 5, "mid": 3, "low": 1.5},
+    "operational": {"high": 2, "mid": 1, "low": 0.5},
+}
+
+DEFAULT_STRENGTH_MULTIPLIERS = {
+    "strong": 1.0,
+    "medium": 0.7,
+    "weak": 0.4,
+}
+
+# 설정에 없는 evidence_strength의 배수
+DEFAULT_STRENGTH_MULTIPLIER = 0.7
+
+# Impact 모델 버전 (점수 변경 추적용)
+IMPACT_MODEL_VERSION = "IM-2025-01"
+
+# Tier별 계산 정책
+TIER_POLICY = {
+    "strategic": {
+        "calculate_expected": True,
+        "calculate_realized": True,
+        "include_in_rollup": True,
+    },
+    "enabling": {
+        "calculate_expected": True,
+        "calculate_realized": True,  # light realized (evidence 선택적)
+        "include_in_rollup": True,
+    },
+    "operational": {
+        "calculate_expected": False,  # Impact 계산 제외
+        "calculate_realized": False,
+        "include_in_rollup": False,
+    },
+}
+
+
+def magnitude_points_for(tier: str, magnitude: str, magnitude_points: Dict) -> float:
+    """magnitude_points[tier][magnitude] (없는 tier는 enabling, 없는 magnitude는 mid)"""
+    # tier 기본값
+    if tier not in magnitude_points:
+        tier = "enabling"
+
+    tier_points = magnitude_points.get(tier, {})
+
+    # magnitude 기본값
+    if magnitude not in tier_points:
+        magnitude = "mid"
+
+    return tier_points.get(magnitude, 3)
+
+
+def calculate_expected_score(
+    tier: str,
+    magnitude: str,
+    confidence: float,
+    magnitude_points: Dict,
+) -> float:
+    """Expected Score (A) 계산
+
+    ExpectedScore = magnitude_points[tier][magnitude] × confidence
+    """
+    score = magnitude_points_for(tier, magnitude, magnitude_points) * confidence
+    return round(score, 2)
+
+
+def calculate_realized_score(
+    evidence_list: List[Dict],
+    strength_multipliers: Dict,
+) -> tuple[float, int]:
+    """Realized Score (B) 계산
+
+    RealizedScore = Σ(normalized_delta × strength_mult × attribution_share)
+    """
+    if not evidence_list:
+        return 0.0, 0
+
+    total_score = 0.0
+
+    for ev in evidence_list:
+        delta = ev.get("normalized_delta", 0)
+        strength = ev.get("evidence_strength", "medium")
+        attribution = ev.get("attribution_share", 1.0)
+
+        strength_mult = strength_multipliers.get(strength, DEFAULT_STRENGTH_MULTIPLIER)
+        score = delta * strength_mult * attribution
+        total_score += score
+
+    return round(total_score, 2), len(evidence_list)
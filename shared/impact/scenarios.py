@@ -0,0 +1,335 @@
+"""
+Impact What-if Scenarios
+
+impact_model_config.yml의 magnitude_points / strength_multipliers를 바꾼 N개 시나리오를
+vault 1회 스캔 결과로 한 번에 계산하고, Project/Condition/Track 순위 변화를 비교합니다.
+(기존: 설정 파일 수정 → build_impact.py 재실행, 시나리오마다 vault 재스캔)
+
+- 시나리오 파일: 기준 설정(baseline)에 덮어쓸 값만 적음 (dict는 재귀 병합)
+- Expected: (tier, magnitude) 조합별 점수표 × confidence (조합 수 × 시나리오 수만 조회)
+- Realized: evidence별 normalized_delta × strength_mult × attribution_share를 project별 누적
+  (numpy가 있으면 시나리오 × evidence 행렬로 한 번에, 누적 순서는 calculate_realized_score와 같음)
+- Condition/Track 합계: ImpactEngine 가중치 행렬 × 시나리오별 점수 벡터 (WeightMatrix.matmat)
+
+시나리오 파일 예시:
+    scenarios:
+      - name: strategic-high-12
+        magnitude_points: {strategic: {high: 12}}
+      - name: weak-0.3
+        strength_multipliers: {weak: 0.3}
+
+Usage:
+    from shared.impact.scenarios import ScenarioBatch, load_scenarios
+
+    batch = ScenarioBatch(project_records, evidence_map)
+    results = batch.evaluate([baseline] + load_scenarios(path, config))
+    table = compare_ranks(results, "project", metric="expected")
+
+CLI: scripts/impact_scenarios.py
+"""
+
+import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+import yaml
+
+from ..utils.yaml_parser import safe_load
+from .engine import NUMPY_AVAILABLE, ImpactEngine
+from .model import (
+    DEFAULT_MAGNITUDE_POINTS,
+    DEFAULT_STRENGTH_MULTIPLIER,
+    DEFAULT_STRENGTH_MULTIPLIERS,
+    TIER_POLICY,
+    magnitude_points_for,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+BASELINE_NAME = "baseline"
+SCENARIO_KEYS = ("magnitude_points", "strength_multipliers")
+RANK_KINDS = ("project", "condition", "track")
+
+
+@dataclass
+class Scenario:
+    """점수 설정 하나 (impact_model_config.yml의 magnitude_points / strength_multipliers)"""
+    name: str
+    magnitude_points: Dict[str, Dict[str, float]] = field(default_factory=lambda: copy.deepcopy(DEFAULT_MAGNITUDE_POINTS))
+    strength_multipliers: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STRENGTH_MULTIPLIERS))
+
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, Any]) -> "Scenario":
+        return cls(
+            name=name,
+            magnitude_points=config.get("magnitude_points", DEFAULT_MAGNITUDE_POINTS),
+            strength_multipliers=config.get("strength_multipliers", DEFAULT_STRENGTH_MULTIPLIERS),
+        )
+
+
+def merge_config(base: Any, override: Any) -> Any:
+    """dict는 key별 재귀 병합, 그 외 값은 override로 교체 (base는 변경하지 않음)"""
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return copy.deepcopy(override)
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        merged[key] = merge_config(merged.get(key), value) if key in merged else copy.deepcopy(value)
+    return merged
+
+
+def load_scenarios(path: Union[str, Path], base_config: Dict[str, Any]) -> List[Scenario]:
+    """시나리오 YAML 로드 (각 시나리오는 base_config에 병합)
+
+    Args:
+        path: {"scenarios": [...]} 또는 시나리오 목록 YAML
+        base_config: 기준 설정 (build_impact.load_config 결과)
+
+    Returns:
+        Scenario 목록 (파일 순서)
+
+    Raises:
+        OSError: 파일 읽기 실패
+        ValueError: 형식 오류 (이름 없음/중복, 알 수 없는 key)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = safe_load(f.read())
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid scenario file: {e}") from e
+    if isinstance(data, dict):
+        data = data.get("scenarios")
+    if not isinstance(data, list) or not data:
+        raise ValueError("scenario file must contain a non-empty 'scenarios' list")
+
+    base = Scenario.from_config(BASELINE_NAME, base_config)
+    scenarios = []
+    names = {BASELINE_NAME}
+    for i, entry in enumerate(data):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ValueError(f"scenario #{i + 1}: 'name' is required")
+        name = str(entry["name"])
+        if name in names:
+            raise ValueError(f"scenario '{name}': duplicate name")
+        unknown = set(entry) - {"name"} - set(SCENARIO_KEYS)
+        if unknown:
+            raise ValueError(f"scenario '{name}': unknown keys {sorted(unknown)} (allowed: {', '.join(SCENARIO_KEYS)})")
+        names.add(name)
+        scenarios.append(Scenario(
+            name=name,
+            magnitude_points=merge_config(base.magnitude_points, entry.get("magnitude_points", {})),
+            strength_multipliers=merge_config(base.strength_multipliers, entry.get("strength_multipliers", {})),
+        ))
+    return scenarios
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 하나의 점수 (반올림 후, project는 레코드 순서)"""
+    scenario: Scenario
+    expected: List[float]
+    realized: List[float]
+    # id → {"expected_sum", "realized_sum"}
+    conditions: Dict[str, Dict[str, float]]
+    tracks: Dict[str, Dict[str, float]]
+
+    @property
+    def name(self) -> str:
+        return self.scenario.name
+
+    def totals(self) -> Dict[str, float]:
+        return {
+            "total_expected": round(sum(self.expected), 2),
+            "total_realized": round(sum(self.realized), 2),
+        }
+
+
+class ScenarioBatch:
+    """한 번 스캔한 Project/Evidence로 여러 시나리오를 일괄 계산
+
+    Args:
+        project_records: build_project_impact() 레코드 (baseline 설정으로 계산한 것, 구조만 사용)
+        evidence_map: project_id → evidence 목록 (build_impact.collect_evidence)
+        tier_policy: build_impact.TIER_POLICY
+    """
+
+    def __init__(
+        self,
+        project_records: List[Dict],
+        evidence_map: Dict[str, List[Dict]],
+        tier_policy: Dict[str, Dict] = TIER_POLICY,
+    ):
+        self.records = project_records
+        self.engine = ImpactEngine(project_records, tier_policy)
+
+        # Expected: (tier, magnitude) 조합 index + confidence
+        self.pairs: List[tuple] = []
+        pair_index: Dict[tuple, int] = {}
+        self.project_pair: List[int] = []
+        self.confidence: List[float] = []
+        self.calculate_expected: List[bool] = []
+        self.calculate_realized: List[bool] = []
+        for record in project_records:
+            pair = (record["tier"], record["impact_magnitude"])
+            if pair not in pair_index:
+                pair_index[pair] = len(self.pairs)
+                self.pairs.append(pair)
+            self.project_pair.append(pair_index[pair])
+            self.confidence.append(record["confidence"])
+            policy = tier_policy.get(record["tier"], tier_policy["enabling"])
+            self.calculate_expected.append(policy["calculate_expected"])
+            self.calculate_realized.append(policy["calculate_realized"])
+
+        # Realized: evidence 평탄화 (project 순서, project 안에서는 evidence 순서)
+        self.strengths: List[Any] = []
+        strength_index: Dict[Any, int] = {}
+        self.evidence_project: List[int] = []
+        self.evidence_delta: List[float] = []
+        self.evidence_strength: List[int] = []
+        self.evidence_attribution: List[float] = []
+        for i, record in enumerate(project_records):
+            if not self.calculate_realized[i]:
+                continue
+            for ev in evidence_map.get(record["id"], []):
+                strength = ev.get("evidence_strength", "medium")
+                if strength not in strength_index:
+                    strength_index[strength] = len(self.strengths)
+                    self.strengths.append(strength)
+                self.evidence_project.append(i)
+                self.evidence_delta.append(ev.get("normalized_delta", 0))
+                self.evidence_strength.append(strength_index[strength])
+                self.evidence_attribution.append(ev.get("attribution_share", 1.0))
+
+    def expected_scores(self, scenarios: Sequence[Scenario]) -> List[List[float]]:
+        """시나리오별 expected_score 벡터 (calculate_expected_score와 같은 값)"""
+        result = []
+        for scenario in scenarios:
+            table = [magnitude_points_for(tier, magnitude, scenario.magnitude_points) for tier, magnitude in self.pairs]
+            result.append([
+                round(table[pair] * confidence, 2) if calculate else 0.0
+                for pair, confidence, calculate in zip(self.project_pair, self.confidence, self.calculate_expected)
+            ])
+        return result
+
+    def realized_scores(self, scenarios: Sequence[Scenario]) -> List[List[float]]:
+        """시나리오별 realized_score 벡터 (calculate_realized_score와 같은 누적 순서)"""
+        n_projects = len(self.records)
+        multipliers = [
+            [scenario.strength_multipliers.get(strength, DEFAULT_STRENGTH_MULTIPLIER) for strength in self.strengths]
+            for scenario in scenarios
+        ]
+        if not self.evidence_project:
+            return [[0.0] * n_projects for _ in scenarios]
+
+        if NUMPY_AVAILABLE:
+            mult = np.asarray(multipliers, dtype=np.float64)[:, self.evidence_strength]
+            terms = (np.asarray(self.evidence_delta, dtype=np.float64) * mult) * np.asarray(
+                self.evidence_attribution, dtype=np.float64
+            )
+            totals = [
+                np.bincount(self.evidence_project, weights=row, minlength=n_projects).tolist() for row in terms
+            ]
+        else:
+            totals = []
+            for mult in multipliers:
+                sums = [0.0] * n_projects
+                for project, delta, strength, attribution in zip(
+                    self.evidence_project, self.evidence_delta, self.evidence_strength, self.evidence_attribution
+                ):
+                    sums[project] += delta * mult[strength] * attribution
+                totals.append(sums)
+        return [[round(total, 2) for total in sums] for sums in totals]
+
+    def evaluate(self, scenarios: Sequence[Scenario]) -> List[ScenarioResult]:
+        """모든 시나리오의 project 점수 + Condition/Track 합계 (가중치 행렬 1회 구성)"""
+        expected = self.expected_scores(scenarios)
+        realized = self.realized_scores(scenarios)
+        engine = self.engine
+        sums = {
+            "condition": self._bucket_sums(engine.conditions, engine.condition_matrix, expected, realized),
+            "track": self._bucket_sums(engine.tracks, engine.track_matrix, expected, realized),
+        }
+        return [
+            ScenarioResult(
+                scenario=scenario,
+                expected=expected[k],
+                realized=realized[k],
+                conditions=sums["condition"][k],
+                tracks=sums["track"][k],
+            )
+            for k, scenario in enumerate(scenarios)
+        ]
+
+    @staticmethod
+    def _bucket_sums(buckets, matrix, expected, realized) -> List[Dict[str, Dict[str, float]]]:
+        expected_sums = matrix.matmat(expected)
+        realized_sums = matrix.matmat(realized)
+        result = []
+        for k in range(len(expected)):
+            totals = {}
+            for bucket_id in buckets:
+                row = matrix.index.get(bucket_id)
+                totals[bucket_id] = {
+                    "expected_sum": 0.0 if row is None else round(expected_sums[k][row], 2),
+                    "realized_sum": 0.0 if row is None else round(realized_sums[k][row], 2),
+                }
+            result.append(totals)
+        return result
+
+
+def _ranks(scores: Dict[str, float]) -> Dict[str, int]:
+    """점수 내림차순 순위 (동점은 같은 순위, 1부터)"""
+    ordered = sorted(scores.values(), reverse=True)
+    first = {}
+    for position, score in enumerate(ordered, 1):
+        first.setdefault(score, position)
+    return {item_id: first[score] for item_id, score in scores.items()}
+
+
+def scores_by_kind(result: ScenarioResult, records: List[Dict], kind: str, metric: str) -> Dict[str, float]:
+    """kind별 id → metric 점수 (project: expected_score/realized_score, 나머지: *_sum)"""
+    if kind == "project":
+        vector = result.expected if metric == "expected" else result.realized
+        return {record["id"]: score for record, score in zip(records, vector)}
+    buckets = result.conditions if kind == "condition" else result.tracks
+    return {bucket_id: total[f"{metric}_sum"] for bucket_id, total in buckets.items()}
+
+
+def compare_ranks(
+    results: List[ScenarioResult],
+    records: List[Dict],
+    kind: str,
+    metric: str = "expected",
+) -> List[Dict[str, Any]]:
+    """results[0] (baseline) 대비 시나리오별 순위 변화
+
+    Returns:
+        [{"id", "baseline": {"score", "rank"}, "scenarios": {name: {"score", "rank", "rank_change"}}}]
+        (baseline 순위 순, rank_change > 0 = 순위 상승)
+    """
+    if kind not in RANK_KINDS:
+        raise ValueError(f"Unknown kind: {kind} (choose from {', '.join(RANK_KINDS)})")
+    baseline, scenarios = results[0], results[1:]
+    base_scores = scores_by_kind(baseline, records, kind, metric)
+    base_ranks = _ranks(base_scores)
+    scenario_data = []
+    for result in scenarios:
+        scores = scores_by_kind(result, records, kind, metric)
+        scenario_data.append((result.name, scores, _ranks(scores)))
+
+    rows = []
+    for item_id in sorted(base_scores, key=lambda i: (base_ranks[i], i)):
+        rows.append({
+            "id": item_id,
+            "baseline": {"score": base_scores[item_id], "rank": base_ranks[item_id]},
+            "scenarios": {
+                name: {
+                    "score": scores[item_id],
+                    "rank": ranks[item_id],
+                    "rank_change": base_ranks[item_id] - ranks[item_id],
+                }
+                for name, scores, ranks in scenario_data
+            },
+        })
+    return rows
@@ -0,0 +1,149 @@
+"""
+Impact Window Sums
+
+Condition/Track별 realized 점수를 월 index 기반 dense 배열 + prefix sum으로 보관하고,
+임의 기간(월, 분기, 반기, 연도, "2026-02..2026-07" 같은 사용자 범위)의 합을 O(1)로 조회합니다.
+(기존: 기간마다 project의 window_id를 다시 파싱/버킷팅해서 합산)
+
+- window 포맷(월/분기/반기)별로 배열을 따로 둠: 분기/반기 window 점수는 월로 나눌 수 없으므로
+  조회 범위에 window 전체가 포함될 때만 합산 (분기 조회 = realized_by_quarter, 반기 조회 = realized_by_half와 같은 규칙)
+- 배열은 vault에 나온 첫 연도 1월부터 마지막 연도 12월까지 (분기/반기 경계 정렬)
+- 가중치는 ImpactEngine의 Condition/Track 행렬 그대로 (operational 제외, secondary track은 weight 반영)
+- numpy가 있으면 2차원 배열 cumsum, 없으면 순수 Python 누적합
+
+Usage:
+    from shared.impact.window_sums import WindowSums
+
+    sums = WindowSums.from_engine(engine, "condition")
+    sums.window_sum("cond-b", "2026-H1")
+    sums.window_sums("2026-02..2026-07")    # {condition id: 합}
+
+CLI: scripts/impact_windows.py
+"""
+
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .engine import NUMPY_AVAILABLE, ImpactEngine, WeightMatrix
+from .windows import WINDOW_MONTHS, parse_window_range
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+WINDOW_KINDS = ("condition", "track")
+
+
+class WindowSums:
+    """bucket × 기간 prefix sum (window 포맷별)
+
+    Args:
+        keys: bucket id (행 순서, 행렬에 행이 없는 bucket은 합 0)
+        matrix: bucket × project 가중치 (행 key = bucket id)
+        windows: project별 (window 포맷, 첫 월 index) 또는 None (window 없음/파싱 불가)
+        values: project별 점수 (기본: realized_score)
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        matrix: WeightMatrix,
+        windows: Sequence[Optional[Tuple[str, int]]],
+        values: Sequence[float],
+    ):
+        self.keys = list(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        starts = [window[1] for window in windows if window is not None]
+        self.base = (min(starts) // 12) * 12 if starts else 0
+        self.months = ((max(starts) // 12) * 12 + 12 - self.base) if starts else 0
+
+        # 포맷별 (bucket 행, 기간 index, 값) 모으기
+        cells: Dict[str, Tuple[List[int], List[int], List[float]]] = {
+            window_format: ([], [], []) for window_format in WINDOW_MONTHS
+        }
+        row_map = [self.index[key] for key in matrix.keys]
+        for row, col, weight in zip(matrix.rows, matrix.cols, matrix.weights):
+            window = windows[col]
+            if window is None:
+                continue
+            window_format, start = window
+            rows, periods, cell_values = cells[window_format]
+            rows.append(row_map[row])
+            periods.append((start - self.base) // WINDOW_MONTHS[window_format])
+            cell_values.append(values[col] * weight)
+
+        # 포맷별 prefix sum: prefix[format][row][k] = 기간 0..k-1의 합
+        self.prefix = {
+            window_format: self._prefix_sums(*cells[window_format], self.months // months)
+            for window_format, months in WINDOW_MONTHS.items()
+        }
+
+    def _prefix_sums(self, rows: List[int], periods: List[int], values: List[float], n_periods: int):
+        n_rows = len(self.keys)
+        if NUMPY_AVAILABLE:
+            dense = np.zeros((n_rows, n_periods + 1), dtype=np.float64)
+            if values:
+                np.add.at(dense, (np.asarray(rows, dtype=np.intp), np.asarray(periods, dtype=np.intp) + 1), values)
+            return np.cumsum(dense, axis=1)
+        dense = [[0.0] * (n_periods + 1) for _ in range(n_rows)]
+        for row, period, value in zip(rows, periods, values):
+            dense[row][period + 1] += value
+        return [list(accumulate(row)) for row in dense]
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: ImpactEngine,
+        kind: str = "condition",
+        values: Optional[Sequence[float]] = None,
+    ) -> "WindowSums":
+        """ImpactEngine의 Condition/Track 행렬로 구성 (values 기본: 레코드의 realized_score)"""
+        if kind not in WINDOW_KINDS:
+            raise ValueError(f"unknown kind: {kind} (expected one of {', '.join(WINDOW_KINDS)})")
+        if kind == "condition":
+            keys, matrix = engine.conditions, engine.condition_matrix
+        else:
+            keys, matrix = engine.tracks, engine.track_matrix
+        if values is None:
+            values = [record["realized_score"] for record in engine.records]
+        return cls(list(keys), matrix, engine.windows, values)
+
+    @property
+    def first_month(self) -> int:
+        return self.base
+
+    @property
+    def last_month(self) -> int:
+        return self.base + self.months - 1
+
+    def _period_sum(self, window_format: str, row: int, first: int, last: int) -> float:
+        """[first, last] 월 범위에 전체가 포함되는 window_format 기간들의 합"""
+        months = WINDOW_MONTHS[window_format]
+        lo = max(-(-(first - self.base) // months), 0)  # 범위 안에서 시작하는 첫 기간
+        hi = min((last + 1 - self.base) // months, self.months // months)  # 범위 안에서 끝나는 기간의 끝
+        if hi <= lo:
+            return 0.0
+        prefix = self.prefix[window_format][row]
+        return float(prefix[hi] - prefix[lo])
+
+    def range_sum(self, key: str, first: int, last: int) -> float:
+        """월 index 범위 [first, last]의 합 (분기/반기 window는 범위에 전체가 포함될 때만)
+
+        Raises:
+            KeyError: 없는 bucket id
+        """
+        row = self.index[key]
+        return sum(self._period_sum(window_format, row, first, last) for window_format in WINDOW_MONTHS)
+
+    def window_sum(self, key: str, spec: str) -> float:
+        """조회 범위 문자열 ("2026-Q1", "2026-H2", "2026-02..2026-07" 등)의 합
+
+        Raises:
+            KeyError: 없는 bucket id
+            ValueError: 잘못된 범위 문자열
+        """
+        return self.range_sum(key, *parse_window_range(spec))
+
+    def window_sums(self, spec: str) -> Dict[str, float]:
+        """모든 bucket의 조회 범위 합 (bucket 순서)"""
+        first, last = parse_window_range(spec)
+        return {key: self.range_sum(key, first, last) for key in self.keys}
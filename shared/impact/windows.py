@@ -0,0 +1,139 @@
+"""
+Impact Window Helpers
+
+Project.realized_impact.window_id 파싱과 분기/반기 key 변환.
+(기존 scripts/build_impact.py의 window 헬퍼, 롤업 엔진과 공유)
+
+지원 포맷: YYYY-MM (month), YYYY-QN (quarter), YYYY-HN (half)
+월 index 범위 (window_span, parse_window_range)는 window_sums.WindowSums 조회용
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+_MONTH_PATTERN = re.compile(r'^(\d{4})-(\d{2})$')
+_QUARTER_PATTERN = re.compile(r'^(\d{4})-Q([1-4])$')
+_HALF_PATTERN = re.compile(r'^(\d{4})-H([12])$')
+
+
+def parse_window_id(window_id: Optional[str]) -> Optional[Dict]:
+    """window_id 파싱
+
+    지원 포맷: YYYY-MM (month), YYYY-QN (quarter), YYYY-HN (half)
+
+    Returns:
+        {"format": "month", "year": 2025, "month": 12} 형태, 파싱 불가 시 None
+    """
+    if not window_id or not isinstance(window_id, str):
+        return None
+
+    match = _MONTH_PATTERN.match(window_id)
+    if match:
+        month = int(match.group(2))
+        if not 1 <= month <= 12:
+            return None  # 2025-13 같은 잘못된 값 거부
+        return {"format": "month", "year": int(match.group(1)), "month": month}
+
+    match = _QUARTER_PATTERN.match(window_id)
+    if match:
+        return {"format": "quarter", "year": int(match.group(1)), "quarter": int(match.group(2))}
+
+    match = _HALF_PATTERN.match(window_id)
+    if match:
+        return {"format": "half", "year": int(match.group(1)), "half": int(match.group(2))}
+
+    return None
+
+
+def month_to_quarter(month: int) -> int:
+    """월 → 분기 (1-4)"""
+    return (month - 1) // 3 + 1
+
+
+def month_to_half(month: int) -> int:
+    """월 → 반기 (1-2)"""
+    return 1 if month <= 6 else 2
+
+
+def window_to_half_key(parsed_window: Optional[Dict]) -> Optional[str]:
+    """파싱된 window → "YYYY-HN" (월/분기/반기 포맷 모두 처리)"""
+    if not parsed_window:
+        return None
+    if parsed_window["format"] == "month":
+        return f"{parsed_window['year']}-H{month_to_half(parsed_window['month'])}"
+    if parsed_window["format"] == "quarter":
+        return f"{parsed_window['year']}-H{1 if parsed_window['quarter'] <= 2 else 2}"
+    if parsed_window["format"] == "half":
+        return f"{parsed_window['year']}-H{parsed_window['half']}"
+    return None
+
+
+def window_to_quarter_key(parsed_window: Optional[Dict]) -> Optional[str]:
+    """파싱된 window → "YYYY-QN" (반기 포맷은 분기로 나눌 수 없으므로 None)"""
+    if not parsed_window:
+        return None
+    if parsed_window["format"] == "month":
+        return f"{parsed_window['year']}-Q{month_to_quarter(parsed_window['month'])}"
+    if parsed_window["format"] == "quarter":
+        return f"{parsed_window['year']}-Q{parsed_window['quarter']}"
+    return None
+
+
+# === 월 index (year * 12 + month - 1) 기반 window 범위 ===
+
+# window 포맷별 길이 (월)
+WINDOW_MONTHS = {"month": 1, "quarter": 3, "half": 6}
+
+_YEAR_PATTERN = re.compile(r'^(\d{4})$')
+
+
+def month_index(year: int, month: int) -> int:
+    """(연, 월) → 월 index (연속 정수, 분기/반기 경계는 3/6의 배수)"""
+    return year * 12 + month - 1
+
+
+def month_label(index: int) -> str:
+    """월 index → "YYYY-MM\""""
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def window_span(parsed_window: Optional[Dict]) -> Optional[Tuple[str, int]]:
+    """파싱된 window → (포맷, 첫 월 index)"""
+    if not parsed_window:
+        return None
+    year = parsed_window["year"]
+    if parsed_window["format"] == "month":
+        return "month", month_index(year, parsed_window["month"])
+    if parsed_window["format"] == "quarter":
+        return "quarter", month_index(year, (parsed_window["quarter"] - 1) * 3 + 1)
+    if parsed_window["format"] == "half":
+        return "half", month_index(year, (parsed_window["half"] - 1) * 6 + 1)
+    return None
+
+
+def parse_window_range(spec: str) -> Tuple[int, int]:
+    """조회 범위 → (첫 월 index, 마지막 월 index)
+
+    지원 포맷: YYYY-MM, YYYY-QN, YYYY-HN, YYYY, "A..B" (A의 시작부터 B의 끝까지, 각각 앞의 포맷)
+
+    Raises:
+        ValueError: 파싱 불가 또는 끝이 시작보다 앞선 범위
+    """
+    if ".." in spec:
+        start_spec, end_spec = spec.split("..", 1)
+        first, _ = parse_window_range(start_spec)
+        _, last = parse_window_range(end_spec)
+        if last < first:
+            raise ValueError(f"window range ends before it starts: {spec}")
+        return first, last
+
+    match = _YEAR_PATTERN.match(spec)
+    if match:
+        first = month_index(int(match.group(1)), 1)
+        return first, first + 11
+
+    span = window_span(parse_window_id(spec))
+    if span is None:
+        raise ValueError(f"invalid window: {spec} (expected YYYY, YYYY-MM, YYYY-QN, YYYY-HN or A..B)")
+    window_format, first = span
+    return first, first + WINDOW_MONTHS[window_format] - 1
@@ -2,12 +2,23 @@
 Shared Utilities Module
 
 Vault 관련 유틸리티 함수들.
+- vault_utils.py: vault 경로, frontmatter 추출
+- frontmatter_reader.py: 헤더 전용 frontmatter reader (본문 lazy)
+- yaml_parser.py: libyaml(CSafeLoader) 가속 YAML 파서 (PyYAML 필요, 직접 import)
+- precompress.py: 빌드 산출물 .gz/.br 사전 압축 (brotli 선택, 직접 import)
+- artifact.py: 타임스탬프 외 변경이 없으면 산출물을 다시 쓰지 않는 writer (직접 import)
+- json_stream.py: json.dumps와 같은 출력을 chunk 단위로 생성하는 streaming encoder (직접 import)
 """
 
-from .vault_utils import get_vault_dir, get_exec_vault_dir, extract_frontmatter
+from .vault_utils import get_vault_dir, get_exec_vault_dir, extract_frontmatter, read_frontmatter
+from .frontmatter_reader import FrontmatterHeader, read_frontmatter_header, read_body
 
 __all__ = [
     "get_vault_dir",
     "get_exec_vault_dir",
     "extract_frontmatter",
+    "read_frontmatter",
+    "FrontmatterHeader",
+    "read_frontmatter_header",
+    "read_body",
 ]
@@ -0,0 +1,117 @@
+"""
+Build Artifact Writer
+
+_Graph_Index.md, _build/*.json 같은 생성 산출물 저장. 타임스탬프(generated, updated 등)만
+다른 결과는 다시 쓰지 않으므로 cron/sync가 돌아도 내용 변경이 없으면 working tree가
+더러워지지 않습니다 (nas-git-sync.sh의 불필요한 commit/push 방지).
+
+- write_bytes_if_changed: 내용이 같으면 쓰지 않음
+- write_stamped: 기존 파일의 타임스탬프로 다시 렌더링한 결과가 기존 파일과 같으면
+  "타임스탬프 외 변경 없음"으로 보고 기존 파일과 타임스탬프를 그대로 유지
+- 쓰기는 임시 파일 → rename (읽는 쪽이 반쯤 쓴 파일을 보지 않음)
+- render가 bytes chunk를 생성하면 비교/쓰기 모두 chunk 단위 (shared.utils.json_stream)
+
+Usage:
+    from shared.utils.artifact import GENERATED_JSON_STAMP, write_stamped
+
+    def render(stamp):
+        graph["generated"] = stamp
+        return json.dumps(graph).encode("utf-8")
+
+    written, stamp = write_stamped(path, render, datetime.now().isoformat(), GENERATED_JSON_STAMP)
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Pattern, Tuple, Union
+
+# JSON 산출물의 첫 "generated" 값 (문자열 안의 따옴표는 escape되므로 key로만 매칭)
+GENERATED_JSON_STAMP = re.compile(rb'"generated":\s*"([^"\\]*)"')
+# 타임스탬프는 파일 앞부분에 있어야 함 (전체를 읽지 않음)
+STAMP_HEAD_SIZE = 4096
+
+
+def _chunks(data: Union[bytes, Iterable[bytes]]) -> Iterable[bytes]:
+    return (data,) if isinstance(data, bytes) else data
+
+
+def _read_head(path: Path) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read(STAMP_HEAD_SIZE)
+    except FileNotFoundError:
+        return None
+
+
+def _same_content(path: Path, data: Union[bytes, Iterable[bytes]]) -> bool:
+    """기존 파일과 chunk를 앞에서부터 비교 (다른 곳이 나오면 바로 중단)"""
+    try:
+        with open(path, "rb") as f:
+            for chunk in _chunks(data):
+                if f.read(len(chunk)) != chunk:
+                    return False
+            return f.read(1) == b""
+    except FileNotFoundError:
+        return False
+
+
+def _replace(path: Path, data: Union[bytes, Iterable[bytes]]) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in _chunks(data):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_bytes_if_changed(path: Union[str, Path], data: bytes) -> bool:
+    """내용이 다를 때만 저장
+
+    Returns:
+        저장했으면 True (같은 내용이라 건너뛰면 False)
+    """
+    path = Path(path)
+    if _same_content(path, data):
+        return False
+    _replace(path, data)
+    return True
+
+
+def write_stamped(
+    path: Union[str, Path],
+    render: Callable[[str], Union[bytes, Iterable[bytes]]],
+    stamp: str,
+    stamp_pattern: Pattern[bytes],
+) -> Tuple[bool, str]:
+    """타임스탬프를 제외한 내용이 같으면 저장하지 않음
+
+    render가 chunk iterable을 반환하면 (iter_json_bytes 등) 비교와 저장 모두
+    문서 전체를 메모리에 올리지 않고 chunk 단위로 처리합니다.
+
+    Args:
+        path: 산출물 경로
+        render: stamp → 파일 내용 (bytes 또는 bytes chunk iterable, stamp 외에는 같은 입력이면 같은 bytes)
+        stamp: 이번 빌드의 타임스탬프
+        stamp_pattern: 기존 파일 앞부분(STAMP_HEAD_SIZE)에서 타임스탬프를 찾는 regex (group 1)
+
+    Returns:
+        (저장 여부, 파일에 들어 있는 타임스탬프)
+        변경이 없으면 (False, 기존 타임스탬프)
+    """
+    path = Path(path)
+    head = _read_head(path)
+    if head is not None:
+        match = stamp_pattern.search(head)
+        if match:
+            previous_stamp = match.group(1).decode("utf-8")
+            if _same_content(path, render(previous_stamp)):
+                return False, previous_stamp
+    _replace(path, render(stamp))
+    return True, stamp
@@ -0,0 +1,109 @@
+"""
+Frontmatter Header Reader
+
+파일 전체를 읽지 않고 YAML frontmatter 헤더만 읽습니다.
+작은 청크 단위로 읽다가 닫는 `---` 줄을 만나면 멈추고,
+헤더 텍스트와 본문 시작 byte offset을 반환합니다. 본문은 필요할 때만 읽습니다.
+
+Delimiter 규칙 (extract_frontmatter와 동일):
+- 첫 줄이 `---` (뒤 공백 허용)
+- 이후 처음으로 `---`만 있는 줄이 닫는 delimiter
+
+Usage:
+    from shared.utils.frontmatter_reader import read_frontmatter_header, read_body
+
+    header = read_frontmatter_header(path)
+    if header is not None:
+        frontmatter = yaml.safe_load(header.text)
+        body = read_body(path, header.body_offset)  # 필요할 때만
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_CHUNK_SIZE = 4096
+
+_DELIMITER = b"---"
+
+
+@dataclass(frozen=True)
+class FrontmatterHeader:
+    """frontmatter 헤더 읽기 결과
+
+    text: 두 delimiter 사이의 YAML 텍스트 (줄바꿈은 \\n으로 정규화)
+    body_offset: 본문이 시작하는 byte offset (닫는 delimiter 줄 다음)
+    """
+    text: str
+    body_offset: int
+
+
+def _is_delimiter(line: bytes) -> bool:
+    return line.rstrip() == _DELIMITER
+
+
+def read_frontmatter_header(
+    path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[FrontmatterHeader]:
+    """frontmatter 헤더만 스트리밍으로 읽기
+
+    Args:
+        path: 마크다운 파일 경로
+        chunk_size: 한 번에 읽을 byte 수
+
+    Returns:
+        FrontmatterHeader, frontmatter가 없거나 닫히지 않았으면 None
+
+    Raises:
+        OSError: 파일 읽기 실패
+        UnicodeDecodeError: 헤더가 UTF-8이 아님
+    """
+    with open(path, "rb") as f:
+        buf = bytearray(f.read(chunk_size))
+        if not buf.startswith(_DELIMITER):
+            return None
+
+        eof = False
+        header_start = -1
+        line_start = 0
+
+        while True:
+            newline = buf.find(b"\n", line_start)
+            if newline == -1:
+                if eof:
+                    # 마지막 줄 (개행 없이 파일 끝)
+                    if header_start != -1 and _is_delimiter(bytes(buf[line_start:])):
+                        return _make_header(buf, header_start, line_start, len(buf))
+                    return None
+                chunk = f.read(chunk_size)
+                if chunk:
+                    buf.extend(chunk)
+                else:
+                    eof = True
+                continue
+
+            line = bytes(buf[line_start:newline])
+            if header_start == -1:
+                # 여는 delimiter 줄
+                if not _is_delimiter(line):
+                    return None
+                header_start = newline + 1
+            elif _is_delimiter(line):
+                return _make_header(buf, header_start, line_start, newline + 1)
+            line_start = newline + 1
+
+
+def _make_header(buf: bytearray, header_start: int, closing_start: int, body_offset: int) -> FrontmatterHeader:
+    """헤더 텍스트 디코딩 (닫는 delimiter 직전 개행 제외)"""
+    header_end = max(header_start, closing_start - 1)
+    text = bytes(buf[header_start:header_end]).decode("utf-8")
+    return FrontmatterHeader(text=text.replace("\r\n", "\n"), body_offset=body_offset)
+
+
+def read_body(path: Union[str, Path], body_offset: int = 0) -> str:
+    """body_offset부터 파일 끝까지 읽기 (줄바꿈은 \\n으로 정규화)"""
+    with open(path, "rb") as f:
+        f.seek(body_offset)
+        data = f.read()
+    return data.decode("utf-8").replace("\r\n", "\n")
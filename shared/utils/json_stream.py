@@ -0,0 +1,135 @@
+"""
+Streaming JSON Encoder
+
+큰 빌드 산출물 (graph.json, impact.json)을 문서 전체를 문자열로 만들지 않고 조각(chunk)
+단위로 생성합니다. 결과는 json.dumps(obj, indent=2, ensure_ascii=False)
+(minify면 separators=(",", ":"))와 byte 단위로 같습니다.
+
+- stream_depth 미만 깊이의 dict/list/tuple/iterator는 원소 단위로 생성
+  (nodes/edges 배열은 batch_size개씩), 그보다 깊은 값은 한 번에 인코딩
+- list 대신 generator를 넣으면 원소를 만들면서 바로 내보냄 (배열 전체를 메모리에 두지 않음)
+- chunk 크기는 buffer_size 근처로 묶어서 반환 (파일 write/비교 호출 수 감소)
+
+Usage:
+    from shared.utils.json_stream import iter_json_bytes
+
+    graph = {"generated": now, "nodes": (node_of(e) for e in entities), "edges": edges}
+    with open(path, "wb") as f:
+        for chunk in iter_json_bytes(graph):
+            f.write(chunk)
+"""
+
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+DEFAULT_BATCH_SIZE = 256
+
+
+def _json_key(key: Any) -> str:
+    """json.dumps이 dict key로 쓰는 문자열 (int/float/None/bool key 정규화)"""
+    if isinstance(key, str):
+        return key
+    return next(iter(json.loads(json.dumps({key: None}))))
+
+
+def iter_json(
+    obj: Any,
+    minify: bool = False,
+    stream_depth: int = 2,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """obj의 JSON 텍스트를 조각 단위로 생성
+
+    Args:
+        obj: JSON 값 (list 대신 iterator 허용, stream_depth 미만 깊이에서만)
+        minify: 공백 없이 (기본은 indent=2)
+        stream_depth: 원소 단위로 나눠 생성할 깊이 (0이면 json.dumps 한 번)
+        batch_size: 배열 원소를 한 번에 인코딩할 개수 (원소별 encoder 호출 비용 감소)
+    """
+    indent = None if minify else 2
+    separators = (",", ":") if minify else (",", ": ")
+    key_separator = separators[1]
+    encoder = json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False)
+    encode_key = json.JSONEncoder(ensure_ascii=False).encode
+
+    def dumps(value: Any, level: int) -> str:
+        text = encoder.encode(value)
+        if indent is not None and level:
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        return text
+
+    def encode(value: Any, level: int) -> Iterator[str]:
+        if isinstance(value, dict):
+            items: Iterable = value.items()
+            opening, closing = "{", "}"
+        elif isinstance(value, (list, tuple)) or isinstance(value, Iterator):
+            items = value
+            opening, closing = "[", "]"
+        else:
+            yield dumps(value, level)
+            return
+        if level >= stream_depth and not isinstance(value, Iterator):
+            yield dumps(value, level)
+            return
+
+        if indent is None:
+            first_prefix = opening
+            prefix = ","
+            suffix = closing
+        else:
+            inner = "\n" + " " * (indent * (level + 1))
+            first_prefix = opening + inner
+            prefix = "," + inner
+            suffix = "\n" + " " * (indent * level) + closing
+
+        if closing == "]" and level + 1 >= stream_depth:
+            # 원소를 batch_size개씩 묶어 한 번에 인코딩하고 바깥 괄호만 떼어냄
+            head = len(first_prefix)
+            tail = len(suffix)
+            iterator = iter(items)
+            empty = True
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                text = dumps(batch, level)
+                yield (first_prefix if empty else prefix) + text[head:-tail]
+                empty = False
+            yield opening + closing if empty else suffix
+            return
+
+        empty = True
+        for item in items:
+            yield first_prefix if empty else prefix
+            empty = False
+            if closing == "}":
+                key, item = item
+                yield encode_key(_json_key(key)) + key_separator
+            yield from encode(item, level + 1)
+        yield opening + closing if empty else suffix
+
+    return encode(obj, 0)
+
+
+def iter_json_bytes(
+    obj: Any,
+    minify: bool = False,
+    stream_depth: int = 2,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """iter_json() 결과를 UTF-8로 인코딩해 buffer_size 근처 크기로 묶어서 생성"""
+    buffer = []
+    size = 0
+    for chunk in iter_json(obj, minify, stream_depth, batch_size):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
@@ -0,0 +1,81 @@
+"""
+Precompressed Build Outputs
+
+빌드 산출물 옆에 .gz / .br 파일을 미리 만들어 nginx `gzip_static on;` /
+`brotli_static on;`이 요청마다 압축하지 않고 그대로 서빙하게 합니다.
+
+- gzip: 표준 라이브러리, 헤더 mtime=0 (같은 입력이면 같은 바이트)
+- brotli: `brotli` 패키지가 설치된 경우에만 (없으면 .br 생략, 이전 .br은 삭제)
+- 압축 파일의 mtime은 원본과 맞춤 (내용이 같으면 다시 쓰지 않음)
+- 압축을 끄고 다시 빌드하면 remove_precompressed()로 이전 압축본을 지워야
+  nginx가 오래된 .gz를 서빙하지 않음
+
+Usage:
+    from shared.utils.precompress import write_precompressed, BROTLI_AVAILABLE
+
+    write_precompressed(build_dir / "graph.json")
+"""
+
+import gzip
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .artifact import write_bytes_if_changed
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:  # 선택 의존성 (pip install brotli)
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+PRECOMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def _sibling(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def remove_precompressed(path: Union[str, Path]) -> None:
+    """path의 .gz/.br sibling 삭제 (없으면 무시)"""
+    for suffix in PRECOMPRESSED_SUFFIXES:
+        try:
+            _sibling(Path(path), suffix).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def write_precompressed(path: Union[str, Path], data: Optional[bytes] = None) -> List[Path]:
+    """path의 .gz(/.br) sibling 생성
+
+    Args:
+        path: 원본 파일 (이미 저장되어 있어야 함)
+        data: 원본 내용 (주면 다시 읽지 않음)
+
+    Returns:
+        생성한 압축 파일 경로
+    """
+    path = Path(path)
+    if data is None:
+        data = path.read_bytes()
+
+    outputs = [(_sibling(path, ".gz"), gzip.compress(data, GZIP_LEVEL, mtime=0))]
+    if BROTLI_AVAILABLE:
+        outputs.append((_sibling(path, ".br"), brotli.compress(data, quality=BROTLI_QUALITY)))
+    else:
+        # brotli가 있던 환경에서 만든 .br이 남아 있으면 원본과 내용이 어긋남
+        try:
+            _sibling(path, ".br").unlink()
+        except FileNotFoundError:
+            pass
+
+    stat = path.stat()
+    written = []
+    for output, blob in outputs:
+        write_bytes_if_changed(output, blob)
+        os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        written.append(output)
+    return written
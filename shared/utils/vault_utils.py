@@ -4,13 +4,15 @@ Vault Utilities
 Vault 경로 및 파일 처리 유틸리티.
 
 Usage:
-    from shared.utils.vault_utils import get_vault_dir, extract_frontmatter
+    from shared.utils.vault_utils import get_vault_dir, extract_frontmatter, read_frontmatter
 """
 
 import os
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Union
+
+from .frontmatter_reader import read_frontmatter_header
 
 
 def get_vault_dir() -> Path:
@@ -153,6 +155,7 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
     """
     try:
         import yaml
+        from .yaml_parser import safe_load
     except ImportError:
         return None, content
 
@@ -176,12 +179,41 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
     body = "\n".join(lines[end_index + 1:])
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = safe_load(frontmatter_text)
         return frontmatter, body
     except yaml.YAMLError:
         return None, content
 
 
+def read_frontmatter(path: Union[str, Path]) -> Tuple[Optional[Dict[str, Any]], int]:
+    """Read YAML frontmatter from a markdown file without loading the body
+
+    Only the header is read (chunked, stops at the closing delimiter).
+    Use frontmatter_reader.read_body(path, body_offset) to load the body lazily.
+
+    Args:
+        path: Markdown file path
+
+    Returns:
+        Tuple of (frontmatter dict, body byte offset)
+        frontmatter is None if not found or invalid (offset 0)
+    """
+    try:
+        import yaml
+        from .yaml_parser import safe_load
+    except ImportError:
+        return None, 0
+
+    header = read_frontmatter_header(path)
+    if header is None:
+        return None, 0
+
+    try:
+        return safe_load(header.text), header.body_offset
+    except yaml.YAMLError:
+        return None, 0
+
+
 def parse_entity_id(filename: str) -> Optional[str]:
     """Extract entity ID from filename
 
@@ -0,0 +1,58 @@
+"""
+YAML Parser
+
+frontmatter 파싱용 YAML 로더. libyaml이 설치되어 있으면 yaml.CSafeLoader를,
+없으면 순수 Python yaml.SafeLoader를 사용합니다.
+
+CSafeLoader는 C 파서 + SafeLoader와 같은 constructor를 사용하므로
+created/due 같은 date 값도 동일하게 datetime.date로 생성됩니다.
+C 파서가 오류를 내면 순수 Python 로더로 한 번 더 파싱하여
+오류 메시지와 결과까지 기존 yaml.safe_load와 동일하게 맞춥니다.
+
+Usage:
+    from shared.utils.yaml_parser import safe_load, LIBYAML_AVAILABLE
+
+    frontmatter = safe_load(header_text)
+
+Benchmark:
+    python3 scripts/bench_frontmatter_parse.py .
+"""
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as FastSafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:  # libyaml 없이 빌드된 PyYAML
+    from yaml import SafeLoader as FastSafeLoader
+    LIBYAML_AVAILABLE = False
+
+YAMLError = yaml.YAMLError
+
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load 대체 (가능하면 libyaml 사용)
+
+    Args:
+        text: YAML 텍스트
+
+    Returns:
+        파싱 결과 (yaml.safe_load와 동일)
+
+    Raises:
+        yaml.YAMLError: 순수 Python 로더도 파싱에 실패한 경우
+    """
+    if not LIBYAML_AVAILABLE:
+        return yaml.load(text, Loader=yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=FastSafeLoader)
+    except yaml.YAMLError:
+        # libyaml과 pure-Python 파서의 edge case 차이 방지
+        return yaml.load(text, Loader=yaml.SafeLoader)
+
+
+def pure_safe_load(text: str) -> Any:
+    """순수 Python SafeLoader (벤치마크/비교용)"""
+    return yaml.load(text, Loader=yaml.SafeLoader)
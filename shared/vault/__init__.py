@@ -0,0 +1,120 @@
+"""
+Vault Scan Module
+
+Vault 단일 패스 스캔 및 엔티티 컬렉션.
+- scanner.py: VaultScanner, EntityCollection (순회 + YAML 파싱 1회)
+- change_detect.py: 캐시 재사용 판단 backend (mtime, git index blob SHA)
+- entity.py: Entity (__slots__ compact 모델, lazy frontmatter)
+- adjacency.py: _build/graph.csr edge type별 forward/reverse CSR 인접 인덱스 (load_adjacency)
+- relations.py: 관계 extractor registry (graph edges, 끊어진 참조/대칭 검사 공유)
+- graph_diff.py: 두 graph.json 스냅샷 변경분 (diff_graphs, scripts/graph_diff.py)
+- graph_reader.py: graph.json 스트리밍/부분 조회 reader, _build/graph.json.idx offset 인덱스 (GraphReader)
+- merkle.py: _build/merkle.json 디렉토리별 Merkle tree, 머신 간 어긋난 파일 탐색 (build_merkle, diff_merkle)
+- hierarchy.py: _build/hierarchy.json parent 계층 pre-order 구간 라벨 (load_hierarchy, build_hierarchy)
+- snapshot.py: _build/entities.snap 바이너리 스냅샷 (write_snapshot, load_snapshot, entity_signature)
+- walker.py: walk_markdown (os.scandir, include/exclude 하위 트리 pruning)
+- cache.py: FrontmatterCache (_build/.fm_cache.sqlite, mtime/size 기반 재사용)
+"""
+
+from .adjacency import AdjacencyError, AdjacencyIndex, load_adjacency, write_adjacency
+from .cache import CacheStats, FrontmatterCache
+from .change_detect import (
+    CHANGE_DETECTORS,
+    ChangeDetector,
+    GitIndexChangeDetector,
+    MtimeChangeDetector,
+)
+from .entity import Entity
+from .scanner import (
+    ScanConfig,
+    VaultFile,
+    EntityCollection,
+    VaultScanner,
+    load_scan_config,
+    scan_vault,
+)
+from .graph_diff import GraphDiff, diff_graphs, node_hash
+from .graph_reader import (
+    GraphReader,
+    GraphReaderError,
+    iter_edges,
+    iter_nodes,
+    read_section,
+    write_graph_offsets,
+)
+from .relations import (
+    RELATIONS,
+    EdgePatchError,
+    RelationExtractor,
+    dangling_references,
+    extract_edges,
+    iter_relations,
+    patch_edges,
+    register_relation,
+    relation_fields,
+    relation_pairs,
+)
+from .merkle import MerkleDiff, MerkleError, MerkleTree, build_merkle, diff_merkle, load_merkle, write_merkle
+from .hierarchy import HierarchyError, HierarchyIndex, build_hierarchy, load_hierarchy, write_hierarchy
+from .snapshot import EntitySnapshot, SnapshotError, entity_signature, load_snapshot, write_snapshot
+from .walker import WalkStats, is_markdown_target, walk_dirs, walk_markdown
+
+__all__ = [
+    "AdjacencyError",
+    "AdjacencyIndex",
+    "load_adjacency",
+    "write_adjacency",
+    "CacheStats",
+    "FrontmatterCache",
+    "CHANGE_DETECTORS",
+    "ChangeDetector",
+    "GitIndexChangeDetector",
+    "MtimeChangeDetector",
+    "Entity",
+    "ScanConfig",
+    "VaultFile",
+    "EntityCollection",
+    "VaultScanner",
+    "load_scan_config",
+    "scan_vault",
+    "GraphDiff",
+    "diff_graphs",
+    "node_hash",
+    "GraphReader",
+    "GraphReaderError",
+    "iter_edges",
+    "iter_nodes",
+    "read_section",
+    "write_graph_offsets",
+    "RELATIONS",
+    "EdgePatchError",
+    "RelationExtractor",
+    "dangling_references",
+    "extract_edges",
+    "iter_relations",
+    "patch_edges",
+    "register_relation",
+    "relation_fields",
+    "relation_pairs",
+    "MerkleDiff",
+    "MerkleError",
+    "MerkleTree",
+    "build_merkle",
+    "diff_merkle",
+    "load_merkle",
+    "write_merkle",
+    "HierarchyError",
+    "HierarchyIndex",
+    "build_hierarchy",
+    "load_hierarchy",
+    "write_hierarchy",
+    "EntitySnapshot",
+    "SnapshotError",
+    "entity_signature",
+    "load_snapshot",
+    "write_snapshot",
+    "WalkStats",
+    "is_markdown_target",
+    "walk_dirs",
+    "walk_markdown",
+]
@@ -0,0 +1,309 @@
+"""
+Adjacency Index (CSR)
+
+build_graph_index.py가 _build/graph.csr에 쓰는 edge type별 CSR(compressed sparse row)
+인접 인덱스. "X의 children", "X를 가리키는 엔티티" 같은 이웃 조회를 edges 리스트 전체를
+훑지 않고 offset 두 개로 바로 찾습니다 (조회 비용은 차수에만 비례).
+
+Format (little-endian, 모든 배열은 4-byte 정렬):
+    header   magic "LOOPCSR\\0", version u16, flags u16,
+             node_count u32, entity_count u32, type_count u32, strings_size u32,
+             body_size u64, body_crc32 u32
+    body     string blob (UTF-8, NUL 구분): node id × node_count, edge type × type_count
+             edge type마다:
+               forward offsets u32 × (node_count + 1), forward targets u32 × edge_count
+               reverse offsets u32 × (node_count + 1), reverse sources u32 × edge_count
+
+node index는 graph.json nodes 순서 (0 ~ entity_count-1), 그 뒤에 엔티티가 아닌
+에지 끝점 (없는 parent_id 등, 정렬 순)이 옵니다. edge type은 이름순입니다.
+한 노드의 이웃 순서는 graph.json edges에 나온 순서와 같습니다.
+
+Usage:
+    from shared.vault.adjacency import load_adjacency
+
+    with load_adjacency(vault_root / "_build" / "graph.csr") as adj:
+        adj.children("prj-abc123")            # parent_of forward
+        adj.parents("tsk-abc123-1767000000000")
+        adj.incoming("hyp-001", "validates")  # 역방향
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..utils.artifact import write_bytes_if_changed
+
+ADJACENCY_FILENAME = "graph.csr"
+ADJACENCY_MAGIC = b"LOOPCSR\0"
+# 레이아웃이 바뀌면 올림 (이전 버전 파일은 AdjacencyError)
+ADJACENCY_VERSION = 1
+
+PARENT_EDGE = "parent_of"
+
+_HEADER = struct.Struct("<8sHHIIIIQI")
+
+
+class AdjacencyError(Exception):
+    """인접 인덱스 파일 오류 (magic/version/checksum 불일치, 손상)"""
+
+
+def _u32_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _csr(pairs: List[Tuple[int, int]], node_count: int) -> Tuple[array, array]:
+    """(row, col) 목록 → (offsets, cols), 같은 row 안에서는 입력 순서 유지"""
+    offsets = array("I", [0]) * (node_count + 1)
+    for row, _ in pairs:
+        offsets[row + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+    cols = array("I", [0]) * len(pairs)
+    cursor = offsets[:-1]
+    for row, col in pairs:
+        cols[cursor[row]] = col
+        cursor[row] += 1
+    return offsets, cols
+
+
+def encode_adjacency(node_ids: Sequence[str], edges: Iterable[Dict]) -> bytes:
+    """graph.json nodes id 목록 + edges → graph.csr bytes
+
+    Raises:
+        AdjacencyError: NUL 문자가 포함된 id/type
+    """
+    edges = [edge for edge in edges if edge.get("source") and edge.get("target")]
+    ids = list(node_ids)
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    entity_count = len(ids)
+    external = sorted(
+        {edge[key] for edge in edges for key in ("source", "target")} - index.keys(),
+        key=str,
+    )
+    for node_id in external:
+        index[node_id] = len(ids)
+        ids.append(node_id)
+
+    by_type: Dict[str, List[Tuple[int, int]]] = {}
+    for edge in edges:
+        by_type.setdefault(str(edge.get("type")), []).append((index[edge["source"]], index[edge["target"]]))
+    edge_types = sorted(by_type)
+
+    strings = [str(node_id) for node_id in ids] + edge_types
+    if any("\0" in text for text in strings):
+        raise AdjacencyError("NUL character in node id or edge type")
+    blob = "\0".join(strings).encode("utf-8")
+
+    parts = [blob + b"\0" * (-len(blob) % 4)]
+    for edge_type in edge_types:
+        pairs = by_type[edge_type]
+        for oriented in (pairs, [(target, source) for source, target in pairs]):
+            offsets, cols = _csr(oriented, len(ids))
+            parts.append(_u32_bytes(offsets))
+            parts.append(_u32_bytes(cols))
+    body = b"".join(parts)
+
+    header = _HEADER.pack(
+        ADJACENCY_MAGIC, ADJACENCY_VERSION, 0,
+        len(ids), entity_count, len(edge_types), len(blob),
+        len(body), zlib.crc32(body),
+    )
+    return header + body
+
+
+def write_adjacency(path: Union[str, Path], graph: Dict) -> Tuple[bool, int]:
+    """graph.json dict에서 CSR 인덱스 저장 (임시 파일 → rename, 내용이 같으면 쓰지 않음)
+
+    Returns:
+        (실제로 썼는지, 파일 크기 bytes)
+    """
+    data = encode_adjacency([node["id"] for node in graph["nodes"]], graph["edges"])
+    return write_bytes_if_changed(path, data), len(data)
+
+
+class AdjacencyIndex:
+    """edge type별 forward/reverse CSR 조회
+
+    mmap으로 연 경우 offset/이웃 배열은 복사하지 않고 memoryview로 읽습니다.
+    """
+
+    def __init__(self, buf, verify: bool = True, _mmap: Optional[mmap.mmap] = None):
+        self._mmap = _mmap
+        if len(buf) < _HEADER.size:
+            raise AdjacencyError("adjacency index too small")
+        (magic, version, _flags, node_count, entity_count, type_count, strings_size,
+         body_size, body_crc) = _HEADER.unpack_from(buf, 0)
+        if magic != ADJACENCY_MAGIC:
+            raise AdjacencyError("not an adjacency index (bad magic)")
+        if version != ADJACENCY_VERSION:
+            raise AdjacencyError(f"unsupported adjacency version {version} (expected {ADJACENCY_VERSION})")
+        pos = _HEADER.size
+        if len(buf) != pos + body_size:
+            raise AdjacencyError("adjacency index size mismatch (truncated?)")
+        if verify and zlib.crc32(buf[pos:]) != body_crc:
+            raise AdjacencyError("adjacency index checksum mismatch")
+
+        strings = buf[pos:pos + strings_size].decode("utf-8").split("\0") if strings_size else []
+        if len(strings) != node_count + type_count:
+            raise AdjacencyError("string table mismatch")
+        pos += strings_size + (-strings_size % 4)
+
+        #: node index → id (0 ~ entity_count-1은 graph.json nodes 순서)
+        self.ids: List[str] = strings[:node_count]
+        #: id → node index
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.ids)}
+        self.entity_count = entity_count
+        self.edge_types: Tuple[str, ...] = tuple(strings[node_count:])
+
+        view = memoryview(buf)
+        self._views: List[memoryview] = [view]
+        self._csr: Dict[Tuple[str, bool], Tuple[Sequence[int], Sequence[int]]] = {}
+        try:
+            for edge_type in self.edge_types:
+                for reverse in (False, True):
+                    offsets = self._u32(view, pos, node_count + 1)
+                    pos += 4 * (node_count + 1)
+                    edge_count = offsets[node_count]
+                    cols = self._u32(view, pos, edge_count)
+                    pos += 4 * edge_count
+                    self._csr[(edge_type, reverse)] = (offsets, cols)
+        except (IndexError, TypeError):
+            pos = -1
+        if pos != len(buf):
+            self.close()
+            raise AdjacencyError("adjacency index layout mismatch")
+
+    def _u32(self, view: memoryview, offset: int, count: int) -> Sequence[int]:
+        section = view[offset:offset + 4 * count]
+        if sys.byteorder == "little":
+            values = section.cast("I")
+            self._views.extend((section, values))
+            return values
+        values = array("I", section.tobytes())
+        values.byteswap()
+        return values
+
+    @classmethod
+    def from_graph(cls, graph: Dict) -> "AdjacencyIndex":
+        """graph.json dict에서 메모리 내 인덱스 생성 (graph.csr가 없을 때)"""
+        return cls(encode_adjacency([node["id"] for node in graph["nodes"]], graph["edges"]))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def edge_count(self, edge_type: Optional[str] = None) -> int:
+        types = self.edge_types if edge_type is None else (edge_type,)
+        return sum(
+            self._csr[(t, False)][0][len(self.ids)] for t in types if (t, False) in self._csr
+        )
+
+    def neighbor_indices(self, node_index: int, edge_type: str, reverse: bool = False) -> Sequence[int]:
+        """node index의 이웃 node index (edge type 하나, 없는 type이면 빈 시퀀스)
+
+        mmap으로 연 경우 memoryview slice를 반환하므로 close() 전에 참조를 놓아야 합니다.
+        """
+        csr = self._csr.get((edge_type, reverse))
+        if csr is None:
+            return ()
+        offsets, cols = csr
+        return cols[offsets[node_index]:offsets[node_index + 1]]
+
+    def neighbors(
+        self,
+        node_id: str,
+        edge_type: Optional[str] = None,
+        reverse: bool = False,
+    ) -> List[str]:
+        """이웃 id 목록
+
+        Args:
+            node_id: 기준 노드
+            edge_type: None이면 모든 edge type (edge_types 순)
+            reverse: True면 node_id를 target으로 하는 에지의 source
+        """
+        node_index = self.index.get(node_id)
+        if node_index is None:
+            return []
+        types = self.edge_types if edge_type is None else (edge_type,)
+        ids = self.ids
+        return [
+            ids[i]
+            for t in types
+            for i in self.neighbor_indices(node_index, t, reverse)
+        ]
+
+    def degree(self, node_id: str, edge_type: Optional[str] = None, reverse: bool = False) -> int:
+        node_index = self.index.get(node_id)
+        if node_index is None:
+            return 0
+        types = self.edge_types if edge_type is None else (edge_type,)
+        return sum(len(self.neighbor_indices(node_index, t, reverse)) for t in types)
+
+    def children(self, node_id: str) -> List[str]:
+        """parent_id로 node_id를 가리키는 엔티티"""
+        return self.neighbors(node_id, PARENT_EDGE)
+
+    def parents(self, node_id: str) -> List[str]:
+        return self.neighbors(node_id, PARENT_EDGE, reverse=True)
+
+    def outgoing(self, node_id: str, edge_type: Optional[str] = None) -> List[str]:
+        return self.neighbors(node_id, edge_type)
+
+    def incoming(self, node_id: str, edge_type: Optional[str] = None) -> List[str]:
+        return self.neighbors(node_id, edge_type, reverse=True)
+
+    def incoming_relations(self, node_id: str) -> List[Dict[str, str]]:
+        """node_id로 들어오는 에지 [{"type", "source_id"}] (parent_of 제외, validates 포함)"""
+        node_index = self.index.get(node_id)
+        if node_index is None:
+            return []
+        return [
+            {"type": t, "source_id": self.ids[i]}
+            for t in self.edge_types if t != PARENT_EDGE
+            for i in self.neighbor_indices(node_index, t, reverse=True)
+        ]
+
+    def close(self) -> None:
+        """mmap 해제 (이후 조회 불가)"""
+        self._csr.clear()
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "AdjacencyIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_adjacency(path: Union[str, Path], verify: bool = True) -> AdjacencyIndex:
+    """graph.csr 로드 (mmap, 배열은 복사하지 않음)
+
+    Raises:
+        OSError: 파일 없음/읽기 실패
+        AdjacencyError: 포맷 오류
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise AdjacencyError("empty adjacency index")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return AdjacencyIndex(mm, verify, _mmap=mm)
+    except AdjacencyError:
+        mm.close()
+        raise
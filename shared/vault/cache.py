@@ -0,0 +1,338 @@
+"""
+Frontmatter Cache
+
+파싱된 frontmatter를 _build/.fm_cache.sqlite에 저장하여
+변경되지 않은 파일은 다시 읽거나 YAML 파싱하지 않습니다.
+
+Key: (relative_path, st_mtime_ns, st_size) — mtime backend
+     git blob SHA — git backend (경로/mtime 무관, 다른 머신에 캐시 파일을 복사해도 재사용,
+     blob_paths에 경로 → SHA를 기록해 스캔 범위 밖 경로의 blob은 정리하지 않음)
+Invalidation: CACHE_FORMAT, PARSER_VERSION 또는 schema_constants.yaml의 schema_version이 바뀌면 전체 삭제
+Storage: JSON (pickle 아님 — 다른 머신에서 복사한 캐시 파일을 읽어도 코드가 실행되지 않고 Python 버전과 무관).
+         date/datetime/set/bytes와 문자열이 아닌 dict key는 {"$date": ...} 같은 tag 객체로 저장
+Content hash: (relative_path, st_mtime_ns, st_size) → 파일 내용 blob SHA (merkle.py leaf, 파싱 결과와 무관해 무효화하지 않음)
+
+Usage:
+    from shared.vault.cache import FrontmatterCache
+
+    with FrontmatterCache.open(vault_root) as cache:
+        entry = cache.get("50_Projects/.../project.md", mtime_ns, size)
+        if entry is None:
+            cache.put(relative, mtime_ns, size, {"frontmatter": fm, "parse_error": None, "body_offset": offset})
+        print(cache.stats)
+"""
+
+import base64
+import json
+import sqlite3
+import warnings
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
+
+import yaml
+
+from ..utils.yaml_parser import safe_load
+
+CACHE_FILENAME = ".fm_cache.sqlite"
+
+# frontmatter 추출/파싱 로직이 바뀌면 올려서 기존 캐시를 무효화
+PARSER_VERSION = "2"  # v2: 헤더 전용 reader, body_offset 저장
+
+# 저장 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT = "json1"  # json1: pickle → JSON + tag 인코딩
+
+# tag 객체의 key (일반 dict는 "$"로 시작하는 key가 있으면 $map으로 저장해 tag와 구분)
+_TAG_PREFIX = "$"
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    pruned: int = 0
+    invalidated: bool = False
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.0%} hit rate), {self.writes} writes, {self.pruned} pruned"
+        )
+        if self.invalidated:
+            text += " [invalidated: version changed]"
+        return text
+
+
+def _encode(value: Any) -> Any:
+    """frontmatter 값 → JSON 값 (date/datetime/set/bytes/문자열이 아닌 key는 tag 객체)
+
+    Raises:
+        TypeError: 저장할 수 없는 타입 (해당 항목은 캐시하지 않음)
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, datetime):  # date보다 먼저 (datetime은 date의 하위 클래스)
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        if all(isinstance(k, str) and not k.startswith(_TAG_PREFIX) for k in value):
+            return {k: _encode(v) for k, v in value.items()}
+        return {"$map": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, (set, frozenset)):
+        return {"$set": [_encode(v) for v in value]}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"cannot cache value of type {type(value).__name__}")
+
+
+def _hashable(value: Any) -> Any:
+    """dict key/set 항목으로 복원된 list → tuple"""
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
+
+
+def _decode_tag(obj: Dict[str, Any]) -> Any:
+    """json.loads object_hook: tag 객체 → 원래 값"""
+    if len(obj) == 1:
+        tag, payload = next(iter(obj.items()))
+        if tag == "$datetime":
+            return datetime.fromisoformat(payload)
+        if tag == "$date":
+            return date.fromisoformat(payload)
+        if tag == "$map":
+            return {_hashable(k): v for k, v in payload}
+        if tag == "$set":
+            return {_hashable(v) for v in payload}
+        if tag == "$bytes":
+            return base64.b64decode(payload)
+    return obj
+
+
+def _dump_entry(entry: Dict[str, Any]) -> Optional[bytes]:
+    """캐시 항목 직렬화 (저장할 수 없는 값이 있으면 None)"""
+    try:
+        return json.dumps(_encode(entry), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_entry_data(data: bytes) -> Dict[str, Any]:
+    """_dump_entry의 역변환
+
+    Raises:
+        ValueError: 손상되었거나 JSON이 아닌 데이터 (이전 pickle 형식 포함)
+    """
+    entry = json.loads(data, object_hook=_decode_tag)
+    if not isinstance(entry, dict):
+        raise ValueError("cache entry is not an object")
+    return entry
+
+
+def load_schema_version(vault_root: Path) -> str:
+    """00_Meta/schema_constants.yaml의 schema_version (없으면 빈 문자열)"""
+    yaml_path = Path(vault_root) / "00_Meta" / "schema_constants.yaml"
+    if not yaml_path.exists():
+        return ""
+    try:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            constants = safe_load(f.read()) or {}
+    except (OSError, yaml.YAMLError):
+        return ""
+    return str(constants.get("schema_version", ""))
+
+
+class FrontmatterCache:
+    """SQLite 기반 frontmatter 캐시
+
+    값은 JSON으로 저장합니다 (created/due 같은 date 객체는 tag 인코딩으로 보존, _dump_entry 참고).
+    """
+
+    def __init__(self, db_path: Union[str, Path], version: str):
+        self.db_path = Path(db_path)
+        self.version = version
+        self.stats = CacheStats()
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._init_schema()
+
+    @classmethod
+    def open(cls, vault_root: Union[str, Path], db_path: Optional[Path] = None) -> "FrontmatterCache":
+        """Vault 기본 위치(_build/.fm_cache.sqlite)의 캐시 열기"""
+        vault_root = Path(vault_root)
+        if db_path is None:
+            build_dir = vault_root / "_build"
+            build_dir.mkdir(exist_ok=True)
+            db_path = build_dir / CACHE_FILENAME
+        version = f"{CACHE_FORMAT}:{PARSER_VERSION}:{load_schema_version(vault_root)}"
+        return cls(db_path, version)
+
+    def _init_schema(self) -> None:
+        conn = self._conn
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS frontmatter ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " data BLOB NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS blobs (sha TEXT PRIMARY KEY, data BLOB NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS blob_paths (path TEXT PRIMARY KEY, sha TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS content_hashes ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " sha TEXT NOT NULL)"
+        )
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            if row is not None:
+                self.stats.invalidated = True
+            conn.execute("DELETE FROM frontmatter")
+            conn.execute("DELETE FROM blobs")
+            conn.execute("DELETE FROM blob_paths")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self.version,))
+        conn.commit()
+
+    def get(self, relative_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (mtime/size가 다르면 miss)"""
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, data FROM frontmatter WHERE path = ?", (relative_path,)
+        ).fetchone()
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            self.stats.misses += 1
+            return None
+        return self._load(row[2])
+
+    def get_blob(self, sha: str) -> Optional[Dict[str, Any]]:
+        """blob SHA 키 캐시 조회 (git backend)"""
+        row = self._conn.execute("SELECT data FROM blobs WHERE sha = ?", (sha,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        return self._load(row[0])
+
+    def _load(self, data: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            entry = _load_entry_data(data)
+        except (ValueError, TypeError):
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry
+
+    def put(self, relative_path: str, mtime_ns: int, size: int, entry: Dict[str, Any]) -> None:
+        """캐시 저장 (commit은 close/flush 시, 저장할 수 없는 값이 있으면 건너뜀)"""
+        data = _dump_entry(entry)
+        if data is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO frontmatter (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+            (relative_path, mtime_ns, size, data),
+        )
+        self.stats.writes += 1
+
+    def put_blob(self, sha: str, entry: Dict[str, Any]) -> None:
+        """blob SHA 키 캐시 저장 (git backend, 저장할 수 없는 값이 있으면 건너뜀)"""
+        data = _dump_entry(entry)
+        if data is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO blobs (sha, data) VALUES (?, ?)",
+            (sha, data),
+        )
+        self.stats.writes += 1
+
+    def get_content_hash(self, relative_path: str, mtime_ns: int, size: int) -> Optional[str]:
+        """파일 내용 hash 조회 (mtime/size가 다르면 None, 통계에 포함하지 않음)"""
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, sha FROM content_hashes WHERE path = ?", (relative_path,)
+        ).fetchone()
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            return None
+        return row[2]
+
+    def put_content_hash(self, relative_path: str, mtime_ns: int, size: int, sha: str) -> None:
+        """파일 내용 hash 저장 (commit은 close/flush 시)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO content_hashes (path, mtime_ns, size, sha) VALUES (?, ?, ?, ?)",
+            (relative_path, mtime_ns, size, sha),
+        )
+
+    def prune_content_hashes(self, prefixes: Sequence[str], seen_paths: Iterable[str]) -> int:
+        """prefixes 안에서 이번에 보이지 않은 파일의 내용 hash 제거
+
+        Returns:
+            제거한 항목 수
+        """
+        seen = set(seen_paths)
+        stale = [
+            path for (path,) in self._conn.execute("SELECT path FROM content_hashes")
+            if path not in seen and any(path.startswith(p) for p in prefixes)
+        ]
+        self._conn.executemany("DELETE FROM content_hashes WHERE path = ?", [(p,) for p in stale])
+        return len(stale)
+
+    def prune(self, prefixes: Sequence[str], seen_paths: Iterable[str]) -> None:
+        """스캔 범위(prefixes) 안에서 이번에 보이지 않은 (삭제된) 파일 제거"""
+        seen = set(seen_paths)
+        stale = [
+            path for (path,) in self._conn.execute("SELECT path FROM frontmatter")
+            if path not in seen and any(path.startswith(p) for p in prefixes)
+        ]
+        self._conn.executemany("DELETE FROM frontmatter WHERE path = ?", [(p,) for p in stale])
+        self.stats.pruned += len(stale)
+
+    def prune_blobs(self, prefixes: Sequence[str], path_shas: Dict[str, str]) -> None:
+        """스캔 범위(prefixes) 안의 경로 → blob 기록을 갱신하고, 어떤 경로도 참조하지 않는 blob 제거
+
+        범위 밖 경로(다른 include로 스캔하는 스크립트)의 기록과 blob은 그대로 둡니다.
+
+        Args:
+            prefixes: 이번 스캔의 include 경로
+            path_shas: 이번 스캔에서 본 relative_path → blob 키
+        """
+        stale_paths = [
+            path for (path,) in self._conn.execute("SELECT path FROM blob_paths")
+            if path not in path_shas and any(path.startswith(p) for p in prefixes)
+        ]
+        self._conn.executemany("DELETE FROM blob_paths WHERE path = ?", [(p,) for p in stale_paths])
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO blob_paths (path, sha) VALUES (?, ?)", list(path_shas.items())
+        )
+        cursor = self._conn.execute(
+            "DELETE FROM blobs WHERE sha NOT IN (SELECT sha FROM blob_paths)"
+        )
+        self.stats.pruned += cursor.rowcount
+
+    def flush(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "FrontmatterCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_cache(vault_root: Union[str, Path]) -> Optional[FrontmatterCache]:
+    """캐시 열기, 실패 시 (읽기 전용 볼륨 등) 경고 후 None"""
+    try:
+        return FrontmatterCache.open(vault_root)
+    except (OSError, sqlite3.Error) as e:
+        warnings.warn(f"Frontmatter cache disabled: {e}", RuntimeWarning)
+        return None
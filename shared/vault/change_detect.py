@@ -0,0 +1,231 @@
+"""
+Change Detection Backends
+
+스캐너가 캐시 재사용 여부를 판단하는 변경 감지 backend입니다.
+
+- mtime: 파일마다 stat, (relative_path, st_mtime_ns, st_size) 키로 캐시 조회 (기본값)
+- git: `git ls-files -s`의 blob SHA와 `git status --porcelain`으로 변경 판단,
+  blob SHA 키로 캐시 조회. mtime과 무관하므로 NAS ↔ 로컬 SSD처럼 checkout이 다른
+  머신에서도 복사한 캐시(_build/.fm_cache.sqlite, JSON 저장)를 그대로 재사용할 수 있습니다.
+  수정/untracked/ignored 파일은 작업 트리 내용으로 blob SHA를 직접 계산합니다.
+
+Usage:
+    from shared.vault import VaultScanner
+
+    collection = VaultScanner(vault_root, change_detection="git").scan()
+"""
+
+import hashlib
+import os
+import subprocess
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from .cache import FrontmatterCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .scanner import VaultFile
+
+DEFAULT_CHANGE_DETECTION = "mtime"
+
+
+class ChangeDetectionError(Exception):
+    """backend 준비 실패 (git 없음, repo 아님 등)"""
+
+
+class ChangeDetector:
+    """변경 감지 backend 인터페이스
+
+    fingerprint()가 반환한 키로 캐시를 조회/저장하며, 키가 같으면 파싱 결과를 재사용합니다.
+    """
+
+    name = ""
+
+    def prepare(self, vault_root: Path, include_paths: Sequence[str]) -> None:
+        """스캔 시작 전 1회 호출"""
+
+    def fingerprint(self, vf: "VaultFile") -> Any:
+        """파일 변경 판단 키
+
+        Raises:
+            OSError: 파일 접근 실패
+        """
+        raise NotImplementedError
+
+    def get(self, cache: FrontmatterCache, vf: "VaultFile", key: Any) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def put(self, cache: FrontmatterCache, vf: "VaultFile", key: Any, entry: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def prune(
+        self,
+        cache: FrontmatterCache,
+        include_paths: Sequence[str],
+        files: Sequence["VaultFile"],
+        keys: Iterable[Any],
+    ) -> None:
+        """이번 스캔에서 보이지 않은 캐시 항목 정리"""
+
+
+class MtimeChangeDetector(ChangeDetector):
+    """stat 기반 (relative_path, st_mtime_ns, st_size)"""
+
+    name = "mtime"
+
+    def fingerprint(self, vf: "VaultFile") -> Any:
+        st = vf.filepath.stat()
+        vf.mtime = st.st_mtime
+        return (st.st_mtime_ns, st.st_size)
+
+    def get(self, cache, vf, key):
+        return cache.get(vf.relative_path, key[0], key[1])
+
+    def put(self, cache, vf, key, entry):
+        cache.put(vf.relative_path, key[0], key[1], entry)
+
+    def prune(self, cache, include_paths, files, keys):
+        cache.prune(include_paths, (vf.relative_path for vf in files))
+
+
+def git_blob_sha(path: Path) -> str:
+    """`git hash-object`와 같은 blob SHA-1 (작업 트리 내용 기준)"""
+    data = Path(path).read_bytes()
+    h = hashlib.sha1(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+def _run_git(vault_root: Path, args: List[str]) -> bytes:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(vault_root)] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise ChangeDetectionError(f"git {args[0]} failed: {e}") from e
+    return result.stdout
+
+
+class GitIndexChangeDetector(ChangeDetector):
+    """git index blob SHA 기반
+
+    tracked 파일은 stat 없이 index의 blob SHA를 키로 사용합니다.
+    `git status --porcelain`에 작업 트리 변경으로 나온 파일과 index에 없는 파일만
+    내용을 읽어 blob SHA를 계산합니다.
+
+    CRLF checkout(core.autocrlf=true / core.eol=crlf)에서는 같은 blob이라도
+    작업 트리 내용(body_offset)이 다르므로 키에 줄바꿈 방식을 포함합니다.
+    """
+
+    name = "git"
+
+    def __init__(self) -> None:
+        self.index_shas: Dict[str, str] = {}
+        self.dirty: Set[str] = set()
+        self.eol = "lf"
+        self.path_keys: Dict[str, str] = {}  # 이번 스캔의 relative_path → 캐시 키 (prune 범위 제한용)
+
+    def prepare(self, vault_root: Path, include_paths: Sequence[str]) -> None:
+        prefix = _run_git(vault_root, ["rev-parse", "--show-prefix"]).decode("utf-8").strip()
+        pathspecs = ["--"] + list(include_paths)
+
+        self.index_shas = {}
+        self.dirty = set()
+        self.path_keys = {}
+        ls_output = _run_git(vault_root, ["ls-files", "-s", "-z", "--full-name"] + pathspecs)
+        for record in ls_output.split(b"\0"):
+            if not record:
+                continue
+            meta, _, path = record.partition(b"\t")
+            _mode, sha, stage = meta.split(b" ")
+            relative = self._vault_relative(path.decode("utf-8"), prefix)
+            if relative is None:
+                continue
+            if stage != b"0":
+                # merge conflict 중인 파일은 작업 트리 기준
+                self.dirty.add(relative)
+                continue
+            self.index_shas[relative] = sha.decode("ascii")
+
+        status_output = _run_git(
+            vault_root, ["status", "--porcelain", "-z", "--untracked-files=all"] + pathspecs
+        )
+        records = iter(status_output.split(b"\0"))
+        for record in records:
+            if len(record) < 4:
+                continue
+            x, y, path = chr(record[0]), chr(record[1]), record[3:].decode("utf-8")
+            if x in "RC":
+                next(records, None)  # rename/copy 원본 경로
+            if x == "?" or y != " ":
+                relative = self._vault_relative(path, prefix)
+                if relative is not None:
+                    self.dirty.add(relative)
+
+        autocrlf = _git_config(vault_root, "core.autocrlf")
+        eol = _git_config(vault_root, "core.eol")
+        self.eol = "crlf" if autocrlf == "true" or eol == "crlf" else "lf"
+
+    @staticmethod
+    def _vault_relative(repo_path: str, prefix: str) -> Optional[str]:
+        """repo 루트 기준 경로 → vault 루트 기준 relative_path (OS 구분자)"""
+        if prefix:
+            if not repo_path.startswith(prefix):
+                return None
+            repo_path = repo_path[len(prefix):]
+        return repo_path.replace("/", os.sep)
+
+    def fingerprint(self, vf: "VaultFile") -> Any:
+        sha = None if vf.relative_path in self.dirty else self.index_shas.get(vf.relative_path)
+        if sha is None:
+            sha = git_blob_sha(vf.filepath)
+        key = self.path_keys[vf.relative_path] = f"{sha}:{self.eol}"
+        return key
+
+    def get(self, cache, vf, key):
+        return cache.get_blob(key)
+
+    def put(self, cache, vf, key, entry):
+        cache.put_blob(key, entry)
+
+    def prune(self, cache, include_paths, files, keys):
+        cache.prune_blobs(include_paths, self.path_keys)
+
+
+def _git_config(vault_root: Path, key: str) -> str:
+    try:
+        return _run_git(vault_root, ["config", "--get", key]).decode("utf-8").strip().lower()
+    except ChangeDetectionError:
+        return ""  # 설정 없음 (exit 1)
+
+
+CHANGE_DETECTORS = {
+    MtimeChangeDetector.name: MtimeChangeDetector,
+    GitIndexChangeDetector.name: GitIndexChangeDetector,
+}
+
+
+def prepare_change_detector(
+    name: str,
+    vault_root: Path,
+    include_paths: Sequence[str],
+) -> ChangeDetector:
+    """backend 생성 + 준비, 실패 시 경고 후 mtime backend로 fallback
+
+    Raises:
+        ValueError: 알 수 없는 backend 이름
+    """
+    if name not in CHANGE_DETECTORS:
+        raise ValueError(f"Unknown change detection backend: {name} (choose from {', '.join(CHANGE_DETECTORS)})")
+    detector = CHANGE_DETECTORS[name]()
+    try:
+        detector.prepare(vault_root, include_paths)
+    except ChangeDetectionError as e:
+        warnings.warn(f"{name} change detection unavailable, using mtime: {e}", RuntimeWarning)
+        detector = MtimeChangeDetector()
+        detector.prepare(vault_root, include_paths)
+    return detector
@@ -0,0 +1,170 @@
+"""
+Entity Model
+
+빌드 스크립트가 공유하는 compact 엔티티 모델.
+기존 {"filepath": Path, "relative_path": str, "frontmatter": dict} dict 대신
+자주 쓰는 필드만 __slots__ 속성으로 보관합니다.
+
+- type/status/owner/assignee/priority_flag/conditions_3y 같은 저카디널리티 문자열은 intern
+- validates/validated_by/conditions_3y 리스트는 tuple로 고정
+- outgoing_relations는 (type, target_id) tuple의 tuple (dict가 아닌 항목은 제외)
+- 원본 frontmatter는 기본적으로 보관하지 않고, 처음 .frontmatter에 접근할 때 파일에서 다시 읽어 보관
+  (keep_frontmatter=True면 파싱된 dict를 그대로 보관, 파일을 다시 읽지 않음)
+
+필드 값이 없으면 None (relation 필드는 빈 tuple).
+리스트가 아닌 relation 값은 원본 그대로 두므로 호출 측은 isinstance(value, tuple)로 확인합니다.
+
+Usage:
+    from shared.vault import VaultScanner
+
+    entities = VaultScanner(vault_root).scan().entity_map(prefix="50_Projects")
+    task = entities["tsk-abc123-1767000000000"]
+    task.status, task.parent_id, task.validates
+    task.frontmatter.get("notes")  # lazy (첫 접근 시 1회 로드)
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# (slot, frontmatter key) — intern 대상 단일 문자열 필드
+_INTERNED_FIELDS = (
+    ("type", "entity_type"),
+    ("status", "status"),
+    ("owner", "owner"),
+    ("priority_flag", "priority_flag"),
+)
+
+# (slot, frontmatter key) — 그대로 보관하는 단일 값 필드
+_PLAIN_FIELDS = (
+    ("name", "entity_name"),
+    ("parent_id", "parent_id"),
+    ("project_id", "project_id"),
+    ("hypothesis_id", "hypothesis_id"),
+    ("created", "created"),
+    ("updated", "updated"),
+    ("due", "due"),
+)
+
+# (slot, frontmatter key) — 리스트 → tuple 필드
+_TUPLE_FIELDS = (
+    ("validates", "validates"),
+    ("validated_by", "validated_by"),
+)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(value: Any) -> Any:
+    """list → 각 문자열을 intern한 tuple, 그 외 값은 그대로"""
+    if isinstance(value, list):
+        return tuple(_intern(v) for v in value)
+    return _intern(value)
+
+
+def _freeze_list(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _freeze_relations(value: Any) -> Any:
+    """outgoing_relations → ((type, target_id), ...)"""
+    if not isinstance(value, list):
+        return value
+    return tuple(
+        (_intern(rel.get("type")), rel.get("target_id"))
+        for rel in value
+        if isinstance(rel, dict)
+    )
+
+
+class Entity:
+    """Vault 엔티티 (frontmatter hot field + lazy 원본 frontmatter)"""
+
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "status",
+        "parent_id",
+        "project_id",
+        "hypothesis_id",
+        "owner",
+        "assignee",
+        "priority_flag",
+        "created",
+        "updated",
+        "due",
+        "conditions_3y",
+        "outgoing_relations",
+        "validates",
+        "validated_by",
+        "relative_path",
+        "_root",
+        "_frontmatter",
+    )
+
+    def __init__(self, entity_id: str, relative_path: str = "", root: Optional[Path] = None):
+        self.id = entity_id
+        self.relative_path = relative_path
+        self._root = root
+        self._frontmatter: Optional[Dict[str, Any]] = None
+        for slot, _ in _INTERNED_FIELDS + _PLAIN_FIELDS:
+            setattr(self, slot, None)
+        self.assignee = None
+        self.conditions_3y: Any = ()
+        self.outgoing_relations: Any = ()
+        self.validates: Any = ()
+        self.validated_by: Any = ()
+
+    @classmethod
+    def from_frontmatter(
+        cls,
+        frontmatter: Dict[str, Any],
+        relative_path: str = "",
+        root: Optional[Path] = None,
+        keep_frontmatter: bool = False,
+    ) -> "Entity":
+        """파싱된 frontmatter dict에서 생성
+
+        Args:
+            frontmatter: entity_id가 있는 frontmatter
+            relative_path: vault 루트 기준 경로
+            root: vault 루트 (filepath / lazy frontmatter 로드에 사용)
+            keep_frontmatter: True면 원본 dict를 보관 (False면 첫 접근 시 파일에서 다시 읽음)
+        """
+        entity = cls(frontmatter["entity_id"], _intern(relative_path), root)
+        get = frontmatter.get
+        for slot, key in _INTERNED_FIELDS:
+            setattr(entity, slot, _intern(get(key)))
+        for slot, key in _PLAIN_FIELDS:
+            setattr(entity, slot, get(key))
+        for slot, key in _TUPLE_FIELDS:
+            setattr(entity, slot, _freeze_list(get(key, ())))
+        entity.assignee = _intern_list(get("assignee"))
+        entity.conditions_3y = _intern_list(get("conditions_3y", ()))
+        entity.outgoing_relations = _freeze_relations(get("outgoing_relations", ()))
+        if keep_frontmatter:
+            entity._frontmatter = frontmatter
+        return entity
+
+    @property
+    def filepath(self) -> Path:
+        return (self._root or Path(".")) / self.relative_path
+
+    @property
+    def frontmatter(self) -> Dict[str, Any]:
+        """원본 frontmatter (보관하지 않았으면 첫 접근 시 파일 헤더를 읽어 파싱하고 보관)"""
+        if self._frontmatter is None:
+            from .scanner import load_entry  # scanner → entity 순환 import 방지
+
+            self._frontmatter = load_entry(self.filepath).get("frontmatter") or {}
+        return self._frontmatter
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """원본 frontmatter.get (hot field가 아닌 값 조회용)"""
+        return self.frontmatter.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"Entity({self.id!r}, type={self.type!r}, status={self.status!r})"
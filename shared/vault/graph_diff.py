@@ -0,0 +1,146 @@
+"""
+Graph Diff
+
+두 graph.json 스냅샷 사이의 변경 (노드 추가/삭제/변경, 에지 추가/삭제, status 전이).
+Discord digest, n8n 알림이 전체 graph를 다시 읽지 않고 변경분만 받도록 합니다.
+
+- 노드 비교: id별 content hash (정렬된 key의 compact JSON → blake2b), hash가 다른 노드만 필드 비교
+- 에지 비교: (source, target, type) 집합 차이
+- 전체 O(노드 + 에지), 순서는 새 graph 순서 (삭제된 항목은 이전 graph 순서)
+
+Usage:
+    from shared.vault.graph_diff import diff_graphs
+
+    diff = diff_graphs(json.load(open(old_path)), json.load(open(new_path)))
+    for transition in diff.status_transitions:
+        print(transition["id"], transition["from"], "→", transition["to"])
+
+CLI: scripts/graph_diff.py
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+NODE_HASH_SIZE = 16
+
+
+def node_hash(node: Dict[str, Any]) -> str:
+    """노드 content hash (key 순서와 무관)"""
+    text = json.dumps(node, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=NODE_HASH_SIZE).hexdigest()
+
+
+def node_hashes(nodes: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """id → content hash (graph.json 순서)"""
+    return {node["id"]: node_hash(node) for node in nodes}
+
+
+def _edge_key(edge: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return edge.get("source"), edge.get("target"), edge.get("type")
+
+
+def _field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """필드별 [이전, 이후] (없던/없어진 필드는 None)"""
+    return {
+        key: [old.get(key), new.get(key)]
+        for key in list(old) + [k for k in new if k not in old]
+        if old.get(key) != new.get(key)
+    }
+
+
+@dataclass
+class GraphDiff:
+    """graph.json 변경분"""
+    old_generated: Optional[str] = None
+    new_generated: Optional[str] = None
+    added_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    removed_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    # {"id", "type", "changes": {field: [old, new]}}
+    changed_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    # {"id", "type", "from", "to"} (추가/삭제된 노드 제외)
+    status_transitions: List[Dict[str, Any]] = field(default_factory=list)
+    added_edges: List[Dict[str, Any]] = field(default_factory=list)
+    removed_edges: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes or self.removed_nodes or self.changed_nodes
+            or self.added_edges or self.removed_edges
+        )
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added_nodes": len(self.added_nodes),
+            "removed_nodes": len(self.removed_nodes),
+            "changed_nodes": len(self.changed_nodes),
+            "status_transitions": len(self.status_transitions),
+            "added_edges": len(self.added_edges),
+            "removed_edges": len(self.removed_edges),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "old_generated": self.old_generated,
+            "new_generated": self.new_generated,
+            "summary": self.summary(),
+            "added_nodes": self.added_nodes,
+            "removed_nodes": self.removed_nodes,
+            "changed_nodes": self.changed_nodes,
+            "status_transitions": self.status_transitions,
+            "added_edges": self.added_edges,
+            "removed_edges": self.removed_edges,
+        }
+
+
+def diff_graphs(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    old_hashes: Optional[Dict[str, str]] = None,
+) -> GraphDiff:
+    """두 graph.json dict 비교
+
+    Args:
+        old: 이전 graph.json (json.load 결과)
+        new: 현재 graph.json
+        old_hashes: 이전 노드 hash (이미 계산해 둔 경우, 없으면 old에서 계산)
+
+    Returns:
+        GraphDiff
+    """
+    old_nodes = {node["id"]: node for node in old.get("nodes", [])}
+    if old_hashes is None:
+        old_hashes = node_hashes(old_nodes.values())
+    diff = GraphDiff(old_generated=old.get("generated"), new_generated=new.get("generated"))
+
+    new_ids = set()
+    for node in new.get("nodes", []):
+        node_id = node["id"]
+        new_ids.add(node_id)
+        previous = old_nodes.get(node_id)
+        if previous is None:
+            diff.added_nodes.append(node)
+            continue
+        if old_hashes.get(node_id) == node_hash(node):
+            continue
+        changes = _field_changes(previous, node)
+        if not changes:
+            continue
+        diff.changed_nodes.append({"id": node_id, "type": node.get("type"), "changes": changes})
+        if "status" in changes:
+            diff.status_transitions.append({
+                "id": node_id,
+                "type": node.get("type"),
+                "from": changes["status"][0],
+                "to": changes["status"][1],
+            })
+    diff.removed_nodes = [node for node_id, node in old_nodes.items() if node_id not in new_ids]
+
+    old_edges = {_edge_key(edge) for edge in old.get("edges", [])}
+    new_edges = {_edge_key(edge) for edge in new.get("edges", [])}
+    diff.added_edges = [edge for edge in new.get("edges", []) if _edge_key(edge) not in old_edges]
+    diff.removed_edges = [edge for edge in old.get("edges", []) if _edge_key(edge) not in new_edges]
+
+    return diff
@@ -0,0 +1,361 @@
+"""
+Graph Reader
+
+_build/graph.json을 json.load 없이 읽는 reader. 노드 하나만 필요한 짧은 스크립트
+(n8n 트리거 등)가 전체 파싱 비용/메모리를 치르지 않게 합니다.
+
+- 스트리밍: iter_nodes() / iter_edges()는 파일을 chunk 단위로 읽으며 원소를 하나씩 파싱
+  (원하는 배열 앞의 값은 원소 단위로 건너뜀, 메모리는 원소 하나 크기)
+- sidecar offset 인덱스 (_build/graph.json.idx): build_graph_index.py가 graph.json과 함께 저장
+  - 노드 id → graph.json 내 byte 구간, top-level key → byte 구간
+  - graph.json 크기/mtime이 기록과 다르면 사용하지 않음 (스트리밍으로 fallback)
+- GraphReader.node(id)는 seek + 노드 하나만 파싱, nodes(entity_type=, status=)는
+  by_type/by_status 구간만 파싱한 뒤 해당 노드만 seek
+
+Usage:
+    from shared.vault.graph_reader import GraphReader
+
+    with GraphReader(vault_root / "_build" / "graph.json") as graph:
+        graph.node("prj-abc123")
+        for node in graph.nodes(entity_type="Task", status="doing"):
+            ...
+"""
+
+import codecs
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..utils.artifact import write_bytes_if_changed
+
+GRAPH_OFFSETS_SUFFIX = ".idx"
+# 레이아웃이 바뀌면 올림
+GRAPH_OFFSETS_VERSION = 1
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class GraphReaderError(Exception):
+    """graph.json 구조 오류 (top-level object가 아님, 잘린 파일 등)"""
+
+
+def offsets_path_for(graph_path: Union[str, Path]) -> Path:
+    """graph.json → graph.json.idx"""
+    graph_path = Path(graph_path)
+    return graph_path.with_name(graph_path.name + GRAPH_OFFSETS_SUFFIX)
+
+
+class _JsonStream:
+    """파일을 chunk 단위로 읽는 JSON 토큰 스트림 (byte offset 추적 선택)"""
+
+    def __init__(self, f, track_offsets: bool = False):
+        self._f = f
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._track = track_offsets
+        #: 현재 위치(_buf[_pos])의 파일 byte offset (track_offsets=True일 때만 정확)
+        self.offset = f.tell()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._f.read(_CHUNK_SIZE)
+        self._eof = not data
+        self._buf = self._buf[self._pos:] + self._utf8.decode(data, final=self._eof)
+        self._pos = 0
+        return bool(data)
+
+    def _advance(self, end: int) -> None:
+        if self._track:
+            self.offset += len(self._buf[self._pos:end].encode("utf-8"))
+        self._pos = end
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 "")"""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._advance(pos)
+            if pos < len(buf) or not self._fill():
+                return buf[pos] if pos < len(buf) else ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise GraphReaderError(f"expected {char!r}, found {found or 'end of file'!r}")
+        self._advance(self._pos + 1)
+
+    def value(self) -> Tuple[Any, int, int]:
+        """JSON 값 하나 파싱
+
+        Returns:
+            (값, 시작 byte offset, 끝 byte offset)
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise GraphReaderError(f"invalid JSON: {e}") from e
+                continue
+            # 숫자/리터럴이 chunk 경계에서 잘렸을 수 있으므로 뒤에 구분자가 보일 때까지 확인
+            if end == len(self._buf) and self._fill():
+                continue
+            start = self.offset
+            self._advance(end)
+            return obj, start, self.offset
+
+    def items(self) -> Iterator[str]:
+        """object의 key를 순서대로 생성 (호출 측이 value를 소비해야 다음 key로 진행)"""
+        self.expect("{")
+        if self.peek() == "}":
+            self._advance(self._pos + 1)
+            return
+        while True:
+            key, _, _ = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._advance(self._pos + 1)
+                continue
+            self.expect("}")
+            return
+
+    def elements(self) -> Iterator[Tuple[Any, int, int]]:
+        """array 원소를 하나씩 (값, 시작, 끝)으로 생성"""
+        self.expect("[")
+        if self.peek() == "]":
+            self._advance(self._pos + 1)
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._advance(self._pos + 1)
+                continue
+            self.expect("]")
+            return
+
+    def skip(self) -> Tuple[int, int]:
+        """값 하나를 건너뜀 (array/object는 원소 단위라 메모리는 원소 하나 크기)
+
+        Returns:
+            (시작 byte offset, 끝 byte offset)
+        """
+        char = self.peek()
+        start = self.offset
+        if char == "[":
+            for _ in self.elements():
+                pass
+        elif char == "{":
+            for _ in self.items():
+                self.skip()
+        else:
+            self.value()
+        return start, self.offset
+
+
+def _iter_array(path: Union[str, Path], key: str) -> Iterator[Any]:
+    with open(path, "rb") as f:
+        stream = _JsonStream(f)
+        for name in stream.items():
+            if name == key:
+                for element, _, _ in stream.elements():
+                    yield element
+                return
+            stream.skip()
+
+
+def iter_nodes(path: Union[str, Path]) -> Iterator[Dict]:
+    """graph.json nodes를 하나씩 (전체 파싱 없음)"""
+    return _iter_array(path, "nodes")
+
+
+def iter_edges(path: Union[str, Path]) -> Iterator[Dict]:
+    """graph.json edges를 하나씩 (nodes는 원소 단위로 건너뜀)"""
+    return _iter_array(path, "edges")
+
+
+def read_section(path: Union[str, Path], key: str, default: Any = None) -> Any:
+    """top-level 값 하나만 파싱 (by_type, by_status 등, 앞의 큰 배열은 원소 단위로 건너뜀)"""
+    with open(path, "rb") as f:
+        stream = _JsonStream(f)
+        for name in stream.items():
+            if name == key:
+                return stream.value()[0]
+            stream.skip()
+    return default
+
+
+def build_graph_offsets(path: Union[str, Path]) -> Dict[str, Any]:
+    """graph.json을 한 번 스트리밍해 sidecar offset 인덱스 생성
+
+    Returns:
+        {"version", "source": {"size", "mtime_ns"}, "sections": {key: [start, end]},
+         "nodes": {id: [start, end]}}
+    """
+    path = Path(path)
+    stat = path.stat()
+    sections: Dict[str, List[int]] = {}
+    nodes: Dict[str, List[int]] = {}
+    with open(path, "rb") as f:
+        stream = _JsonStream(f, track_offsets=True)
+        for name in stream.items():
+            if name == "nodes":
+                stream.peek()
+                start = stream.offset
+                for node, node_start, node_end in stream.elements():
+                    node_id = node.get("id") if isinstance(node, dict) else None
+                    if isinstance(node_id, str):
+                        nodes[node_id] = [node_start, node_end]
+                sections[name] = [start, stream.offset]
+            else:
+                sections[name] = list(stream.skip())
+    return {
+        "version": GRAPH_OFFSETS_VERSION,
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+        "sections": sections,
+        "nodes": nodes,
+    }
+
+
+def _offsets_match(offsets: Dict[str, Any], stat: os.stat_result) -> bool:
+    source = offsets.get("source") or {}
+    return (
+        offsets.get("version") == GRAPH_OFFSETS_VERSION
+        and source.get("size") == stat.st_size
+        and source.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _load_offsets(index_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_graph_offsets(graph_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None) -> bool:
+    """graph.json.idx 저장 (기존 인덱스가 현재 graph.json과 맞으면 스캔하지 않음)
+
+    Returns:
+        저장했으면 True
+    """
+    graph_path = Path(graph_path)
+    index_path = Path(index_path) if index_path else offsets_path_for(graph_path)
+    existing = _load_offsets(index_path)
+    if existing is not None and _offsets_match(existing, graph_path.stat()):
+        return False
+    offsets = build_graph_offsets(graph_path)
+    data = json.dumps(offsets, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return write_bytes_if_changed(index_path, data)
+
+
+class GraphReader:
+    """graph.json 부분 조회 (sidecar 인덱스가 맞으면 seek, 아니면 스트리밍)"""
+
+    def __init__(self, path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        self.path = Path(path)
+        self._f = open(self.path, "rb")
+        offsets = _load_offsets(Path(index_path) if index_path else offsets_path_for(self.path))
+        if offsets is not None and not _offsets_match(offsets, os.fstat(self._f.fileno())):
+            offsets = None
+        self._offsets = offsets
+        self._sections: Dict[str, Any] = {}
+
+    @property
+    def indexed(self) -> bool:
+        """sidecar 인덱스 사용 여부"""
+        return self._offsets is not None
+
+    def _read_range(self, span: List[int]) -> Any:
+        start, end = span
+        self._f.seek(start)
+        return json.loads(self._f.read(end - start).decode("utf-8"))
+
+    def section(self, key: str, default: Any = None) -> Any:
+        """top-level 값 (by_type, by_status, conditions_3y_index, generated 등, 결과는 보관)
+
+        nodes/edges는 iter_nodes()/edges()로 조회합니다.
+        """
+        if key not in self._sections:
+            if self._offsets is not None:
+                span = self._offsets["sections"].get(key)
+                self._sections[key] = default if span is None else self._read_range(span)
+            else:
+                self._sections[key] = read_section(self.path, key, default)
+        return self._sections[key]
+
+    def node(self, node_id: str) -> Optional[Dict]:
+        """노드 하나 (인덱스가 있으면 해당 구간만 읽음)"""
+        if self._offsets is not None:
+            span = self._offsets["nodes"].get(node_id)
+            return None if span is None else self._read_range(span)
+        for node in iter_nodes(self.path):
+            if node.get("id") == node_id:
+                return node
+        return None
+
+    def node_ids(self) -> List[str]:
+        if self._offsets is not None:
+            return list(self._offsets["nodes"])
+        return [node.get("id") for node in iter_nodes(self.path)]
+
+    def nodes(self, entity_type: Optional[str] = None, status: Optional[str] = None) -> Iterator[Dict]:
+        """노드 (graph.json 순서), entity_type/status로 필터
+
+        인덱스가 있으면 by_type/by_status에서 id를 고른 뒤 해당 노드만 읽습니다.
+        """
+        if self._offsets is None:
+            for node in iter_nodes(self.path):
+                if entity_type is not None and node.get("type") != entity_type:
+                    continue
+                if status is not None and node.get("status") != status:
+                    continue
+                yield node
+            return
+
+        ids: Optional[List[str]] = None
+        for key, value in (("by_type", entity_type), ("by_status", status)):
+            if value is None:
+                continue
+            selected = self.section(key, {}).get(value, [])
+            if ids is None:
+                ids = selected
+            else:
+                selected_ids = set(selected)
+                ids = [node_id for node_id in ids if node_id in selected_ids]
+        spans = self._offsets["nodes"]
+        for node_id in (spans if ids is None else ids):
+            span = spans.get(node_id)
+            if span is not None:
+                yield self._read_range(span)
+
+    def edges(self) -> Iterator[Dict]:
+        """edges (스트리밍, 인덱스가 있으면 edges 구간부터 읽음)"""
+        if self._offsets is None:
+            yield from iter_edges(self.path)
+            return
+        span = self._offsets["sections"].get("edges")
+        if span is None:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(span[0])
+            for edge, _, _ in _JsonStream(f).elements():
+                yield edge
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "GraphReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,287 @@
+"""
+Hierarchy Labels
+
+parent_id 계층 (NorthStar → MetaHypothesis → Condition → Track → Program → Project → Task)의
+pre-order 구간 라벨. build_graph_index.py가 _build/hierarchy.json에 씁니다.
+
+- 부모: parent_id (없으면 project_id)
+- 각 엔티티는 pre-order 위치 pre와 subtree 끝 end (exclusive)를 가짐
+  - a가 d의 조상: pre[a] < pre[d] < end[a] (정수 비교 2번)
+  - a의 subtree: order[pre[a]:end[a]] (재귀 탐색 없이 slice)
+- 루트와 형제는 엔티티 순서 (graph.json nodes 순서)
+- 이상 감지 (anomalies):
+  - cycles: parent 체인 순환 (순환 안에서 엔티티 순서가 가장 앞선 엔티티를 루트로 끊고 라벨링)
+  - missing_parent: parent가 엔티티에 없음 (해당 엔티티는 루트)
+  - multi_parent: parent_id와 project_id가 다르고 project_id가 조상이 아님
+
+Usage:
+    from shared.vault.hierarchy import load_hierarchy
+
+    hierarchy = load_hierarchy(vault_root / "_build" / "hierarchy.json")
+    hierarchy.descendants("cond-b", entity_type="Task")   # query_recipes Q2
+    hierarchy.is_ancestor("trk-2", "tsk-abc123-1767000000000")
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..utils.artifact import write_bytes_if_changed
+from .entity import Entity
+
+HIERARCHY_FILENAME = "hierarchy.json"
+# 레이아웃이 바뀌면 올림
+HIERARCHY_VERSION = 1
+
+
+class HierarchyError(Exception):
+    """hierarchy.json 형식 오류"""
+
+
+class HierarchyIndex:
+    """pre-order 구간 라벨 조회
+
+    Attributes:
+        order: pre-order 엔티티 id 목록
+        types: order와 같은 순서의 entity_type
+        parents: order와 같은 순서의 부모 위치 (루트는 -1)
+        ends: order와 같은 순서의 subtree 끝 위치 (exclusive)
+        depths: order와 같은 순서의 깊이 (루트는 0)
+        anomalies: {"cycles", "missing_parent", "multi_parent"}
+    """
+
+    def __init__(
+        self,
+        order: List[str],
+        types: List[Optional[str]],
+        parents: List[int],
+        ends: List[int],
+        depths: List[int],
+        anomalies: Optional[Dict[str, List]] = None,
+    ):
+        self.order = order
+        self.types = types
+        self.parents = parents
+        self.ends = ends
+        self.depths = depths
+        self.anomalies = anomalies or {"cycles": [], "missing_parent": [], "multi_parent": []}
+        self.pre: Dict[str, int] = {entity_id: i for i, entity_id in enumerate(order)}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self.pre
+
+    @property
+    def anomaly_count(self) -> int:
+        return sum(len(items) for items in self.anomalies.values())
+
+    def interval(self, entity_id: str) -> Optional[tuple]:
+        """(pre, end) 또는 None"""
+        pre = self.pre.get(entity_id)
+        return None if pre is None else (pre, self.ends[pre])
+
+    def is_ancestor(self, ancestor_id: str, entity_id: str) -> bool:
+        """ancestor_id가 entity_id의 (자기 자신이 아닌) 조상인지"""
+        a = self.pre.get(ancestor_id)
+        d = self.pre.get(entity_id)
+        if a is None or d is None:
+            return False
+        return a < d < self.ends[a]
+
+    def subtree(self, entity_id: str, entity_type: Optional[str] = None) -> List[str]:
+        """entity_id와 모든 하위 엔티티 (pre-order)"""
+        pre = self.pre.get(entity_id)
+        if pre is None:
+            return []
+        end = self.ends[pre]
+        if entity_type is None:
+            return self.order[pre:end]
+        types = self.types
+        return [self.order[i] for i in range(pre, end) if types[i] == entity_type]
+
+    def descendants(self, entity_id: str, entity_type: Optional[str] = None) -> List[str]:
+        """모든 하위 엔티티 (자기 자신 제외, pre-order)"""
+        pre = self.pre.get(entity_id)
+        if pre is None:
+            return []
+        end = self.ends[pre]
+        if entity_type is None:
+            return self.order[pre + 1:end]
+        types = self.types
+        return [self.order[i] for i in range(pre + 1, end) if types[i] == entity_type]
+
+    def subtree_size(self, entity_id: str) -> int:
+        pre = self.pre.get(entity_id)
+        return 0 if pre is None else self.ends[pre] - pre
+
+    def parent(self, entity_id: str) -> Optional[str]:
+        pre = self.pre.get(entity_id)
+        if pre is None or self.parents[pre] < 0:
+            return None
+        return self.order[self.parents[pre]]
+
+    def ancestors(self, entity_id: str) -> List[str]:
+        """부모부터 루트까지"""
+        pre = self.pre.get(entity_id)
+        result = []
+        if pre is None:
+            return result
+        pos = self.parents[pre]
+        while pos >= 0:
+            result.append(self.order[pos])
+            pos = self.parents[pos]
+        return result
+
+    def depth(self, entity_id: str) -> Optional[int]:
+        pre = self.pre.get(entity_id)
+        return None if pre is None else self.depths[pre]
+
+    def roots(self) -> List[str]:
+        return [self.order[i] for i, parent in enumerate(self.parents) if parent < 0]
+
+    def to_dict(self, generated: str = "") -> Dict[str, Any]:
+        return {
+            "version": HIERARCHY_VERSION,
+            "generated": generated,
+            "order": self.order,
+            "types": self.types,
+            "parents": self.parents,
+            "ends": self.ends,
+            "depths": self.depths,
+            "anomalies": self.anomalies,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HierarchyIndex":
+        """
+        Raises:
+            HierarchyError: 버전 불일치 또는 배열 길이 불일치
+        """
+        if data.get("version") != HIERARCHY_VERSION:
+            raise HierarchyError(
+                f"unsupported hierarchy version {data.get('version')} (expected {HIERARCHY_VERSION})"
+            )
+        try:
+            fields = [data[key] for key in ("order", "types", "parents", "ends", "depths")]
+        except KeyError as e:
+            raise HierarchyError(f"missing field {e}") from e
+        if len({len(values) for values in fields}) != 1:
+            raise HierarchyError("hierarchy arrays have different lengths")
+        return cls(*fields, anomalies=data.get("anomalies"))
+
+
+def _effective_parent(entity: Entity) -> Optional[str]:
+    parent_id = entity.parent_id or entity.project_id
+    return str(parent_id) if parent_id else None
+
+
+def build_hierarchy(entities: Dict[str, Entity]) -> HierarchyIndex:
+    """엔티티 dict (graph.json nodes 순서)에서 구간 라벨 계산
+
+    Returns:
+        HierarchyIndex (anomalies 포함)
+    """
+    rank = {entity_id: i for i, entity_id in enumerate(entities)}
+    anomalies: Dict[str, List] = {"cycles": [], "missing_parent": [], "multi_parent": []}
+
+    parent_of: Dict[str, str] = {}
+    for entity_id, entity in entities.items():
+        parent_id = _effective_parent(entity)
+        if parent_id is None:
+            continue
+        if parent_id not in entities:
+            anomalies["missing_parent"].append({"id": entity_id, "parent_id": parent_id})
+            continue
+        parent_of[entity_id] = parent_id
+
+    # 순환 감지: parent 체인을 따라가다 이번 walk에서 본 노드를 다시 만나면 순환
+    visited: Dict[str, int] = {}
+    for walk, entity_id in enumerate(entities):
+        path = []
+        node = entity_id
+        while node not in visited:
+            visited[node] = walk
+            path.append(node)
+            if node not in parent_of:
+                break
+            node = parent_of[node]
+        else:
+            if visited[node] == walk:
+                cycle = path[path.index(node):]
+                root = min(cycle, key=rank.__getitem__)
+                start = cycle.index(root)
+                anomalies["cycles"].append(cycle[start:] + cycle[:start])
+                del parent_of[root]
+
+    children: Dict[str, List[str]] = defaultdict(list)
+    for entity_id in entities:
+        if entity_id in parent_of:
+            children[parent_of[entity_id]].append(entity_id)
+
+    order: List[str] = []
+    types: List[Optional[str]] = []
+    parents: List[int] = []
+    depths: List[int] = []
+    ends: List[int] = []
+    for root in entities:
+        if root in parent_of:
+            continue
+        # (entity_id, parent 위치, depth) = 진입, int = 해당 위치 subtree 종료
+        stack: List = [(root, -1, 0)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                ends[item] = len(order)
+                continue
+            entity_id, parent_pos, depth = item
+            pos = len(order)
+            order.append(entity_id)
+            types.append(entities[entity_id].type)
+            parents.append(parent_pos)
+            depths.append(depth)
+            ends.append(pos + 1)
+            stack.append(pos)
+            for child_id in reversed(children.get(entity_id, ())):
+                stack.append((child_id, pos, depth + 1))
+
+    index = HierarchyIndex(order, types, parents, ends, depths, anomalies)
+
+    for entity_id, entity in entities.items():
+        parent_id = entity.parent_id
+        project_id = entity.project_id
+        if parent_id and project_id and parent_id != project_id:
+            if not index.is_ancestor(str(project_id), entity_id):
+                anomalies["multi_parent"].append({
+                    "id": entity_id,
+                    "parent_id": str(parent_id),
+                    "project_id": str(project_id),
+                })
+
+    return index
+
+
+def write_hierarchy(path: Union[str, Path], index: HierarchyIndex, generated: str = "") -> Tuple[bool, int]:
+    """hierarchy.json 저장 (임시 파일 → rename, 내용이 같으면 쓰지 않음)
+
+    Returns:
+        (실제로 썼는지, 파일 크기 bytes)
+    """
+    data = json.dumps(index.to_dict(generated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return write_bytes_if_changed(path, data), len(data)
+
+
+def load_hierarchy(path: Union[str, Path]) -> HierarchyIndex:
+    """
+    Raises:
+        OSError: 파일 없음/읽기 실패
+        HierarchyError: 형식 오류
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise HierarchyError(str(e)) from e
+    return HierarchyIndex.from_dict(data)
@@ -0,0 +1,280 @@
+"""
+Vault Merkle Tree
+
+include 경로 아래 .md 파일의 디렉토리별 Merkle hash tree (_build/merkle.json).
+NAS, 로컬 SSD가 각자 만든 tree의 root hash만 비교하고, 다르면 hash가 다른 하위 디렉토리로만
+내려가서 어긋난 파일을 찾습니다 (전체 파일 목록 비교 대신 깊이 × 디렉토리 폭 정도의 비교).
+
+- leaf: 파일 내용의 git blob SHA-1 (`git hash-object`와 같음, mtime/경로와 무관해 머신 간 비교 가능)
+- 디렉토리: 정렬된 "name\\0hash\\n" 목록의 SHA-1 (하위 디렉토리 name은 "/"로 끝남)
+- leaf hash는 frontmatter 캐시(_build/.fm_cache.sqlite)의 content_hashes 테이블에
+  (relative_path, mtime_ns, size) 키로 저장, 변경된 파일만 다시 읽음
+- 순회 범위는 스캐너와 같음 (walk_markdown, paths.include/exclude)
+
+Usage:
+    from shared.vault.merkle import build_merkle, diff_merkle, load_merkle, write_merkle
+
+    tree, stats = build_merkle(vault_root, cache=cache)
+    write_merkle(tree, vault_root / "_build" / "merkle.json")
+
+    diff = diff_merkle(tree, load_merkle(Path("/tmp/nas-merkle.json")))
+    print(diff.changed, diff.comparisons)
+
+CLI: scripts/vault_merkle.py
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..utils.artifact import GENERATED_JSON_STAMP, write_stamped
+from .cache import FrontmatterCache
+from .change_detect import git_blob_sha
+from .scanner import ScanConfig, load_scan_config
+from .walker import walk_markdown
+
+MERKLE_FILENAME = "merkle.json"
+MERKLE_VERSION = 1
+
+
+class MerkleError(Exception):
+    """merkle.json 형식 오류 (버전 불일치, 손상)"""
+
+
+@dataclass
+class MerkleStats:
+    """build_merkle() 통계"""
+    files: int = 0
+    hashed: int = 0
+    reused: int = 0
+    pruned: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.files} files, {self.hashed} hashed, {self.reused} reused, {self.pruned} pruned"
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+def directory_hash(children: Dict[str, str]) -> str:
+    """디렉토리 hash (child name 정렬 순, 입력 순서와 무관)"""
+    h = hashlib.sha1()
+    for name in sorted(children):
+        h.update(f"{name}\0{children[name]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclass
+class MerkleTree:
+    """디렉토리 → {child name: hash} (vault 루트는 "", 하위 디렉토리 name은 "/"로 끝남)"""
+    dirs: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    generated: Optional[str] = None
+
+    @classmethod
+    def from_files(cls, file_hashes: Dict[str, str], generated: Optional[str] = None) -> "MerkleTree":
+        """relative_path("/" 구분) → leaf hash에서 tree 구성 (깊은 디렉토리부터 hash 계산)"""
+        dirs: Dict[str, Dict[str, str]] = {"": {}}
+        for path, sha in file_hashes.items():
+            directory, _, name = path.rpartition("/")
+            dirs.setdefault(directory, {})[name] = sha
+            # 상위 디렉토리 등록 (hash는 아래에서 채움)
+            while directory:
+                parent, _, dirname = directory.rpartition("/")
+                siblings = dirs.setdefault(parent, {})
+                if dirname + "/" in siblings:
+                    break
+                siblings[dirname + "/"] = ""
+                directory = parent
+
+        for directory in sorted(dirs, key=lambda d: d.count("/") + bool(d), reverse=True):
+            if directory:
+                parent, _, dirname = directory.rpartition("/")
+                dirs[parent][dirname + "/"] = directory_hash(dirs[directory])
+        return cls({d: dict(sorted(children.items())) for d, children in sorted(dirs.items())}, generated)
+
+    @property
+    def root(self) -> str:
+        return directory_hash(self.dirs.get("", {}))
+
+    def children(self, directory: str) -> Dict[str, str]:
+        """디렉토리의 {child name: hash} (없으면 빈 dict)"""
+        return self.dirs.get(directory, {})
+
+    def iter_files(self, directory: str = "") -> Iterator[Tuple[str, str]]:
+        """directory 아래 모든 (relative_path, leaf hash) (경로 순)"""
+        for name, sha in self.children(directory).items():
+            if name.endswith("/"):
+                yield from self.iter_files(_join(directory, name[:-1]))
+            else:
+                yield _join(directory, name), sha
+
+    def file_count(self) -> int:
+        return sum(1 for children in self.dirs.values() for name in children if not name.endswith("/"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "generated": self.generated,
+            "version": MERKLE_VERSION,
+            "root": self.root,
+            "files": self.file_count(),
+            "dirs": self.dirs,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MerkleTree":
+        """
+        Raises:
+            MerkleError: 버전이 다르거나 root hash가 dirs와 맞지 않음
+        """
+        if not isinstance(data, dict) or data.get("version") != MERKLE_VERSION:
+            raise MerkleError(f"unsupported merkle version: {data.get('version') if isinstance(data, dict) else None}")
+        tree = cls(data.get("dirs") or {}, data.get("generated"))
+        if data.get("root") != tree.root:
+            raise MerkleError("root hash does not match directory entries")
+        return tree
+
+
+@dataclass
+class MerkleDiff:
+    """두 tree 사이의 어긋난 파일 (relative_path 목록)"""
+    changed: List[str] = field(default_factory=list)
+    local_only: List[str] = field(default_factory=list)
+    remote_only: List[str] = field(default_factory=list)
+    # 비교한 child hash 수 (root 비교 포함), 내려간 디렉토리 수
+    comparisons: int = 0
+    dirs_visited: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.changed or self.local_only or self.remote_only)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "changed": self.changed,
+            "local_only": self.local_only,
+            "remote_only": self.remote_only,
+            "comparisons": self.comparisons,
+            "dirs_visited": self.dirs_visited,
+        }
+
+
+def diff_merkle(local: MerkleTree, remote: MerkleTree) -> MerkleDiff:
+    """root부터 hash가 다른 하위 디렉토리로만 내려가며 비교
+
+    한쪽에만 있는 디렉토리는 더 비교하지 않고 그 아래 파일을 모두 보고합니다.
+
+    Returns:
+        MerkleDiff (각 목록은 경로 순)
+    """
+    diff = MerkleDiff(comparisons=1)
+    if local.root == remote.root:
+        return diff
+
+    stack = [""]
+    while stack:
+        directory = stack.pop()
+        diff.dirs_visited += 1
+        local_children = local.children(directory)
+        remote_children = remote.children(directory)
+        for name in sorted(set(local_children) | set(remote_children)):
+            diff.comparisons += 1
+            local_hash = local_children.get(name)
+            remote_hash = remote_children.get(name)
+            if local_hash == remote_hash:
+                continue
+            path = _join(directory, name.rstrip("/"))
+            if not name.endswith("/"):
+                target = diff.changed if local_hash and remote_hash else (
+                    diff.local_only if local_hash else diff.remote_only
+                )
+                target.append(path)
+            elif local_hash and remote_hash:
+                stack.append(path)
+            elif local_hash:
+                diff.local_only.extend(p for p, _ in local.iter_files(path))
+            else:
+                diff.remote_only.extend(p for p, _ in remote.iter_files(path))
+
+    diff.changed.sort()
+    diff.local_only.sort()
+    diff.remote_only.sort()
+    return diff
+
+
+def build_merkle(
+    vault_root: Union[str, Path],
+    config: Optional[ScanConfig] = None,
+    cache: Optional[FrontmatterCache] = None,
+    now: Optional[str] = None,
+) -> Tuple[MerkleTree, MerkleStats]:
+    """vault의 Merkle tree 계산
+
+    Args:
+        vault_root: Vault 루트
+        config: 스캔 경로 (없으면 schema_constants.yaml)
+        cache: 전달하면 (path, mtime_ns, size)가 같은 파일의 leaf hash 재사용 + 삭제된 파일 정리
+        now: generated 값 (기본 현재 시각)
+
+    Returns:
+        (MerkleTree, MerkleStats)
+    """
+    root = Path(vault_root).resolve()
+    config = config or load_scan_config(root)
+    stats = MerkleStats()
+
+    file_hashes: Dict[str, str] = {}
+    for filepath in walk_markdown(root, config.include_paths, config.exclude_paths):
+        relative = filepath.relative_to(root).as_posix()
+        try:
+            st = os.stat(filepath)
+            sha = cache.get_content_hash(relative, st.st_mtime_ns, st.st_size) if cache else None
+            if sha is None:
+                sha = git_blob_sha(filepath)
+                stats.hashed += 1
+                if cache:
+                    cache.put_content_hash(relative, st.st_mtime_ns, st.st_size, sha)
+            else:
+                stats.reused += 1
+        except OSError:
+            continue  # 순회 중 삭제된 파일
+        file_hashes[relative] = sha
+    stats.files = len(file_hashes)
+
+    if cache:
+        stats.pruned = cache.prune_content_hashes(config.include_paths, file_hashes)
+        cache.flush()
+
+    return MerkleTree.from_files(file_hashes, now or datetime.now().isoformat()), stats
+
+
+def write_merkle(tree: MerkleTree, path: Union[str, Path]) -> bool:
+    """merkle.json 저장 (hash가 이전과 같으면 generated 포함 그대로 유지)
+
+    Returns:
+        실제로 썼는지 여부
+    """
+    def render(stamp: str) -> bytes:
+        tree.generated = stamp
+        return (json.dumps(tree.to_dict(), indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+    written, tree.generated = write_stamped(path, render, tree.generated or "", GENERATED_JSON_STAMP)
+    return written
+
+
+def load_merkle(path: Union[str, Path]) -> MerkleTree:
+    """
+    Raises:
+        OSError: 파일 읽기 실패
+        MerkleError: JSON/형식 오류
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise MerkleError(f"invalid merkle.json: {e}") from e
+    return MerkleTree.from_dict(data)
@@ -0,0 +1,386 @@
+"""
+Relation Registry
+
+00_Meta/relation_types.md의 관계를 frontmatter 필드에서 뽑는 extractor 등록소.
+build_graph_index.py (graph.json edges)와 check_orphans.py (끊어진 링크, validates 대칭 검사)가
+같은 필드 지식을 공유합니다. 새 관계는 전체 순회를 추가하지 않고 register_relation() 한 번으로 추가합니다.
+
+- extractor: (entity_id, Entity) → [(source, target, edge_type)] (null/빈값 제외)
+  relation 리스트 항목은 비어 있지 않은 문자열 id만 에지로 사용 (dict/list 같은 잘못된 값은 무시)
+  에지는 entity_id가 source 또는 target이어야 함 (patch_edges가 에지 양 끝 엔티티만 다시 추출)
+- graph=False extractor는 참조 검사 전용 (project_id, hypothesis_id)
+- Entity hot field가 아닌 frontmatter 키를 읽는 extractor는 fields로 선언
+  (빌드 스크립트가 해당 엔티티의 frontmatter를 보관해 파일을 다시 읽지 않음, --incremental은 전체 재생성)
+- extract_edges(): 엔티티당 1회 순회로 모든 extractor 적용, (source, target, type) 중복 제거
+- edges 순서: 등록 순 블록, 블록 안은 엔티티 순 (group_by_source면 source별 그룹, 첫 등장 순)
+- patch_edges(): 변경된 엔티티의 이전/현재 에지만 추출해 이전 edges를 갱신 (extract_edges와 같은 결과)
+
+기본 등록 순서: parent_of → project_id → hypothesis_id → outgoing_relations → validates → validated_by
+(outgoing_relations 하나가 enables/blocks/depends_on/supports/triggers_shutdown/contains/... 타입을 그대로 씀)
+
+Usage:
+    from shared.vault.relations import RelationExtractor, extract_edges, register_relation
+
+    register_relation(RelationExtractor(
+        name="evaluates",
+        extract=lambda entity_id, entity: [(entity_id, t, "evaluates") for t in entity.get("evaluates") or ()],
+        label="evaluates target",
+        fields=("evaluates",),
+    ))
+    edges = extract_edges(entities)   # [{"source", "target", "type"}]
+    edges = patch_edges(previous_edges, previous_entities, entities, dirty_ids)   # --incremental
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .entity import Entity
+
+# (source, target, edge_type)
+Edge = Tuple[str, str, str]
+
+
+@dataclass
+class RelationExtractor:
+    """관계 하나의 추출 규칙
+
+    Attributes:
+        name: registry key
+        extract: (entity_id, entity) → [(source, target, edge_type)] (source 또는 target = entity_id)
+        graph: graph.json edges에 포함 여부 (False면 참조 검사 전용)
+        group_by_source: edges 블록을 source별로 묶음 (parent_of: parent별 children)
+        reference: 다른 엔티티를 가리키는 쪽 ("source" 또는 "target")
+        label: 끊어진 참조 메시지의 필드명 (None이면 참조 검사 안 함)
+        ignore_prefixes: 엔티티가 아닌 특수 참조 (예: "action:")
+        fields: extract가 entity.get()으로 읽는 frontmatter 키 (Entity hot field만 쓰면 빈 tuple)
+    """
+    name: str
+    extract: Callable[[str, Entity], List[Edge]]
+    graph: bool = True
+    group_by_source: bool = False
+    reference: str = "target"
+    label: Optional[str] = None
+    ignore_prefixes: Tuple[str, ...] = ()
+    fields: Tuple[str, ...] = ()
+
+    def referenced_id(self, edge: Edge) -> str:
+        return edge[0] if self.reference == "source" else edge[1]
+
+
+def _is_id(value) -> bool:
+    """relation 리스트 항목이 엔티티 id로 쓸 수 있는 값인지 (비어 있지 않은 문자열)"""
+    return isinstance(value, str) and bool(value)
+
+
+def _parent_of(entity_id: str, entity: Entity) -> List[Edge]:
+    parent_id = entity.parent_id
+    return [(parent_id, entity_id, "parent_of")] if parent_id else []
+
+
+def _project_id(entity_id: str, entity: Entity) -> List[Edge]:
+    project_id = entity.project_id
+    return [(entity_id, project_id, "project_id")] if project_id else []
+
+
+def _hypothesis_id(entity_id: str, entity: Entity) -> List[Edge]:
+    hypothesis_id = entity.hypothesis_id
+    return [(entity_id, hypothesis_id, "hypothesis_id")] if hypothesis_id else []
+
+
+def _outgoing_relations(entity_id: str, entity: Entity) -> List[Edge]:
+    relations = entity.outgoing_relations
+    if not isinstance(relations, tuple):
+        return []
+    return [(entity_id, target_id, rel_type) for rel_type, target_id in relations if _is_id(target_id)]
+
+
+def _validates(entity_id: str, entity: Entity) -> List[Edge]:
+    validates = entity.validates
+    if not isinstance(validates, tuple):
+        return []
+    return [(entity_id, target_id, "validates") for target_id in validates if _is_id(target_id)]
+
+
+def _validated_by(entity_id: str, entity: Entity) -> List[Edge]:
+    """validated_by는 validates의 역방향 표기 (같은 validates 에지)"""
+    validated_by = entity.validated_by
+    if not isinstance(validated_by, tuple):
+        return []
+    return [(source_id, entity_id, "validates") for source_id in validated_by if _is_id(source_id)]
+
+
+RELATIONS: Dict[str, RelationExtractor] = {}
+
+
+def register_relation(
+    extractor: RelationExtractor,
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+) -> RelationExtractor:
+    """extractor 등록 (등록 순서 = edges 블록 순서)
+
+    Raises:
+        ValueError: 같은 name이 이미 등록됨
+    """
+    registry = RELATIONS if registry is None else registry
+    if extractor.name in registry:
+        raise ValueError(f"relation '{extractor.name}' is already registered")
+    registry[extractor.name] = extractor
+    return extractor
+
+
+for _extractor in (
+    RelationExtractor("parent_of", _parent_of, group_by_source=True, reference="source", label="parent_id"),
+    RelationExtractor("project_id", _project_id, graph=False, label="project_id"),
+    RelationExtractor("hypothesis_id", _hypothesis_id, graph=False, label="hypothesis_id"),
+    RelationExtractor("outgoing_relations", _outgoing_relations, label="relation target", ignore_prefixes=("action:",)),
+    RelationExtractor("validates", _validates, label="validates target"),
+    RelationExtractor("validated_by", _validated_by, reference="source"),
+):
+    register_relation(_extractor)
+
+
+def relation_fields(registry: Optional[Dict[str, RelationExtractor]] = None) -> Tuple[str, ...]:
+    """등록된 extractor가 선언한 frontmatter 키 (등록 순, 중복 제거)
+
+    비어 있지 않으면 엔티티를 keep_frontmatter=True로 만들어야 extractor가 파일을 다시 읽지 않습니다.
+    """
+    extractors = (RELATIONS if registry is None else registry).values()
+    return tuple(dict.fromkeys(field for extractor in extractors for field in extractor.fields))
+
+
+def _selected(
+    registry: Optional[Dict[str, RelationExtractor]],
+    graph_only: bool,
+) -> List[RelationExtractor]:
+    extractors = (RELATIONS if registry is None else registry).values()
+    return [extractor for extractor in extractors if extractor.graph or not graph_only]
+
+
+def iter_relations(
+    entities: Dict[str, Entity],
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+    graph_only: bool = False,
+) -> Iterator[Tuple[str, RelationExtractor, Edge]]:
+    """엔티티당 1회 순회로 (entity_id, extractor, edge) 생성 (엔티티 순, 엔티티 안에서는 등록 순)"""
+    extractors = _selected(registry, graph_only)
+    for entity_id, entity in entities.items():
+        for extractor in extractors:
+            for edge in extractor.extract(entity_id, entity):
+                yield entity_id, extractor, edge
+
+
+def extract_edges(
+    entities: Dict[str, Entity],
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+) -> List[Dict[str, str]]:
+    """graph.json edges (graph=True extractor, 중복 제거)
+
+    Returns:
+        [{"source", "target", "type"}] (등록 순 블록, 같은 에지는 처음 나온 것만)
+    """
+    extractors = _selected(registry, graph_only=True)
+    blocks: Dict[str, Dict] = {extractor.name: {} for extractor in extractors}
+    for entity_id, extractor, edge in iter_relations(entities, registry, graph_only=True):
+        key = edge[0] if extractor.group_by_source else entity_id
+        blocks[extractor.name].setdefault(key, []).append(edge)
+
+    edges = []
+    seen = set()
+    for block in blocks.values():
+        for group in block.values():
+            for edge in group:
+                if edge not in seen:
+                    seen.add(edge)
+                    edges.append({"source": edge[0], "target": edge[1], "type": edge[2]})
+    return edges
+
+
+class EdgePatchError(Exception):
+    """이전 edges를 부분 갱신할 수 없음 (extract_edges로 전체 추출)"""
+
+
+# 에지 기여 1건: (블록 번호, 엔티티 안 블록별 순번, edge)
+_Occurrence = Tuple[int, int, Edge]
+
+
+def _occurrences(extractors: List[RelationExtractor], entity_id: str, entity: Entity) -> List[_Occurrence]:
+    """엔티티 하나의 graph 에지 기여 (extractor 순, extractor 안에서는 반환 순)
+
+    Raises:
+        EdgePatchError: entity_id가 양 끝에 없는 에지 (patch_edges가 다시 찾을 수 없음)
+    """
+    occurrences = []
+    for block, extractor in enumerate(extractors):
+        for i, edge in enumerate(extractor.extract(entity_id, entity)):
+            if edge[0] != entity_id and edge[1] != entity_id:
+                raise EdgePatchError(f"relation '{extractor.name}' emitted {edge} from unrelated entity {entity_id}")
+            occurrences.append((block, i, edge))
+    return occurrences
+
+
+def patch_edges(
+    previous_edges: List[Dict[str, str]],
+    previous_entities: Dict[str, Entity],
+    entities: Dict[str, Entity],
+    dirty: Iterable[str],
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+) -> List[Dict[str, str]]:
+    """이전 extract_edges 결과를 변경된 엔티티 기준으로 갱신 (extract_edges(entities)와 같은 결과)
+
+    dirty 엔티티의 이전/현재 기여만 registry로 추출하고, 영향받는 에지는 양 끝 엔티티의
+    기여 수(multiset count)를 다시 세어 0이면 제거합니다. 에지 위치는 첫 기여의 정렬 key
+    (블록, 그룹 첫 등장, 엔티티 순서, 순번)로 정하고, 영향받지 않은 에지는 이전 순서를 유지한 채
+    이분 탐색으로 병합합니다 (group_by_source 블록은 그룹 첫 등장이 바뀔 수 있어 그룹 전체를 다시 배치).
+    변경 없는 엔티티의 추출은 key 비교에 필요한 이웃 엔티티로 한정됩니다.
+
+    Args:
+        previous_edges: 이전 빌드의 edges (previous_entities로 만든 extract_edges 결과)
+        previous_entities: 이전 빌드의 엔티티 (스냅샷, dirty 엔티티의 이전 기여 추출용)
+        entities: 현재 엔티티 (dirty가 아닌 엔티티는 이전과 같은 기여, 순서도 이전과 같아야 함)
+        dirty: 추가/변경/삭제된 엔티티 id
+
+    Raises:
+        EdgePatchError: 이전 edges와 이전 엔티티가 맞지 않거나 extractor가 규칙을 어긴 경우,
+            fields를 선언한 extractor가 있는 경우 (스냅샷에 없는 필드라 변경을 알 수 없음)
+    """
+    extractors = _selected(registry, graph_only=True)
+    declared = [extractor.name for extractor in extractors if extractor.fields]
+    if declared:
+        raise EdgePatchError(f"relations {declared} read frontmatter fields not in entities.snap")
+    rank = {entity_id: i for i, entity_id in enumerate(entities)}
+    previous_keys = [(edge["source"], edge["target"], edge["type"]) for edge in previous_edges]
+    previous_set = set(previous_keys)
+
+    current: Dict[str, List[_Occurrence]] = {}
+
+    def occurrences_of(entity_id) -> List[_Occurrence]:
+        if entity_id not in current:
+            entity = entities.get(entity_id)
+            current[entity_id] = [] if entity is None else _occurrences(extractors, entity_id, entity)
+        return current[entity_id]
+
+    # dirty 엔티티의 이전/현재 기여 → 영향받는 에지, 그룹
+    dirty = list(dirty)
+    touched = set()
+    groups: Dict[Tuple[int, str], set] = defaultdict(set)  # (블록, source) → 현재 기여 후보 엔티티
+    for entity_id in dirty:
+        previous = previous_entities.get(entity_id)
+        old = [] if previous is None else _occurrences(extractors, entity_id, previous)
+        for block, _, edge in old:
+            if edge not in previous_set:
+                raise EdgePatchError(f"previous edges do not contain {edge}")
+        for block, _, edge in old + occurrences_of(entity_id):
+            touched.add(edge)
+            if extractors[block].group_by_source:
+                groups[(block, edge[0])].add(entity_id)
+
+    # 그룹 첫 등장 (rank, 순번): 기여 후보 = source 자신 + 이전 edges에서 source의 target + dirty 엔티티
+    by_source: Dict[str, List[str]] = defaultdict(list)
+    if any(extractor.group_by_source for extractor in extractors):
+        for source, target, _ in previous_keys:
+            by_source[source].append(target)
+    group_first: Dict[Tuple[int, str], Optional[Tuple[int, int]]] = {}
+
+    def first_of(block: int, source: str) -> Optional[Tuple[int, int]]:
+        group = (block, source)
+        if group not in group_first:
+            candidates = {source, *by_source.get(source, ()), *groups.get(group, ())}
+            members = [
+                (rank[entity_id], i, edge)
+                for entity_id in candidates if entity_id in rank
+                for occ_block, i, edge in occurrences_of(entity_id)
+                if occ_block == block and edge[0] == source
+            ]
+            group_first[group] = min(members)[:2] if members else None  # 그룹이 사라짐
+            if group in groups:
+                touched.update(edge for _, _, edge in members)
+        return group_first[group]
+
+    edge_keys: Dict[Edge, Optional[tuple]] = {}
+
+    def key_of(edge: Edge) -> Optional[tuple]:
+        """첫 기여의 정렬 key (남은 기여가 없으면 None)"""
+        if edge not in edge_keys:
+            keys = []
+            for entity_id in {edge[0], edge[1]}:
+                if entity_id not in rank:
+                    continue
+                for block, i, occurrence in occurrences_of(entity_id):
+                    if occurrence != edge:
+                        continue
+                    r = rank[entity_id]
+                    first = first_of(block, edge[0]) if extractors[block].group_by_source else (r, 0)
+                    keys.append((block, first, r, i))
+            edge_keys[edge] = min(keys) if keys else None
+        return edge_keys[edge]
+
+    # 영향받는 그룹의 멤버 에지도 다시 배치
+    for block, source in list(groups):
+        first_of(block, source)
+
+    kept = [key for key in previous_keys if key not in touched]
+    placed = sorted(
+        (key, edge) for edge, key in ((edge, key_of(edge)) for edge in touched) if key is not None
+    )
+
+    def before(position: int, key: tuple) -> bool:
+        kept_key = key_of(kept[position])
+        if kept_key is None:
+            raise EdgePatchError(f"unchanged edge {kept[position]} has no contributor")
+        return kept_key < key
+
+    # 병합: 직전 삽입 위치부터 galloping + 이분 탐색 (kept는 이전 순서 = key 순서).
+    # 탐색 구간을 삽입 위치 근처로 좁혀 key 계산(이웃 엔티티 추출)을 줄임
+    result: List[Edge] = []
+    start = 0
+    for key, edge in placed:
+        lo, step = start, 1
+        while lo + step <= len(kept) and before(lo + step - 1, key):
+            lo, step = lo + step, step * 2
+        hi = min(lo + step - 1, len(kept))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if before(mid, key):
+                lo = mid + 1
+            else:
+                hi = mid
+        result.extend(kept[start:lo])
+        result.append(edge)
+        start = lo
+    result.extend(kept[start:])
+    return [{"source": edge[0], "target": edge[1], "type": edge[2]} for edge in result]
+
+
+def dangling_references(
+    entities: Dict[str, Entity],
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+) -> List[Tuple[str, RelationExtractor, str]]:
+    """엔티티에 없는 id를 가리키는 참조 (label이 있는 extractor만)
+
+    Returns:
+        [(entity_id, extractor, referenced_id)] (엔티티 순)
+    """
+    dangling = []
+    for entity_id, extractor, edge in iter_relations(entities, registry):
+        if extractor.label is None:
+            continue
+        referenced_id = extractor.referenced_id(edge)
+        if referenced_id in entities or str(referenced_id).startswith(extractor.ignore_prefixes):
+            continue
+        dangling.append((entity_id, extractor, referenced_id))
+    return dangling
+
+
+def relation_pairs(
+    entities: Dict[str, Entity],
+    names: Sequence[str],
+    registry: Optional[Dict[str, RelationExtractor]] = None,
+) -> Dict[str, set]:
+    """extractor name별 (source, target) 집합 (대칭 검사용)"""
+    registry = RELATIONS if registry is None else registry
+    subset = {name: registry[name] for name in names}
+    pairs: Dict[str, set] = {name: set() for name in names}
+    for _, extractor, edge in iter_relations(entities, subset):
+        pairs[extractor.name].add((edge[0], edge[1]))
+    return pairs
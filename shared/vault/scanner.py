@@ -0,0 +1,430 @@
+"""
+Vault Scanner
+
+Vault를 한 번만 순회하고 각 파일의 frontmatter를 한 번만 파싱하여
+모든 빌드/검증 스크립트가 공유하는 엔티티 컬렉션을 만듭니다.
+
+기존에는 build_impact, build_graph_index, check_orphans, validate_schema,
+check_frontmatter_body_sync가 각자 rglob("*.md") + yaml.safe_load를 반복했습니다.
+
+Usage:
+    from shared.vault import VaultScanner
+
+    collection = VaultScanner(vault_root).scan()
+    projects = collection.select(entity_type="Project", prefix="50_Projects")
+    graph_entities = collection.entity_map()  # entity_id → Entity
+
+    # 캐시 없이 (--no-cache)
+    collection = VaultScanner(vault_root, use_cache=False).scan()
+
+    # 캐시 miss 파일을 4개 프로세스로 병렬 파싱 (--jobs 4, 결과 순서는 동일)
+    collection = VaultScanner(vault_root, jobs=4).scan()
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import yaml
+
+from ..utils.frontmatter_reader import FrontmatterHeader, read_body, read_frontmatter_header
+from ..utils.yaml_parser import safe_load
+from .cache import CacheStats, FrontmatterCache, open_cache
+from .change_detect import (
+    DEFAULT_CHANGE_DETECTION,
+    ChangeDetector,
+    MtimeChangeDetector,
+    prepare_change_detector,
+)
+from .entity import Entity
+from .walker import WalkStats, walk_markdown
+
+# 00_Meta/schema_constants.yaml 로드 실패 시 fallback (validate_schema.py와 동일)
+DEFAULT_INCLUDE_PATHS = ["01_North_Star", "20_Strategy", "50_Projects", "60_Hypotheses", "70_Experiments"]
+DEFAULT_EXCLUDE_PATHS = ["00_Meta/_TEMPLATES", "10_Study", "30_Ontology", "40_LOOP_OS", "90_Archive", "00_Inbox"]
+
+DEFAULT_EXCLUDE_FILES = ["_INDEX.md", "_ENTRY_POINT.md", "CLAUDE.md", "README.md", "_HOME.md", "_Graph_Index.md"]
+
+# --jobs 병렬 파싱: 파싱할 파일이 이보다 적으면 프로세스 풀을 띄우지 않음
+MIN_PARALLEL_FILES = 64
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class ScanConfig:
+    """스캔 경로 설정 (00_Meta/schema_constants.yaml의 paths 섹션)"""
+    include_paths: List[str] = field(default_factory=lambda: list(DEFAULT_INCLUDE_PATHS))
+    exclude_paths: List[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDE_PATHS))
+    exclude_files: List[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDE_FILES))
+
+
+def load_scan_config(vault_root: Path) -> ScanConfig:
+    """Load scan paths from 00_Meta/schema_constants.yaml
+
+    Args:
+        vault_root: Vault root directory
+
+    Returns:
+        ScanConfig (fallback defaults if YAML is missing)
+    """
+    yaml_path = Path(vault_root) / "00_Meta" / "schema_constants.yaml"
+    constants: Dict[str, Any] = {}
+    if yaml_path.exists():
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            constants = safe_load(f.read()) or {}
+
+    paths = constants.get("paths", {}) or {}
+    return ScanConfig(
+        include_paths=paths.get("include", list(DEFAULT_INCLUDE_PATHS)),
+        exclude_paths=paths.get("exclude", list(DEFAULT_EXCLUDE_PATHS)),
+        exclude_files=paths.get("exclude_files", list(DEFAULT_EXCLUDE_FILES)),
+    )
+
+
+@dataclass
+class VaultFile:
+    """스캔된 단일 마크다운 파일
+
+    frontmatter가 없으면 frontmatter=None, YAML 오류면 parse_error에 메시지,
+    읽기 실패면 read_error에 메시지가 들어갑니다.
+    스캔은 헤더만 읽으며, 본문은 read_body()/read_content() 호출 시 읽습니다.
+    """
+    filepath: Path
+    relative_path: str
+    frontmatter: Optional[Dict[str, Any]] = None
+    parse_error: Optional[str] = None
+    read_error: Optional[str] = None
+    mtime: Optional[float] = None
+    body_offset: int = 0
+    content: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.filepath.name
+
+    @property
+    def entity_id(self) -> Optional[str]:
+        if self.frontmatter:
+            return self.frontmatter.get("entity_id")
+        return None
+
+    @property
+    def entity_type(self) -> Optional[str]:
+        if self.frontmatter:
+            return self.frontmatter.get("entity_type")
+        return None
+
+    def get_mtime(self) -> float:
+        """수정 시각 (스캔 시 stat하지 않은 경우 lazy stat)"""
+        if self.mtime is None:
+            self.mtime = self.filepath.stat().st_mtime
+        return self.mtime
+
+    def read_content(self) -> str:
+        """파일 전체 내용 (lazy)"""
+        if self.content is None:
+            self.content = self.filepath.read_text(encoding="utf-8")
+        return self.content
+
+    def read_body(self) -> str:
+        """frontmatter 이후 본문 (body_offset부터 읽음)"""
+        return read_body(self.filepath, self.body_offset)
+
+
+def _matches_prefix(relative: str, prefixes: Union[str, Sequence[str], None]) -> bool:
+    """기존 스크립트와 동일한 문자열 prefix 매칭"""
+    if prefixes is None:
+        return True
+    if isinstance(prefixes, str):
+        prefixes = [prefixes]
+    return any(relative.startswith(p) for p in prefixes)
+
+
+class EntityCollection:
+    """스캔 결과 컬렉션
+
+    files는 relative_path 순으로 정렬되어 있어 출력이 순회 순서에 의존하지 않습니다.
+    """
+
+    def __init__(self, vault_root: Path, files: Iterable[VaultFile], config: Optional[ScanConfig] = None):
+        self.vault_root = Path(vault_root)
+        self.config = config or ScanConfig()
+        self.files: List[VaultFile] = sorted(files, key=lambda f: f.relative_path)
+        self.cache_stats: Optional[CacheStats] = None
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self) -> Iterator[VaultFile]:
+        return iter(self.files)
+
+    def select(
+        self,
+        entity_type: Union[str, Sequence[str], None] = None,
+        prefix: Union[str, Sequence[str], None] = None,
+        exclude_prefix: Union[str, Sequence[str], None] = None,
+        exclude_files: Optional[Sequence[str]] = None,
+        require_id: bool = False,
+    ) -> List[VaultFile]:
+        """조건에 맞는 파일 목록
+
+        Args:
+            entity_type: entity_type 값 (문자열 또는 목록)
+            prefix: relative_path prefix (문자열 또는 목록)
+            exclude_prefix: 제외할 relative_path prefix
+            exclude_files: 제외할 파일명
+            require_id: entity_id가 있는 파일만
+
+        Returns:
+            VaultFile 목록 (relative_path 순)
+        """
+        if isinstance(entity_type, str):
+            entity_type = [entity_type]
+
+        result = []
+        for vf in self.files:
+            if not _matches_prefix(vf.relative_path, prefix):
+                continue
+            if exclude_prefix and _matches_prefix(vf.relative_path, exclude_prefix):
+                continue
+            if exclude_files and vf.name in exclude_files:
+                continue
+            if entity_type is not None and vf.entity_type not in entity_type:
+                continue
+            if require_id and not (vf.frontmatter and "entity_id" in vf.frontmatter):
+                continue
+            result.append(vf)
+        return result
+
+    def validation_targets(self) -> List[VaultFile]:
+        """validate_schema / check_frontmatter_body_sync 검증 대상 (include - exclude)"""
+        return self.select(
+            prefix=self.config.include_paths,
+            exclude_prefix=self.config.exclude_paths,
+            exclude_files=self.config.exclude_files,
+        )
+
+    def entities(self, prefix: Union[str, Sequence[str], None] = None) -> Dict[str, VaultFile]:
+        """entity_id → VaultFile (중복 ID는 경로 순으로 나중 것이 우선)"""
+        return {vf.frontmatter["entity_id"]: vf for vf in self.select(prefix=prefix, require_id=True)}
+
+    def entity_map(
+        self,
+        prefix: Union[str, Sequence[str], None] = None,
+        entity_type: Union[str, Sequence[str], None] = None,
+        keep_frontmatter: bool = False,
+    ) -> Dict[str, Entity]:
+        """entity_id → Entity (중복 ID는 경로 순으로 나중 것이 우선)
+
+        Args:
+            keep_frontmatter: True면 Entity에 원본 frontmatter dict를 보관
+        """
+        return {
+            vf.frontmatter["entity_id"]: Entity.from_frontmatter(
+                vf.frontmatter, vf.relative_path, self.vault_root, keep_frontmatter
+            )
+            for vf in self.select(entity_type=entity_type, prefix=prefix, require_id=True)
+        }
+
+    def as_entity_dicts(
+        self,
+        prefix: Union[str, Sequence[str], None] = None,
+        entity_type: Union[str, Sequence[str], None] = None,
+    ) -> Dict[str, Dict]:
+        """이전 스크립트 형식 {"filepath", "relative_path", "frontmatter"} dict (entity_map() 권장)"""
+        return {
+            vf.frontmatter["entity_id"]: {
+                "filepath": vf.filepath,
+                "relative_path": vf.relative_path,
+                "frontmatter": vf.frontmatter,
+            }
+            for vf in self.select(entity_type=entity_type, prefix=prefix, require_id=True)
+        }
+
+
+def parse_frontmatter_header(header: Optional[FrontmatterHeader]) -> Dict[str, Any]:
+    """헤더 텍스트 YAML 파싱
+
+    Returns:
+        {"frontmatter": dict|None, "parse_error": str|None, "body_offset": int}
+    """
+    if header is None:
+        return {"frontmatter": None, "parse_error": None, "body_offset": 0}
+    result = {"frontmatter": None, "parse_error": None, "body_offset": header.body_offset}
+    try:
+        data = safe_load(header.text)
+    except yaml.YAMLError as e:
+        result["parse_error"] = str(e)
+        return result
+    # 빈 frontmatter / 스칼라는 frontmatter 없음과 동일하게 취급
+    if isinstance(data, dict):
+        result["frontmatter"] = data
+    return result
+
+
+def load_entry(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """헤더 읽기 + 파싱 (프로세스 풀 worker에서도 사용)
+
+    Returns:
+        parse_frontmatter_header() 결과, 읽기 실패 시 {"read_error": str}
+    """
+    try:
+        header = read_frontmatter_header(filepath)
+    except Exception as e:
+        return {"read_error": str(e)}
+    return parse_frontmatter_header(header)
+
+
+def _load_entries(filepaths: List[str]) -> List[Dict[str, Any]]:
+    """청크 단위 파싱 (ProcessPoolExecutor.map 대상)"""
+    return [load_entry(p) for p in filepaths]
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """--jobs 값 정규화 (0/None = CPU 코어 수)"""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+class VaultScanner:
+    """Vault 단일 패스 스캐너
+
+    include_paths 아래의 모든 .md 파일의 frontmatter 헤더만 읽고 한 번 파싱합니다.
+    use_cache=True면 _build/.fm_cache.sqlite에서 (path, mtime_ns, size)가 같은 파일의
+    파싱 결과를 재사용합니다 (--no-cache로 비활성화).
+    순회는 walk_markdown()이 include 밖과 exclude_paths 하위 트리를 진입 전에 잘라냅니다.
+    exclude_files 규칙은 EntityCollection.select()에서 적용하므로
+    검증 대상과 그래프 대상을 같은 스캔으로 처리합니다.
+
+    change_detection은 캐시 재사용 판단 backend입니다 ("mtime" 기본, "git"은
+    index blob SHA 기준, shared.vault.change_detect 참조).
+
+    jobs > 1이면 캐시 miss 파일의 파싱을 ProcessPoolExecutor로 청크 단위 분산하고,
+    결과는 경로 순서대로 합쳐지므로 worker 수와 무관하게 출력이 동일합니다.
+    """
+
+    def __init__(
+        self,
+        vault_root: Union[str, Path],
+        config: Optional[ScanConfig] = None,
+        use_cache: bool = True,
+        jobs: int = 1,
+        change_detection: str = DEFAULT_CHANGE_DETECTION,
+    ):
+        self.vault_root = Path(vault_root).resolve()
+        self.config = config or load_scan_config(self.vault_root)
+        self.use_cache = use_cache
+        self.jobs = resolve_jobs(jobs)
+        self.change_detection = change_detection
+        self.walk_stats = WalkStats()
+
+    def iter_paths(self) -> Iterator[Path]:
+        """include_paths 아래의 .md 파일 경로 (exclude 하위 트리는 진입하지 않음)"""
+        return walk_markdown(
+            self.vault_root,
+            self.config.include_paths,
+            self.config.exclude_paths,
+            stats=self.walk_stats,
+        )
+
+    def scan_file(self, filepath: Path, cache: Optional[FrontmatterCache] = None) -> VaultFile:
+        """단일 파일 frontmatter 헤더 읽기 + 파싱 (cache hit이면 읽기/파싱 생략)"""
+        detector = MtimeChangeDetector() if cache is not None else None
+        vf, key, entry = self._lookup(filepath, cache, detector)
+        if vf.read_error is None and entry is None:
+            self._apply(vf, load_entry(filepath), cache, detector, key)
+        return vf
+
+    def _lookup(
+        self,
+        filepath: Path,
+        cache: Optional[FrontmatterCache],
+        detector: Optional[ChangeDetector],
+    ):
+        """변경 감지 키 계산 + 캐시 조회. hit이면 VaultFile에 바로 반영"""
+        relative = str(filepath.relative_to(self.vault_root))
+        vf = VaultFile(filepath=filepath, relative_path=relative)
+        if cache is None or detector is None:
+            return vf, None, None
+        try:
+            key = detector.fingerprint(vf)
+        except OSError as e:
+            vf.read_error = str(e)
+            return vf, None, None
+
+        entry = detector.get(cache, vf, key)
+        if entry is not None:
+            self._apply(vf, entry)
+        return vf, key, entry
+
+    @staticmethod
+    def _apply(
+        vf: VaultFile,
+        entry: Dict[str, Any],
+        cache: Optional[FrontmatterCache] = None,
+        detector: Optional[ChangeDetector] = None,
+        key: Any = None,
+    ) -> None:
+        """파싱 결과 반영 (cache가 주어지면 저장)"""
+        if "read_error" in entry:
+            vf.read_error = entry["read_error"]
+            return
+        vf.frontmatter = entry["frontmatter"]
+        vf.parse_error = entry["parse_error"]
+        vf.body_offset = entry["body_offset"]
+        if cache is not None and detector is not None:
+            detector.put(cache, vf, key, entry)
+
+    def _load_pending(self, filepaths: List[Path]) -> List[Dict[str, Any]]:
+        """캐시 miss 파일 파싱 (jobs > 1이면 프로세스 풀, 입력 순서 유지)"""
+        if self.jobs <= 1 or len(filepaths) < MIN_PARALLEL_FILES:
+            return [load_entry(p) for p in filepaths]
+
+        paths = [str(p) for p in filepaths]
+        chunk_size = max(1, -(-len(paths) // (self.jobs * PARALLEL_CHUNKS_PER_WORKER)))
+        chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            # map()은 제출 순서대로 결과를 반환 → 경로 순서 결정적
+            return [entry for batch in executor.map(_load_entries, chunks) for entry in batch]
+
+    def scan(self) -> EntityCollection:
+        """Vault 전체 스캔"""
+        cache = open_cache(self.vault_root) if self.use_cache else None
+        detector = None
+        try:
+            if cache is not None:
+                detector = prepare_change_detector(
+                    self.change_detection, self.vault_root, self.config.include_paths
+                )
+            files = []
+            pending = []
+            keys = []
+            for filepath in sorted(self.iter_paths()):
+                vf, key, entry = self._lookup(filepath, cache, detector)
+                files.append(vf)
+                if key is not None:
+                    keys.append(key)
+                if vf.read_error is None and entry is None:
+                    pending.append((vf, key))
+
+            entries = self._load_pending([vf.filepath for vf, _ in pending])
+            for (vf, key), entry in zip(pending, entries):
+                self._apply(vf, entry, cache, detector, key)
+
+            if cache is not None:
+                detector.prune(cache, self.config.include_paths, files, keys)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        collection = EntityCollection(self.vault_root, files, self.config)
+        collection.cache_stats = cache.stats if cache is not None else None
+        return collection
+
+
+def scan_vault(vault_root: Union[str, Path], **kwargs) -> EntityCollection:
+    """VaultScanner(vault_root, **kwargs).scan() 단축 함수"""
+    return VaultScanner(vault_root, **kwargs).scan()
@@ -0,0 +1,345 @@
+"""
+Entity Snapshot
+
+build_graph_index.py가 _build/entities.snap에 쓰는 바이너리 엔티티 스냅샷.
+소비자(API 캐시, 대시보드 등)는 graph.json 전체를 JSON 파싱하거나 vault를 다시
+스캔하지 않고, mmap 1회 + 문자열 테이블 디코드만으로 Entity를 복원합니다.
+
+Format (little-endian, 모든 배열은 4-byte 정렬):
+    header   magic "LOOPSNAP", version u16, flags u16,
+             entity_count u32, string_count u32, strings_size u32, pool_count u32,
+             generated u32 (string ref), body_size u64, body_crc32 u32
+    body     string blob (UTF-8, 중복 제거, NUL 구분) + padding
+             scalar refs u32 × entity_count × len(SCALAR_FIELDS)
+             list meta   u32 × entity_count × (1 + 2 × len(LIST_FIELDS))  (flags, (pool start, count)...)
+             list pool   u32 × pool_count  (string ref)
+
+string ref 0은 None, n은 n-1번째 문자열입니다. 로더는 blob을 한 번에 decode/split하고
+ref 배열을 map()으로 일괄 변환하므로 Python 레벨 루프는 엔티티당 1회입니다.
+값은 문자열로 정규화됩니다 (date → ISO 문자열). 리스트가 아닌 relation 값은 빈 tuple로 복원됩니다.
+entity_signature()는 live Entity를 같은 규칙으로 정규화하므로 스냅샷 Entity와 바로 비교할 수 있습니다.
+
+Usage:
+    from shared.vault.snapshot import load_snapshot, write_snapshot
+
+    write_snapshot(vault_root / "_build" / "entities.snap", entities)
+    snapshot = load_snapshot(vault_root / "_build" / "entities.snap")
+    snapshot.entities["prj-abc123"].status
+"""
+
+import gc
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..utils.artifact import write_bytes_if_changed
+from .entity import Entity
+
+SNAPSHOT_FILENAME = "entities.snap"
+SNAPSHOT_MAGIC = b"LOOPSNAP"
+# 레코드 레이아웃이 바뀌면 올림 (이전 버전 파일은 SnapshotError)
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<8sHHIIIIIQI")
+
+SCALAR_FIELDS = (
+    "id", "type", "name", "status", "relative_path", "parent_id", "project_id",
+    "hypothesis_id", "owner", "priority_flag", "created", "updated", "due",
+)
+LIST_FIELDS = ("assignee", "conditions_3y", "validates", "validated_by", "outgoing_relations")
+META_WIDTH = 1 + 2 * len(LIST_FIELDS)
+
+FLAG_ASSIGNEE_LIST = 0x1  # assignee가 리스트였음 (아니면 단일 문자열)
+FLAG_CONDITIONS_SCALAR = 0x2  # conditions_3y가 리스트가 아닌 단일 값이었음
+
+
+class SnapshotError(Exception):
+    """스냅샷 파일 오류 (magic/version/checksum 불일치, 손상)"""
+
+
+def _to_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value if isinstance(value, str) else str(value)
+
+
+class _StringTable:
+    """문자열 중복 제거 (ref 0 = None)"""
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, value: Any) -> int:
+        text = _to_text(value)
+        if text is None:
+            return 0
+        ref = self.index.get(text)
+        if ref is None:
+            if "\0" in text:
+                raise SnapshotError(f"NUL character in value: {text[:40]!r}")
+            self.strings.append(text)
+            ref = len(self.strings)
+            self.index[text] = ref
+        return ref
+
+
+def _u32_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _text_items(value: Any) -> tuple:
+    return tuple(map(_to_text, value)) if isinstance(value, tuple) else ()
+
+
+def _normalize_assignee(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_to_text, value))
+    return _to_text(value)
+
+
+def _normalize_conditions(value: Any) -> Any:
+    if value is None or isinstance(value, tuple):
+        return _text_items(value)
+    return _to_text(value)
+
+
+def _normalize_relations(value: Any) -> tuple:
+    if not isinstance(value, tuple):
+        return ()
+    return tuple((_to_text(rel_type), _to_text(target_id)) for rel_type, target_id in value)
+
+
+def entity_signature(entity: Entity) -> tuple:
+    """스냅샷에 저장되는 형태로 정규화한 필드 값
+
+    live Entity와 load_snapshot()으로 읽은 Entity의 signature가 같으면 스냅샷 기준으로 변경 없음.
+    """
+    return (
+        tuple(_to_text(getattr(entity, field)) for field in SCALAR_FIELDS),
+        _normalize_assignee(entity.assignee),
+        _normalize_conditions(entity.conditions_3y),
+        _text_items(entity.validates),
+        _text_items(entity.validated_by),
+        _normalize_relations(entity.outgoing_relations),
+    )
+
+
+def encode_snapshot(entities: Dict[str, Entity], generated: str = "") -> bytes:
+    """Entity dict → 스냅샷 bytes (entity 순서 유지)
+
+    Raises:
+        SnapshotError: NUL 문자가 포함된 값
+    """
+    table = _StringTable()
+    generated_ref = table.add(generated)
+    scalars = array("I")
+    meta = array("I")
+    pool = array("I")
+
+    def add_list(items) -> None:
+        meta.append(len(pool))
+        meta.append(len(items))
+        pool.extend(table.add(item) for item in items)
+
+    for entity_id, entity in entities.items():
+        scalars.append(table.add(entity_id))
+        for field in SCALAR_FIELDS[1:]:
+            scalars.append(table.add(getattr(entity, field)))
+
+        flags = 0
+        assignee = entity.assignee
+        if isinstance(assignee, (list, tuple)):
+            flags |= FLAG_ASSIGNEE_LIST
+        conditions = entity.conditions_3y
+        if conditions is not None and not isinstance(conditions, tuple):
+            flags |= FLAG_CONDITIONS_SCALAR
+        meta.append(flags)
+
+        if flags & FLAG_ASSIGNEE_LIST:
+            add_list(assignee)
+        else:
+            add_list(() if assignee is None else (assignee,))
+        add_list((conditions,) if flags & FLAG_CONDITIONS_SCALAR else _text_items(conditions))
+        add_list(_text_items(entity.validates))
+        add_list(_text_items(entity.validated_by))
+        add_list([value for relation in _normalize_relations(entity.outgoing_relations) for value in relation])
+
+    blob = "\0".join(table.strings).encode("utf-8")
+    body = b"".join([
+        blob + b"\0" * (-len(blob) % 4),
+        _u32_bytes(scalars),
+        _u32_bytes(meta),
+        _u32_bytes(pool),
+    ])
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+        len(entities), len(table.strings), len(blob), len(pool), generated_ref,
+        len(body), zlib.crc32(body),
+    )
+    return header + body
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    entities: Dict[str, Entity],
+    generated: str = "",
+) -> Tuple[bool, int]:
+    """스냅샷 저장 (임시 파일 → rename, 내용이 같으면 쓰지 않음)
+
+    Returns:
+        (실제로 썼는지, 파일 크기 bytes)
+    """
+    data = encode_snapshot(entities, generated)
+    return write_bytes_if_changed(path, data), len(data)
+
+
+class EntitySnapshot:
+    """로드된 스냅샷"""
+
+    def __init__(self, entities: Dict[str, Entity], generated: str, version: int, size: int):
+        self.entities = entities
+        self.generated = generated
+        self.version = version
+        self.size = size
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self.entities.values())
+
+    def get(self, entity_id: str) -> Optional[Entity]:
+        return self.entities.get(entity_id)
+
+
+def _u32_list(buf, offset: int, count: int) -> List[int]:
+    values = array("I")
+    values.frombytes(buf[offset:offset + 4 * count])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def decode_snapshot(buf, root: Optional[Path] = None, verify: bool = True) -> EntitySnapshot:
+    """스냅샷 bytes(또는 mmap) → EntitySnapshot
+
+    Raises:
+        SnapshotError: magic/version/크기/checksum 불일치
+    """
+    if len(buf) < _HEADER.size:
+        raise SnapshotError("snapshot too small")
+    (magic, version, _flags, entity_count, string_count, strings_size, pool_count,
+     generated_ref, body_size, body_crc) = _HEADER.unpack_from(buf, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("not an entity snapshot (bad magic)")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+    pos = _HEADER.size
+    if len(buf) != pos + body_size:
+        raise SnapshotError("snapshot size mismatch (truncated?)")
+    if verify and zlib.crc32(buf[pos:]) != body_crc:
+        raise SnapshotError("snapshot checksum mismatch")
+
+    strings: List[Optional[str]] = [None]
+    if string_count:
+        strings.extend(map(sys.intern, buf[pos:pos + strings_size].decode("utf-8").split("\0")))
+    if len(strings) != string_count + 1:
+        raise SnapshotError("string table mismatch")
+    pos += strings_size + (-strings_size % 4)
+
+    n_scalar = len(SCALAR_FIELDS)
+    lookup = strings.__getitem__
+    scalars = list(map(lookup, _u32_list(buf, pos, entity_count * n_scalar)))
+    pos += 4 * entity_count * n_scalar
+    meta = _u32_list(buf, pos, entity_count * META_WIDTH)
+    pos += 4 * entity_count * META_WIDTH
+    # tuple slice는 그대로 tuple (빈 slice는 () singleton)
+    pool = tuple(map(lookup, _u32_list(buf, pos, pool_count)))
+
+    new_entity = Entity.__new__
+    entities: Dict[str, Entity] = {}
+    # 수천 개 객체 생성 중 cyclic GC가 반복 실행되지 않도록 잠시 끔
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for e in range(entity_count):
+            (entity_id, entity_type, name, status, relative_path, parent_id, project_id,
+             hypothesis_id, owner, priority_flag, created, updated, due) = scalars[e * n_scalar:(e + 1) * n_scalar]
+            (flags, a_start, a_count, c_start, c_count, v_start, v_count,
+             vb_start, vb_count, r_start, r_count) = meta[e * META_WIDTH:(e + 1) * META_WIDTH]
+
+            entity = new_entity(Entity)
+            entity.id = entity_id
+            entity.type = entity_type
+            entity.name = name
+            entity.status = status
+            entity.relative_path = relative_path
+            entity.parent_id = parent_id
+            entity.project_id = project_id
+            entity.hypothesis_id = hypothesis_id
+            entity.owner = owner
+            entity.priority_flag = priority_flag
+            entity.created = created
+            entity.updated = updated
+            entity.due = due
+            if flags & FLAG_ASSIGNEE_LIST:
+                entity.assignee = pool[a_start:a_start + a_count]
+            else:
+                entity.assignee = pool[a_start] if a_count else None
+            if flags & FLAG_CONDITIONS_SCALAR:
+                entity.conditions_3y = pool[c_start]
+            else:
+                entity.conditions_3y = pool[c_start:c_start + c_count]
+            entity.validates = pool[v_start:v_start + v_count]
+            entity.validated_by = pool[vb_start:vb_start + vb_count]
+            if r_count:
+                relations = pool[r_start:r_start + r_count]
+                entity.outgoing_relations = tuple(zip(relations[0::2], relations[1::2]))
+            else:
+                entity.outgoing_relations = ()
+            entity._root = root
+            entity._frontmatter = None
+            entities[entity_id] = entity
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return EntitySnapshot(entities, strings[generated_ref] or "", version, len(buf))
+
+
+def load_snapshot(
+    path: Union[str, Path],
+    root: Optional[Path] = None,
+    verify: bool = True,
+) -> EntitySnapshot:
+    """스냅샷 파일 로드 (mmap 1회)
+
+    Args:
+        path: _build/entities.snap 경로
+        root: Entity.filepath 기준 vault 루트 (기본: path의 상위 상위 디렉토리)
+        verify: CRC32 검증 여부
+
+    Raises:
+        OSError: 파일 없음/읽기 실패
+        SnapshotError: 포맷 오류
+    """
+    path = Path(path)
+    if root is None:
+        root = path.resolve().parent.parent
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SnapshotError("empty snapshot")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode_snapshot(mm, root, verify)
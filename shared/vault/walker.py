@@ -0,0 +1,142 @@
+"""
+Vault Walker
+
+os.scandir 기반 .md 파일 순회. rglob("*.md")는 .git, _build, dashboard-v2 등
+vault 전체를 순회한 뒤 include prefix로 거르지만, walker는 paths.include /
+paths.exclude로 하위 트리를 들어가기 전에 잘라냅니다.
+
+- include 경로의 조상 디렉토리 또는 include 내부만 진입
+- exclude prefix에 해당하는 디렉토리/파일은 진입/반환하지 않음
+- 디렉토리 판별은 DirEntry의 d_type을 사용 (버릴 파일은 stat 호출 없음)
+- 심볼릭 링크 디렉토리는 따라가지 않음 (기존 rglob과 동일, 링크 순환 방지)
+
+Prefix 매칭은 기존 스크립트와 동일한 문자열 startswith 규칙입니다.
+
+Usage:
+    from shared.vault.walker import walk_markdown
+
+    for filepath in walk_markdown(vault_root, ["50_Projects"], ["90_Archive"]):
+        ...
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+MARKDOWN_SUFFIX = ".md"
+
+
+@dataclass
+class WalkStats:
+    """순회 통계 (syscall 비교용)"""
+    dirs_scanned: int = 0
+    dirs_pruned: int = 0
+    files_yielded: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.dirs_scanned} dirs scanned, {self.dirs_pruned} pruned, "
+            f"{self.files_yielded} files"
+        )
+
+
+def _startswith_any(relative: str, prefixes: Sequence[str]) -> bool:
+    return any(relative.startswith(p) for p in prefixes)
+
+
+def is_markdown_target(relative: str, include: Sequence[str], exclude: Sequence[str] = ()) -> bool:
+    """walk_markdown()이 반환할 경로인지 (.md, include 내부, exclude 아님)"""
+    return (
+        relative.endswith(MARKDOWN_SUFFIX)
+        and _startswith_any(relative, include)
+        and not _startswith_any(relative, exclude)
+    )
+
+
+def _should_enter(relative_dir: str, include: Sequence[str], exclude: Sequence[str]) -> bool:
+    """디렉토리 진입 여부 (include 내부 또는 include의 조상, exclude 아님)"""
+    if _startswith_any(relative_dir, exclude):
+        return False
+    if _startswith_any(relative_dir, include):
+        return True
+    # 중첩 include (예: "50_Projects/2026")의 조상 디렉토리 ("50_Projects")
+    return any(p.startswith(relative_dir + "/") for p in include)
+
+
+def walk_markdown(
+    vault_root: Union[str, Path],
+    include_paths: Sequence[str],
+    exclude_paths: Sequence[str] = (),
+    stats: Optional[WalkStats] = None,
+) -> Iterator[Path]:
+    """include_paths 아래 .md 파일 경로 (exclude 하위 트리는 진입하지 않음)
+
+    Args:
+        vault_root: Vault 루트
+        include_paths: 포함 prefix (vault 루트 기준 상대 경로)
+        exclude_paths: 제외 prefix
+        stats: 전달하면 순회 통계를 누적
+
+    Returns:
+        .md 파일 경로 iterator (순서는 파일시스템 순서, 호출 측에서 정렬)
+    """
+    root = Path(vault_root)
+    include = [p.rstrip("/") for p in include_paths]
+    exclude = [p.rstrip("/") for p in exclude_paths]
+    if stats is None:
+        stats = WalkStats()
+
+    stack = [("", str(root))]
+    while stack:
+        relative_dir, abs_dir = stack.pop()
+        try:
+            it = os.scandir(abs_dir)
+        except OSError:
+            continue
+        stats.dirs_scanned += 1
+        with it:
+            for entry in it:
+                relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if _should_enter(relative, include, exclude):
+                        stack.append((relative, entry.path))
+                    else:
+                        stats.dirs_pruned += 1
+                    continue
+                if is_markdown_target(relative, include, exclude):
+                    stats.files_yielded += 1
+                    yield Path(entry.path)
+
+
+def walk_dirs(
+    vault_root: Union[str, Path],
+    include_paths: Sequence[str],
+    exclude_paths: Sequence[str] = (),
+) -> Iterator[str]:
+    """walk_markdown()이 진입하는 디렉토리의 상대 경로 (루트는 "")
+
+    파일 감시(vault_watchd)에서 watch 대상 디렉토리 목록으로 사용합니다.
+    """
+    include = [p.rstrip("/") for p in include_paths]
+    exclude = [p.rstrip("/") for p in exclude_paths]
+
+    stack = [("", str(Path(vault_root)))]
+    while stack:
+        relative_dir, abs_dir = stack.pop()
+        yield relative_dir
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False) and _should_enter(relative, include, exclude):
+                            stack.append((relative, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue